@@ -1,48 +1,240 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+
 import httpx
 
-from clients.notion_client import NotionClient
+from clients.notion_client import NotionClient, NotionQueryBatch
+from config import Settings
+
+logger = logging.getLogger(__name__)
 
 NOTION_API_VERSION = "2022-06-28"
 NOTION_BASE_URL = "https://api.notion.com/v1"
 
+# 재시도 대상: rate limit + 일시적인 서버 오류
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class NotionRequestStats:
+    """Notion 호출 카운터 (클라이언트 수명 동안 누적)."""
+
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    wait_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷. 429 수신 시 pause()로 전체 요청을 멈춘다."""
+
+    def __init__(self, rate: float, capacity: int, clock=time.monotonic, sleep=asyncio.sleep):
+        self._rate = rate
+        self._capacity = max(1, capacity)
+        self._tokens = float(self._capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    async def acquire(self) -> float:
+        """토큰 1개를 소비한다. 대기한 시간(초)을 반환."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens = min(
+                        self._capacity, self._tokens + (now - self._updated_at) * self._rate,
+                    )
+                    self._updated_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self._rate
+                await self._sleep(delay)
+                waited += delay
+
+
+def _parse_retry_after(resp: httpx.Response) -> float | None:
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
 
 class NotionClientImpl(NotionClient):
-    """httpx 기반 비동기 Notion API 클라이언트"""
+    """httpx 기반 비동기 Notion API 클라이언트.
+
+    하나의 AsyncClient(커넥션 풀)를 수명 동안 재사용한다.
+    앱 lifespan에서 생성하고 종료 시 aclose()로 정리할 것.
+
+    모든 요청은 토큰 버킷으로 Notion rate limit에 맞춰 보내고,
+    429(Retry-After 준수)/5xx/네트워크 오류는 지수 백오프(jitter)로 재시도한다.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        http2: bool = False,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 30.0,
+        rate_limit_per_sec: float = 3.0,
+        rate_limit_burst: int = 3,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self._client = httpx.AsyncClient(
+            base_url=NOTION_BASE_URL,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Notion-Version": NOTION_API_VERSION,
+            },
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            transport=transport,
+        )
+        self._bucket = _TokenBucket(rate_limit_per_sec, rate_limit_burst)
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self.stats = NotionRequestStats()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "NotionClientImpl":
+        return cls(
+            token=settings.NOTION_TOKEN,
+            http2=settings.NOTION_HTTP2,
+            max_connections=settings.NOTION_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.NOTION_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.NOTION_KEEPALIVE_EXPIRY,
+            connect_timeout=settings.NOTION_CONNECT_TIMEOUT,
+            read_timeout=settings.NOTION_READ_TIMEOUT,
+            rate_limit_per_sec=settings.NOTION_RATE_LIMIT_PER_SEC,
+            rate_limit_burst=settings.NOTION_RATE_LIMIT_BURST,
+            max_retries=settings.NOTION_MAX_RETRIES,
+            backoff_base=settings.NOTION_BACKOFF_BASE,
+            backoff_max=settings.NOTION_BACKOFF_MAX,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "NotionClientImpl":
+        return self
 
-    def __init__(self, token: str):
-        self._headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Notion-Version": NOTION_API_VERSION,
-        }
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ min(max, base * 2^attempt)
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * (2 ** attempt)))
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        attempt = 0
+        while True:
+            self.stats.wait_seconds += await self._bucket.acquire()
+            self.stats.requests += 1
+            try:
+                resp = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self._max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning("Notion %s %s 네트워크 오류(%s), %.1fs 후 재시도", method, url, e, delay)
+            else:
+                if resp.status_code not in RETRYABLE_STATUS_CODES or attempt >= self._max_retries:
+                    resp.raise_for_status()
+                    return resp
+                if resp.status_code == 429:
+                    self.stats.throttled += 1
+                    retry_after = _parse_retry_after(resp)
+                    delay = retry_after if retry_after is not None else self._backoff(attempt)
+                    # 버킷을 멈춰 동시에 나가는 다른 요청도 함께 대기시킨다
+                    self._bucket.pause(delay)
+                    logger.warning("Notion rate limit(429), %.1fs 대기", delay)
+                    delay = 0.0
+                else:
+                    delay = self._backoff(attempt)
+                    logger.warning(
+                        "Notion %s %s → %d, %.1fs 후 재시도", method, url, resp.status_code, delay,
+                    )
+            attempt += 1
+            self.stats.retries += 1
+            if delay:
+                self.stats.wait_seconds += delay
+                await asyncio.sleep(delay)
 
     async def query_database(self, database_id: str, filters: dict | None = None) -> list[dict]:
-        url = f"{NOTION_BASE_URL}/databases/{database_id}/query"
         all_results = []
+        async for batch in self.iter_database(database_id, filters):
+            all_results.extend(batch.results)
+        return all_results
+
+    async def iter_database(
+        self, database_id: str, filters: dict | None = None, start_cursor: str | None = None,
+    ) -> AsyncIterator[NotionQueryBatch]:
+        url = f"/databases/{database_id}/query"
         has_more = True
-        start_cursor = None
 
-        async with httpx.AsyncClient(headers=self._headers, timeout=30.0) as client:
-            while has_more:
-                body: dict = {}
-                if filters:
-                    body["filter"] = filters
-                if start_cursor:
-                    body["start_cursor"] = start_cursor
+        while has_more:
+            body: dict = {}
+            if filters:
+                body["filter"] = filters
+            if start_cursor:
+                body["start_cursor"] = start_cursor
 
-                resp = await client.post(url, json=body)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self._request("POST", url, json=body)
+            data = resp.json()
 
-                all_results.extend(data.get("results", []))
-                has_more = data.get("has_more", False)
-                start_cursor = data.get("next_cursor")
+            has_more = data.get("has_more", False)
+            start_cursor = data.get("next_cursor") if has_more else None
+            yield NotionQueryBatch(results=data.get("results", []), next_cursor=start_cursor)
 
-        return all_results
+    async def retrieve_database(self, database_id: str) -> dict:
+        resp = await self._request("GET", f"/databases/{database_id}")
+        return resp.json()
+
+    async def get_relation_ids(self, page_id: str, property_id: str) -> list[str]:
+        url = f"/pages/{page_id}/properties/{property_id}"
+        ids: list[str] = []
+        params: dict = {}
+        while True:
+            resp = await self._request("GET", url, params=params)
+            data = resp.json()
+            ids.extend(item["relation"]["id"] for item in data.get("results", []) if item.get("relation"))
+            if not data.get("has_more"):
+                return ids
+            params = {"start_cursor": data["next_cursor"]}
 
     async def get_page(self, page_id: str) -> dict:
-        url = f"{NOTION_BASE_URL}/pages/{page_id}"
-        async with httpx.AsyncClient(headers=self._headers, timeout=30.0) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._request("GET", f"/pages/{page_id}")
+        return resp.json()
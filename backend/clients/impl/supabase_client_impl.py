@@ -1,13 +1,149 @@
-from supabase import create_client, Client
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+import httpx
+from supabase import Client, ClientOptions, create_client
 
 from clients.supabase_client import SupabaseClient
+from config import Settings
+
+
+@dataclass
+class SupabasePoolStats:
+    """Supabase HTTP 호출 카운터 (클라이언트 수명 동안 누적)."""
+
+    requests: int = 0
+    errors: int = 0
+    # 응답 헤더를 받을 때까지 걸린 시간 합계
+    request_seconds: float = 0.0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _InstrumentedTransport(httpx.BaseTransport):
+    """실제 transport(커넥션 풀)를 감싸 요청 수/동시 요청 수를 센다."""
+
+    def __init__(self, inner: httpx.BaseTransport, stats: SupabasePoolStats):
+        self._inner = inner
+        self._stats = stats
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self._stats.in_flight += 1
+            self._stats.peak_in_flight = max(self._stats.peak_in_flight, self._stats.in_flight)
+        started = time.perf_counter()
+        failed = False
+        try:
+            return self._inner.handle_request(request)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._stats.in_flight -= 1
+                self._stats.requests += 1
+                self._stats.errors += failed
+                self._stats.request_seconds += time.perf_counter() - started
+
+    def close(self) -> None:
+        self._inner.close()
+
+    def pool_status(self) -> dict:
+        """현재 열린/유휴 커넥션 수.
+
+        httpx 공개 API에는 풀 상태가 없어 내부(_pool)를 읽는다. 다른 transport이거나
+        httpx 업그레이드로 구조가 바뀌면 None을 돌려준다 (요청 카운터는 영향 없음).
+        """
+        connections = getattr(getattr(self._inner, "_pool", None), "connections", None)
+        if connections is None:
+            return {"connections": None, "idle": None}
+        connections = list(connections)
+        try:
+            idle = sum(1 for c in connections if c.is_idle())
+        except AttributeError:
+            idle = None
+        return {"connections": len(connections), "idle": idle}
 
 
 class SupabaseClientImpl(SupabaseClient):
-    """supabase-py 기반 Supabase 클라이언트"""
+    """supabase-py 기반 Supabase 클라이언트.
+
+    프로세스당 하나만 만들어(앱 lifespan) 모든 저장소가 공유한다.
+    HTTP 커넥션 풀은 직접 만든 httpx.Client 하나를 쓰고, 종료 시 close()로 정리할 것.
+    supabase-py 클라이언트는 첫 쿼리 때 만든다 (키 검증 포함).
+
+    supabase-py 쿼리는 동기 호출이라 execute()가 전용 스레드 풀에서 돌린다.
+    스레드 수는 max_connections와 같게 둬서 커넥션보다 많은 요청이 풀 대기로 쌓이지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        *,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self._url = url
+        self._key = key
+        self.stats = SupabasePoolStats()
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+        self._transport = _InstrumentedTransport(transport, self.stats)
+        self._http = httpx.Client(
+            transport=self._transport, timeout=httpx.Timeout(timeout), follow_redirects=True,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="supabase")
+        self._client: Client | None = None
+        self._client_lock = threading.Lock()
 
-    def __init__(self, url: str, key: str):
-        self._client: Client = create_client(url, key)
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SupabaseClientImpl":
+        return cls(
+            url=settings.SUPABASE_URL,
+            key=settings.SUPABASE_KEY,
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.SUPABASE_KEEPALIVE_EXPIRY,
+            timeout=settings.SUPABASE_TIMEOUT,
+        )
 
     def table(self, table_name: str):
-        return self._client.table(table_name)
+        return self._supabase().table(table_name)
+
+    async def execute(self, query):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, query.execute)
+
+    def pool_metrics(self) -> dict:
+        """누적 호출 카운터 + 현재 커넥션 풀 상태."""
+        return {**self.stats.as_dict(), **self._transport.pool_status()}
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._http.close()
+
+    def _supabase(self) -> Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_client(
+                        self._url, self._key, options=ClientOptions(httpx_client=self._http),
+                    )
+        return self._client
@@ -1,4 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class NotionQueryBatch:
+    """DB 쿼리 응답 한 페이지 (최대 100건)."""
+
+    results: list[dict]
+    next_cursor: str | None = None  # None이면 마지막 배치
 
 
 class NotionClient(ABC):
@@ -9,6 +19,26 @@ class NotionClient(ABC):
         """Notion DB 쿼리"""
         ...
 
+    @abstractmethod
+    def iter_database(
+        self, database_id: str, filters: dict | None = None, start_cursor: str | None = None,
+    ) -> AsyncIterator[NotionQueryBatch]:
+        """Notion DB 쿼리 — 응답 페이지가 도착할 때마다 배치 단위로 yield
+
+        start_cursor를 주면 이전 배치의 next_cursor부터 이어서 조회 (같은 filters로만 유효).
+        """
+        ...
+
+    @abstractmethod
+    async def retrieve_database(self, database_id: str) -> dict:
+        """Notion DB 스키마(속성 이름/타입) 조회"""
+        ...
+
+    @abstractmethod
+    async def get_relation_ids(self, page_id: str, property_id: str) -> list[str]:
+        """relation 속성의 전체 id 목록 (페이지 조회 응답은 25개까지만 담김)"""
+        ...
+
     @abstractmethod
     async def get_page(self, page_id: str) -> dict:
         """Notion 페이지 속성 조회"""
@@ -0,0 +1,406 @@
+"""Notion DB 스키마 기반 페이지 파서.
+
+DB 스키마(retrieve database)를 한 번 읽어 필드마다 실제 속성 키와 추출 함수를 확정해 두고,
+페이지마다 고정된 직접 조회만 수행한다. 필수 속성이 없거나 타입이 다르면
+컴파일 시점에 NotionSchemaError를 낸다 (빈 값으로 조용히 동기화되는 것을 방지).
+
+CompiledParser는 모듈 수준 함수 이름만 들고 있는 frozen dataclass라 pickle 가능하다.
+
+파싱 결과는 dict 대신 __slots__ 레코드(TutorRecord/LectureRecord/ScheduleRecord)다.
+키 문자열을 레코드마다 들고 있지 않고, 반복되는 상태/장소/담당자 문자열과
+relation id는 intern해 같은 객체를 공유한다. DB에 쓸 때만 as_row()로 dict를 만든다.
+"""
+
+import sys
+from dataclasses import dataclass
+
+from exceptions import NotionSchemaError
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """파싱할 필드 1개. candidates 중 스키마에 먼저 존재하는 속성을 사용한다."""
+
+    name: str
+    kind: str
+    candidates: tuple[str, ...]
+    required: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class TutorRecord:
+    notion_page_id: str
+    name: str
+    email: str | None
+    phone: str | None
+    specialty: str | None
+    is_active: bool = True
+
+    def as_row(self) -> dict:
+        return {
+            "notion_page_id": self.notion_page_id,
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "specialty": self.specialty,
+            "is_active": self.is_active,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class LectureRecord:
+    notion_page_id: str
+    title: str
+    status: str
+    target: str | None
+    lecture_start: str | None
+    lecture_end: str | None
+    students: int | float | None
+    workbook_full_url: str | None
+    manager: str | None
+    manager_email: str | None
+    sales_rep: str | None
+    sales_rep_email: str | None
+    # 일정 페이지 id (courses 컬럼이 아니므로 as_row()에는 없음)
+    schedule_ids: tuple[str, ...] = ()
+
+    def as_row(self) -> dict:
+        return {
+            "notion_page_id": self.notion_page_id,
+            "title": self.title,
+            "status": self.status,
+            "target": self.target,
+            "lecture_start": self.lecture_start,
+            "lecture_end": self.lecture_end,
+            "students": self.students,
+            "workbook_full_url": self.workbook_full_url,
+            "manager": self.manager,
+            "manager_email": self.manager_email,
+            "sales_rep": self.sales_rep,
+            "sales_rep_email": self.sales_rep_email,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleRecord:
+    notion_page_id: str
+    name: str
+    date: str
+    place: str
+    start_time: int | float | None
+    end_time: int | float | None
+    main_tutor_ids: tuple[str, ...]
+    tech_tutor_ids: tuple[str, ...]
+    lecture_dashboard_ids: tuple[str, ...]
+    day_number: int = 1
+
+
+NotionRecord = TutorRecord | LectureRecord | ScheduleRecord
+
+
+@dataclass(frozen=True)
+class CompiledParser:
+    database: str
+    # (필드 이름, 속성 키, 추출 함수 이름) — 속성이 없으면 키는 None
+    fields: tuple[tuple[str, str | None, str], ...]
+    builder: str
+
+    def __call__(self, page: dict) -> NotionRecord:
+        props = page.get("properties", {})
+        values = {
+            name: _EXTRACTORS[extractor](props.get(key) if key else None)
+            for name, key, extractor in self.fields
+        }
+        return _BUILDERS[self.builder](page["id"], values)
+
+    def parse_many(self, pages: list[dict]) -> list[NotionRecord]:
+        return [self(page) for page in pages]
+
+    def key_for(self, field: str) -> str | None:
+        """필드가 실제로 읽는 속성 키 (스키마에 없으면 None)."""
+        for name, key, _ in self.fields:
+            if name == field:
+                return key
+        return None
+
+    def extractor_for(self, field: str) -> str | None:
+        """필드의 추출 함수 이름. select/status처럼 Notion 속성 타입과 같은 이름이라 쿼리 필터에 쓸 수 있다."""
+        for name, key, extractor in self.fields:
+            if name == field:
+                return extractor if key else None
+        return None
+
+
+def compile_parser(database: str, schema: dict) -> CompiledParser:
+    """retrieve database 응답(schema)으로 database("tutor"/"lecture"/"schedule") 파서를 만든다."""
+    spec, builder = _SPECS[database]
+    properties = schema.get("properties", {})
+    fields = []
+    for field in spec:
+        resolved = _resolve(field, properties)
+        if resolved is None:
+            if field.required:
+                raise NotionSchemaError(
+                    f"Notion {database} DB에 '{field.name}' 속성({' / '.join(field.candidates)}, "
+                    f"{field.kind} 타입)이 없습니다. 속성 이름이 바뀌었는지 확인하세요."
+                )
+            fields.append((field.name, None, _MISSING[field.kind]))
+        else:
+            fields.append((field.name, *resolved))
+    return CompiledParser(database=database, fields=tuple(fields), builder=builder)
+
+
+def _resolve(field: FieldSpec, properties: dict) -> tuple[str, str] | None:
+    accepted = _KIND_EXTRACTORS[field.kind]
+    for key in field.candidates:
+        prop_type = (properties.get(key) or {}).get("type")
+        if prop_type in accepted:
+            return key, accepted[prop_type]
+    return None
+
+
+# ── 속성 값 추출 (prop: 페이지의 속성 값 dict, 없으면 None) ──
+
+
+def _plain_text(items: list[dict] | None) -> str:
+    return "".join(t.get("plain_text", "") for t in items or ())
+
+
+def _title(prop: dict | None) -> str:
+    return _plain_text(prop.get("title")) if prop else ""
+
+
+def _rich_text(prop: dict | None) -> str:
+    return _plain_text(prop.get("rich_text")) if prop else ""
+
+
+def _email(prop: dict | None) -> str:
+    return (prop.get("email") or "") if prop else ""
+
+
+def _phone(prop: dict | None) -> str:
+    return (prop.get("phone_number") or "") if prop else ""
+
+
+def _select(prop: dict | None) -> str:
+    return ((prop.get("select") or {}).get("name") or "") if prop else ""
+
+
+def _status(prop: dict | None) -> str:
+    return ((prop.get("status") or {}).get("name") or "") if prop else ""
+
+
+def _number(prop: dict | None) -> int | float | None:
+    return prop.get("number") if prop else None
+
+
+def _date_start(prop: dict | None) -> str:
+    return ((prop.get("date") or {}).get("start") or "") if prop else ""
+
+
+def _relation_ids(prop: dict | None) -> list[str]:
+    if not prop:
+        return []
+    return [r["id"] for r in prop.get("relation", ()) if r.get("id")]
+
+
+def _people(prop: dict | None) -> list[dict]:
+    if not prop:
+        return []
+    return [
+        {"name": p["name"], "email": (p.get("person") or {}).get("email", "")}
+        for p in prop.get("people", ())
+        if p.get("name")
+    ]
+
+
+def _rollup_texts(prop: dict | None) -> list[str]:
+    if not prop:
+        return []
+    texts = []
+    for item in prop.get("rollup", {}).get("array", ()):
+        item_type = item.get("type")
+        if item_type in ("title", "rich_text"):
+            text = _plain_text(item.get(item_type))
+            if text:
+                texts.append(text)
+    return texts
+
+
+def _rollup_date(prop: dict | None) -> str:
+    if not prop:
+        return ""
+    rollup = prop.get("rollup", {})
+    if rollup.get("type") == "date":
+        return (rollup.get("date") or {}).get("start") or ""
+    for item in rollup.get("array", ()):
+        if item.get("type") == "date" and item.get("date"):
+            return item["date"].get("start") or ""
+    return ""
+
+
+def _rollup_url(prop: dict | None) -> str:
+    if not prop:
+        return ""
+    for item in prop.get("rollup", {}).get("array", ()):
+        if item.get("type") == "url" and item.get("url"):
+            return item["url"]
+    return ""
+
+
+_EXTRACTORS = {
+    "title": _title,
+    "rich_text": _rich_text,
+    "email": _email,
+    "phone": _phone,
+    "select": _select,
+    "status": _status,
+    "number": _number,
+    "date": _date_start,
+    "relation": _relation_ids,
+    "people": _people,
+    "rollup_texts": _rollup_texts,
+    "rollup_date": _rollup_date,
+    "rollup_url": _rollup_url,
+    "empty_text": lambda prop: "",
+    "none": lambda prop: None,
+    "empty_list": lambda prop: [],
+}
+
+# 필드 kind → {스키마 속성 타입: 추출 함수 이름}
+_KIND_EXTRACTORS = {
+    "title": {"title": "title"},
+    "rich_text": {"rich_text": "rich_text"},
+    "text": {"rich_text": "rich_text", "title": "title"},
+    "email": {"email": "email"},
+    "phone": {"phone_number": "phone"},
+    "select": {"select": "select", "status": "status"},
+    "number": {"number": "number"},
+    "date": {"date": "date"},
+    "relation": {"relation": "relation"},
+    "people": {"people": "people"},
+    "rollup_texts": {"rollup": "rollup_texts"},
+    "rollup_date": {"rollup": "rollup_date"},
+    "rollup_url": {"rollup": "rollup_url"},
+}
+
+# 선택 속성이 스키마에 없을 때의 기본값
+_MISSING = {
+    "title": "empty_text",
+    "rich_text": "empty_text",
+    "text": "empty_text",
+    "email": "empty_text",
+    "phone": "empty_text",
+    "select": "empty_text",
+    "number": "none",
+    "date": "empty_text",
+    "relation": "empty_list",
+    "people": "empty_list",
+    "rollup_texts": "empty_list",
+    "rollup_date": "empty_text",
+    "rollup_url": "empty_text",
+}
+
+
+# ── DB별 필드 정의 + 레코드 조립 ──
+
+
+def _interned(value: str | None) -> str | None:
+    """값 종류가 적고 여러 레코드에 반복되는 문자열은 하나의 객체를 공유."""
+    return sys.intern(value) if value else value
+
+
+def _interned_ids(ids: list[str]) -> tuple[str, ...]:
+    return tuple(sys.intern(i) for i in ids)
+
+
+_TUTOR_FIELDS = (
+    FieldSpec("unique_name", "title", ("unique_name",), required=True),
+    FieldSpec("real_name", "rich_text", ("real_name",)),
+    FieldSpec("email", "email", ("email",)),
+    FieldSpec("phone", "phone", ("phone_number",)),
+    FieldSpec("tutor_level", "select", ("tutor_level",)),
+)
+
+
+def _build_tutor(page_id: str, v: dict) -> TutorRecord:
+    return TutorRecord(
+        notion_page_id=sys.intern(page_id),
+        name=v["real_name"] or v["unique_name"],
+        email=v["email"] or None,
+        phone=v["phone"] or None,
+        specialty=_interned(v["tutor_level"]) or None,
+    )
+
+
+_LECTURE_FIELDS = (
+    FieldSpec("title", "title", ("lecture_dashboard", "이름", "Name", "title"), required=True),
+    FieldSpec("lecture_state", "select", ("lecture_state", "상태", "Status")),
+    FieldSpec("lecture_start", "rollup_date", ("lecture_start",)),
+    FieldSpec("lecture_end", "rollup_date", ("lecture_end",)),
+    FieldSpec("students", "number", ("students",)),
+    FieldSpec("schedule_ids", "relation", ("lecture_schedules",)),
+    FieldSpec("target_names", "rollup_texts", ("target_name",)),
+    FieldSpec("workbook_full_url", "rollup_url", ("workbook_full_URL",)),
+    FieldSpec("manager", "people", ("lecture_PIC",)),
+    FieldSpec("sales_rep", "people", ("sales_PIC",)),
+)
+
+
+def _build_lecture(page_id: str, v: dict) -> LectureRecord:
+    manager, sales_rep = v["manager"], v["sales_rep"]
+    return LectureRecord(
+        notion_page_id=sys.intern(page_id),
+        title=v["title"],
+        status=_interned(v["lecture_state"]),
+        target=_interned(", ".join(v["target_names"])) or None,
+        lecture_start=_interned(v["lecture_start"]) or None,
+        lecture_end=_interned(v["lecture_end"]) or None,
+        students=v["students"],
+        workbook_full_url=v["workbook_full_url"] or None,
+        manager=_interned(", ".join(p["name"] for p in manager)) or None,
+        manager_email=(_interned(manager[0]["email"]) or None) if manager else None,
+        sales_rep=_interned(", ".join(p["name"] for p in sales_rep)) or None,
+        sales_rep_email=(_interned(sales_rep[0]["email"]) or None) if sales_rep else None,
+        schedule_ids=_interned_ids(v["schedule_ids"]),
+    )
+
+
+_SCHEDULE_FIELDS = (
+    FieldSpec("date", "date", ("date",), required=True),
+    FieldSpec("lecture_dashboard_ids", "relation", ("lecture_dashboard",), required=True),
+    FieldSpec("name", "title", ("lecture_schedule_name",)),
+    FieldSpec("place", "text", ("place",)),
+    FieldSpec("main_tutor_ids", "relation", ("main_tutor",)),
+    FieldSpec("tech_tutor_ids", "relation", ("tech_tutor",)),
+    FieldSpec("start_time", "number", ("start_time",)),
+    FieldSpec("end_time", "number", ("end_time",)),
+)
+
+
+def _build_schedule(page_id: str, v: dict) -> ScheduleRecord:
+    return ScheduleRecord(
+        notion_page_id=sys.intern(page_id),
+        name=v["name"],
+        # datetime 값(예: 2026-03-02T10:00:00+09:00)도 날짜 부분만 사용
+        date=_interned(v["date"][:10]),
+        place=_interned(v["place"]),
+        start_time=v["start_time"],
+        end_time=v["end_time"],
+        main_tutor_ids=_interned_ids(v["main_tutor_ids"]),
+        tech_tutor_ids=_interned_ids(v["tech_tutor_ids"]),
+        lecture_dashboard_ids=_interned_ids(v["lecture_dashboard_ids"]),
+    )
+
+
+_BUILDERS = {
+    "tutor": _build_tutor,
+    "lecture": _build_lecture,
+    "schedule": _build_schedule,
+}
+
+_SPECS = {
+    "tutor": (_TUTOR_FIELDS, "tutor"),
+    "lecture": (_LECTURE_FIELDS, "lecture"),
+    "schedule": (_SCHEDULE_FIELDS, "schedule"),
+}
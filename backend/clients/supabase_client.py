@@ -8,3 +8,8 @@ class SupabaseClient(ABC):
     def table(self, table_name: str):
         """테이블 쿼리 빌더 반환"""
         ...
+
+    @abstractmethod
+    async def execute(self, query):
+        """table()로 만든 쿼리를 이벤트 루프를 막지 않고 실행해 응답 반환"""
+        ...
@@ -1,16 +1,75 @@
+import logging
+
 from pydantic_settings import BaseSettings
 
+# 동기화 요약 등 앱 로그를 남기는 모듈 패키지
+_APP_LOGGERS = ("clients", "routers", "services")
+
 
 class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
+    # Supabase HTTP 커넥션 풀 (lifespan 동안 하나의 클라이언트를 모든 요청이 공유)
+    SUPABASE_MAX_CONNECTIONS: int = 20
+    SUPABASE_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    SUPABASE_KEEPALIVE_EXPIRY: float = 30.0
+    SUPABASE_TIMEOUT: float = 30.0
     NOTION_TOKEN: str = ""
     NOTION_DB_LECTURE: str = ""
     NOTION_DB_SCHEDULE: str = ""
     NOTION_DB_TUTOR: str = ""
+    # Notion HTTP 커넥션 풀 (lifespan 동안 하나의 클라이언트를 공유)
+    NOTION_HTTP2: bool = False
+    NOTION_MAX_CONNECTIONS: int = 10
+    NOTION_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    NOTION_KEEPALIVE_EXPIRY: float = 30.0
+    NOTION_CONNECT_TIMEOUT: float = 10.0
+    NOTION_READ_TIMEOUT: float = 30.0
+    # Notion rate limit (통합당 평균 3 req/s) + 재시도
+    NOTION_RATE_LIMIT_PER_SEC: float = 3.0
+    NOTION_RATE_LIMIT_BURST: int = 3
+    NOTION_MAX_RETRIES: int = 5
+    NOTION_BACKOFF_BASE: float = 0.5
+    NOTION_BACKOFF_MAX: float = 30.0
+    # 동기화 시 Notion 조회가 처리보다 앞서 받아둘 수 있는 최대 배치 수 (배치당 최대 100페이지)
+    NOTION_SYNC_PREFETCH_BATCHES: int = 4
+    # 중단된 동기화의 체크포인트(마지막으로 반영한 배치의 커서)를 이어받는 최대 경과 시간(초)
+    NOTION_SYNC_CHECKPOINT_TTL_SECONDS: float = 3600.0
+    # 일정 조회 시 활성 강의 relation 조건을 한 쿼리에 OR로 묶는 최대 개수 (0: 필터 없이 전체 일정 조회)
+    NOTION_SCHEDULE_FILTER_CHUNK_SIZE: int = 50
+    # 강의 1건 재동기화 시 일정 페이지를 동시에 조회하는 최대 개수
+    NOTION_PAGE_FETCH_CONCURRENCY: int = 3
+    # 1 이상이면 Notion 페이지 파싱을 이 개수의 프로세스 풀에서 수행 (0: 이벤트 루프에서 직접)
+    NOTION_SYNC_PARSE_WORKERS: int = 0
+    # Notion 웹훅: 구독 verification_token (X-Notion-Signature 검증 키, 비어 있으면 페이지 이벤트 거부)
+    NOTION_WEBHOOK_SECRET: str = ""
+    # 같은 페이지의 변경 이벤트를 모으는 시간 / 계속 수정 중이어도 최대 이만큼 뒤에는 반영
+    NOTION_WEBHOOK_DEBOUNCE_SECONDS: float = 5.0
+    NOTION_WEBHOOK_MAX_DELAY_SECONDS: float = 60.0
+    # 주기적 delta 동기화 (0이면 비활성). 실패 시 주기를 2배씩 늘려 최대 SYNC_MAX_BACKOFF_SECONDS까지
+    SYNC_INTERVAL_SECONDS: float = 0
+    SYNC_JITTER_SECONDS: float = 30.0
+    SYNC_MAX_BACKOFF_SECONDS: float = 3600.0
     PORT: int = 8000
+    # 앱 로거(clients/routers/services) 레벨. 동기화 요약은 INFO로 남는다
+    LOG_LEVEL: str = "INFO"
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
 
 
 settings = Settings()
+
+
+def configure_logging(level: str) -> None:
+    """앱 로거에 레벨과 stderr 핸들러를 단다.
+
+    uvicorn은 자기 로거만 설정하므로, 이게 없으면 INFO 로그(동기화 요약)가 보이지 않는다.
+    여러 번 불러도 핸들러는 한 번만 단다.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    for name in _APP_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        if not logger.handlers:
+            logger.addHandler(handler)
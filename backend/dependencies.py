@@ -1,5 +1,6 @@
 import logging
-from fastapi import Depends
+from concurrent.futures import Executor
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 import jwt
@@ -18,8 +19,6 @@ _jwks_client = PyJWKClient(
 from exceptions import AuthenticationError, AuthorizationError
 from clients.notion_client import NotionClient
 from clients.supabase_client import SupabaseClient
-from clients.impl.notion_client_impl import NotionClientImpl
-from clients.impl.supabase_client_impl import SupabaseClientImpl
 from repositories.instructor_repository import InstructorRepository
 from repositories.impl.supabase_instructor_repository import SupabaseInstructorRepository
 from repositories.course_repository import CourseRepository
@@ -33,11 +32,19 @@ from services.course_service import CourseService
 from services.assignment_service import AssignmentService
 from services.calendar_service import CalendarService
 from services.notion_sync_service import NotionSyncService
+from services.sync_job_service import SyncJobManager
+from services.notion_change_queue import NotionChangeQueue
 from services.instructor_course_service import InstructorCourseService
 from repositories.availability_repository import AvailabilityRepository
 from repositories.impl.supabase_availability_repository import SupabaseAvailabilityRepository
 from services.availability_service import AvailabilityService
 from repositories.profile_repository import ProfileRepository
+from repositories.sync_state_repository import SyncStateRepository
+from repositories.impl.supabase_sync_state_repository import SupabaseSyncStateRepository
+from repositories.sync_run_repository import SyncRunRepository
+from repositories.impl.supabase_sync_run_repository import SupabaseSyncRunRepository
+from repositories.calendar_repository import CalendarRepository
+from repositories.impl.supabase_calendar_repository import SupabaseCalendarRepository
 from repositories.impl.supabase_profile_repository import SupabaseProfileRepository
 from services.auth_service import AuthService
 from schemas.auth import UserProfile
@@ -45,12 +52,29 @@ from schemas.auth import UserProfile
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def get_notion_client() -> NotionClient:
-    return NotionClientImpl(token=settings.NOTION_TOKEN)
+def get_notion_client(request: Request) -> NotionClient:
+    """lifespan에서 생성한 공유 Notion 클라이언트 (커넥션 풀 재사용)."""
+    return request.app.state.notion_client
 
 
-def get_supabase_client() -> SupabaseClient:
-    return SupabaseClientImpl(url=settings.SUPABASE_URL, key=settings.SUPABASE_KEY)
+def get_sync_job_manager(request: Request) -> SyncJobManager:
+    """lifespan에서 생성한 동기화 작업 관리자 (프로세스당 하나)."""
+    return request.app.state.sync_jobs
+
+
+def get_notion_change_queue(request: Request) -> NotionChangeQueue:
+    """웹훅 변경 페이지 큐 (create_app에서 생성, lifespan에서 워커 시작)."""
+    return request.app.state.notion_changes
+
+
+def get_parse_executor(request: Request) -> Executor | None:
+    """lifespan에서 생성한 파싱용 프로세스 풀 (NOTION_SYNC_PARSE_WORKERS=0이면 None)."""
+    return getattr(request.app.state, "parse_executor", None)
+
+
+def get_supabase_client(request: Request) -> SupabaseClient:
+    """lifespan에서 생성한 공유 Supabase 클라이언트 (커넥션 풀 재사용)."""
+    return request.app.state.supabase
 
 
 # --- Instructor ---
@@ -128,12 +152,27 @@ def get_instructor_course_service(
 
 # --- Notion Sync ---
 
+def get_sync_state_repository(
+    client: SupabaseClient = Depends(get_supabase_client),
+) -> SyncStateRepository:
+    return SupabaseSyncStateRepository(client)
+
+
+def get_sync_run_repository(
+    client: SupabaseClient = Depends(get_supabase_client),
+) -> SyncRunRepository:
+    return SupabaseSyncRunRepository(client)
+
+
 def get_notion_sync_service(
     client: NotionClient = Depends(get_notion_client),
     instructor_repo: InstructorRepository = Depends(get_instructor_repository),
     course_repo: CourseRepository = Depends(get_course_repository),
     course_date_repo: CourseDateRepository = Depends(get_course_date_repository),
     assignment_repo: AssignmentRepository = Depends(get_assignment_repository),
+    sync_state_repo: SyncStateRepository = Depends(get_sync_state_repository),
+    sync_run_repo: SyncRunRepository = Depends(get_sync_run_repository),
+    parse_executor: Executor | None = Depends(get_parse_executor),
 ) -> NotionSyncService:
     return NotionSyncService(
         client=client,
@@ -141,19 +180,41 @@ def get_notion_sync_service(
         course_repo=course_repo,
         course_date_repo=course_date_repo,
         assignment_repo=assignment_repo,
+        sync_state_repo=sync_state_repo,
+        sync_run_repo=sync_run_repo,
         settings=settings,
+        parse_executor=parse_executor,
+    )
+
+
+def create_notion_sync_service(
+    client: NotionClient, supabase: SupabaseClient, parse_executor: Executor | None = None,
+) -> NotionSyncService:
+    """요청 밖(스케줄러, 웹훅 큐)에서 쓰는 동기화 서비스. 공유 클라이언트들을 그대로 받는다."""
+    return get_notion_sync_service(
+        client=client,
+        instructor_repo=get_instructor_repository(supabase),
+        course_repo=get_course_repository(supabase),
+        course_date_repo=get_course_date_repository(supabase),
+        assignment_repo=get_assignment_repository(supabase),
+        sync_state_repo=get_sync_state_repository(supabase),
+        sync_run_repo=get_sync_run_repository(supabase),
+        parse_executor=parse_executor,
     )
 
 
 # --- Calendar ---
 
+def get_calendar_repository(
+    client: SupabaseClient = Depends(get_supabase_client),
+) -> CalendarRepository:
+    return SupabaseCalendarRepository(client)
+
+
 def get_calendar_service(
-    assignment_repo: AssignmentRepository = Depends(get_assignment_repository),
-    course_date_repo: CourseDateRepository = Depends(get_course_date_repository),
-    course_repo: CourseRepository = Depends(get_course_repository),
-    instructor_repo: InstructorRepository = Depends(get_instructor_repository),
+    calendar_repo: CalendarRepository = Depends(get_calendar_repository),
 ) -> CalendarService:
-    return CalendarService(assignment_repo, course_date_repo, course_repo, instructor_repo)
+    return CalendarService(calendar_repo)
 
 
 # --- Auth ---
@@ -176,6 +237,7 @@ _PROFILE_CACHE_TTL = 600  # 10분
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
 ) -> UserProfile:
     """JWT 토큰 검증 → 프로필 조회 (캐시 적용)."""
@@ -210,7 +272,7 @@ async def get_current_user(
         return cached[1]
 
     # 캐시 미스 → DB 조회
-    client = get_supabase_client()
+    client = get_supabase_client(request)
     profile_repo = SupabaseProfileRepository(client)
     auth_service = AuthService(profile_repo)
     profile = await auth_service.get_or_create_profile(user_id, email)
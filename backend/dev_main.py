@@ -1,5 +1,7 @@
 """개발용 서버 — Notion 동기화 기반 (Supabase 불필요)."""
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 
 import jwt
@@ -9,15 +11,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from config import settings
-from exceptions import AuthenticationError, AuthorizationError
-from routers import instructors, courses, assignments, calendar, availability, auth
+from config import configure_logging, settings
+from exceptions import AuthenticationError, AuthorizationError, SyncJobConflictError
+from routers import instructors, courses, assignments, calendar, availability, auth, sync, webhooks
 from dependencies import (
     get_instructor_repository,
     get_course_repository,
     get_course_date_repository,
     get_assignment_repository,
     get_availability_repository,
+    get_sync_state_repository,
+    get_sync_run_repository,
+    get_calendar_repository,
     get_current_user,
 )
 from schemas.auth import UserProfile
@@ -26,8 +31,16 @@ from tests.fakes.fake_course_repository import FakeCourseRepository
 from tests.fakes.fake_course_date_repository import FakeCourseDateRepository
 from tests.fakes.fake_assignment_repository import FakeAssignmentRepository
 from tests.fakes.fake_availability_repository import FakeAvailabilityRepository
+from tests.fakes.fake_sync_state_repository import FakeSyncStateRepository
+from tests.fakes.fake_sync_run_repository import FakeSyncRunRepository
+from tests.fakes.fake_calendar_repository import FakeCalendarRepository
 from clients.impl.notion_client_impl import NotionClientImpl
 from services.notion_sync_service import NotionSyncService
+from services.notion_change_queue import NotionChangeQueue
+from services.sync_job_service import SyncJobManager
+from services.sync_scheduler import SyncScheduler
+
+configure_logging(settings.LOG_LEVEL)
 
 # Supabase JWT 검증용
 _bearer_scheme = HTTPBearer(auto_error=False)
@@ -44,6 +57,11 @@ fake_course_repo = FakeCourseRepository()
 fake_course_date_repo = FakeCourseDateRepository()
 fake_assignment_repo = FakeAssignmentRepository()
 fake_availability_repo = FakeAvailabilityRepository()
+fake_sync_state_repo = FakeSyncStateRepository()
+fake_sync_run_repo = FakeSyncRunRepository()
+fake_calendar_repo = FakeCalendarRepository(
+    fake_assignment_repo, fake_course_date_repo, fake_course_repo, fake_instructor_repo,
+)
 
 # 개발용 기본 admin (토큰 없을 때 폴백)
 _dev_admin = UserProfile(id="dev-profile", user_id="dev-user", role="admin", email="dev@test.com")
@@ -98,29 +116,73 @@ async def _dev_get_current_user(
     )
 
 
+def _dev_sync_service(
+    notion_client: NotionClientImpl, parse_executor: ProcessPoolExecutor | None = None,
+) -> NotionSyncService:
+    return NotionSyncService(
+        client=notion_client,
+        instructor_repo=fake_instructor_repo,
+        course_repo=fake_course_repo,
+        course_date_repo=fake_course_date_repo,
+        assignment_repo=fake_assignment_repo,
+        sync_state_repo=fake_sync_state_repo,
+        sync_run_repo=fake_sync_run_repo,
+        settings=settings,
+        parse_executor=parse_executor,
+    )
+
+
+async def _sync_changed_pages(page_ids: list[str]) -> None:
+    service = _dev_sync_service(app.state.notion_client, app.state.parse_executor)
+    await app.state.sync_jobs.run(
+        "webhook", False, lambda progress: service.sync_pages(page_ids, progress=progress),
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    notion_client = NotionClientImpl.from_settings(settings)
+    app.state.notion_client = notion_client
+    # 대량 동기화 시 파싱을 이벤트 루프 밖으로 (기본 비활성).
+    # 스레드 풀·이벤트 루프가 도는 프로세스를 fork하면 잠긴 락이 복사될 수 있으므로 spawn으로 띄운다
+    parse_executor = None
+    if settings.NOTION_SYNC_PARSE_WORKERS > 0:
+        parse_executor = ProcessPoolExecutor(
+            max_workers=settings.NOTION_SYNC_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+        )
+    app.state.parse_executor = parse_executor
+    scheduler = None
+
     if settings.NOTION_TOKEN and settings.NOTION_DB_TUTOR:
         try:
-            sync_service = NotionSyncService(
-                client=NotionClientImpl(token=settings.NOTION_TOKEN),
-                instructor_repo=fake_instructor_repo,
-                course_repo=fake_course_repo,
-                course_date_repo=fake_course_date_repo,
-                assignment_repo=fake_assignment_repo,
-                settings=settings,
-            )
-            await sync_service.sync_all()
+            await _dev_sync_service(notion_client, parse_executor).sync_all()
         except Exception as e:
             print(f"[dev] Notion sync failed: {e}")
             print("[dev] Starting with empty data")
+        if settings.SYNC_INTERVAL_SECONDS > 0:
+            scheduler = SyncScheduler.from_settings(
+                settings, app.state.sync_jobs, lambda: _dev_sync_service(notion_client, parse_executor),
+            )
+            scheduler.start()
     else:
         print("[dev] Notion credentials not configured, starting with empty data")
 
-    yield
+    app.state.notion_changes.start()
+    try:
+        yield
+    finally:
+        await app.state.notion_changes.stop()
+        if scheduler:
+            await scheduler.stop()
+        await app.state.sync_jobs.shutdown()
+        await notion_client.aclose()
+        if parse_executor:
+            parse_executor.shutdown(cancel_futures=True)
 
 
 app = FastAPI(title="Instructor Scheduler API (dev)", lifespan=lifespan)
+app.state.sync_jobs = SyncJobManager()
+app.state.notion_changes = NotionChangeQueue.from_settings(settings, _sync_changed_pages)
 
 app.add_middleware(
     CORSMiddleware,
@@ -128,6 +190,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 목록 API 페이지네이션 헤더를 브라우저에서 읽을 수 있게
+    expose_headers=["X-Next-Cursor", "X-Total-Count"],
 )
 
 
@@ -140,6 +204,10 @@ async def authentication_error_handler(request: Request, exc: AuthenticationErro
 async def authorization_error_handler(request: Request, exc: AuthorizationError):
     return JSONResponse(status_code=403, content={"detail": str(exc)})
 
+@app.exception_handler(SyncJobConflictError)
+async def sync_job_conflict_handler(request: Request, exc: SyncJobConflictError):
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
+
 
 @app.get("/health")
 def health():
@@ -151,10 +219,15 @@ app.include_router(courses.router, prefix="/api")
 app.include_router(assignments.router, prefix="/api")
 app.include_router(calendar.router, prefix="/api")
 app.include_router(availability.router, prefix="/api")
+app.include_router(sync.router, prefix="/api")
+app.include_router(webhooks.router, prefix="/api")
 
 app.dependency_overrides[get_instructor_repository] = lambda: fake_instructor_repo
 app.dependency_overrides[get_course_repository] = lambda: fake_course_repo
 app.dependency_overrides[get_course_date_repository] = lambda: fake_course_date_repo
 app.dependency_overrides[get_assignment_repository] = lambda: fake_assignment_repo
 app.dependency_overrides[get_availability_repository] = lambda: fake_availability_repo
+app.dependency_overrides[get_sync_state_repository] = lambda: fake_sync_state_repo
+app.dependency_overrides[get_sync_run_repository] = lambda: fake_sync_run_repo
+app.dependency_overrides[get_calendar_repository] = lambda: fake_calendar_repo
 app.dependency_overrides[get_current_user] = _dev_get_current_user
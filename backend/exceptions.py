@@ -8,3 +8,18 @@ class AuthenticationError(Exception):
 
 class AuthorizationError(Exception):
     pass
+
+
+class SyncJobConflictError(Exception):
+    """다른 종류(kind/full)의 동기화가 실행 중이라 요청한 동기화를 시작할 수 없음."""
+    pass
+
+
+class NotionSchemaError(Exception):
+    """Notion DB 스키마가 동기화에 필요한 속성을 갖추지 못함 (속성 이름 변경 등)."""
+    pass
+
+
+class InvalidCursorError(ValueError):
+    """목록 페이지 cursor를 해석할 수 없음 (변조되었거나 다른 목록의 cursor)."""
+    pass
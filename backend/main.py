@@ -1,11 +1,23 @@
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from exceptions import AuthenticationError, AuthorizationError
-from routers import instructors, courses, assignments, calendar, availability, auth
+from clients.impl.notion_client_impl import NotionClientImpl
+from clients.impl.supabase_client_impl import SupabaseClientImpl
+from config import configure_logging, settings
+from dependencies import create_notion_sync_service
+from services.notion_change_queue import NotionChangeQueue
+from services.sync_job_service import SyncJobManager
+from services.sync_scheduler import SyncScheduler
+from exceptions import AuthenticationError, AuthorizationError, SyncJobConflictError
+from routers import instructors, courses, assignments, calendar, availability, auth, sync, webhooks
+
+configure_logging(settings.LOG_LEVEL)
 
 ALLOWED_ORIGINS = os.getenv(
     "ALLOWED_ORIGINS",
@@ -13,8 +25,56 @@ ALLOWED_ORIGINS = os.getenv(
 ).split(",")
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Notion/Supabase 클라이언트는 프로세스 수명 동안 하나만 두고 커넥션을 재사용
+    notion_client = NotionClientImpl.from_settings(settings)
+    app.state.notion_client = notion_client
+    supabase = SupabaseClientImpl.from_settings(settings)
+    app.state.supabase = supabase
+    # 대량 동기화 시 파싱을 이벤트 루프 밖으로 (기본 비활성).
+    # 스레드 풀·이벤트 루프가 도는 프로세스를 fork하면 잠긴 락이 복사될 수 있으므로 spawn으로 띄운다
+    parse_executor = None
+    if settings.NOTION_SYNC_PARSE_WORKERS > 0:
+        parse_executor = ProcessPoolExecutor(
+            max_workers=settings.NOTION_SYNC_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+        )
+    app.state.parse_executor = parse_executor
+    scheduler = None
+    if settings.SYNC_INTERVAL_SECONDS > 0:
+        scheduler = SyncScheduler.from_settings(
+            settings, app.state.sync_jobs, lambda: create_notion_sync_service(notion_client, supabase, parse_executor),
+        )
+        scheduler.start()
+    app.state.notion_changes.start()
+    try:
+        yield
+    finally:
+        await app.state.notion_changes.stop()
+        if scheduler:
+            await scheduler.stop()
+        await app.state.sync_jobs.shutdown()
+        await notion_client.aclose()
+        supabase.close()
+        if parse_executor:
+            parse_executor.shutdown(cancel_futures=True)
+
+
+async def _sync_changed_pages(app: FastAPI, page_ids: list[str]) -> None:
+    """웹훅 큐 handler: 변경 페이지만 동기화 (다른 동기화가 돌고 있으면 끝난 뒤 실행)."""
+    service = create_notion_sync_service(app.state.notion_client, app.state.supabase, app.state.parse_executor)
+    await app.state.sync_jobs.run(
+        "webhook", False, lambda progress: service.sync_pages(page_ids, progress=progress),
+    )
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="Instructor Scheduler API")
+    app = FastAPI(title="Instructor Scheduler API", lifespan=lifespan)
+    # 동기화 작업 상태는 프로세스 메모리에 둔다 (single-flight 잠금 겸용)
+    app.state.sync_jobs = SyncJobManager()
+    app.state.notion_changes = NotionChangeQueue.from_settings(
+        settings, lambda page_ids: _sync_changed_pages(app, page_ids),
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -22,6 +82,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # 목록 API 페이지네이션 헤더를 브라우저에서 읽을 수 있게
+        expose_headers=["X-Next-Cursor", "X-Total-Count"],
     )
 
     @app.exception_handler(AuthenticationError)
@@ -32,6 +94,10 @@ def create_app() -> FastAPI:
     async def authorization_error_handler(request: Request, exc: AuthorizationError):
         return JSONResponse(status_code=403, content={"detail": str(exc)})
 
+    @app.exception_handler(SyncJobConflictError)
+    async def sync_job_conflict_handler(request: Request, exc: SyncJobConflictError):
+        return JSONResponse(status_code=409, content={"detail": str(exc)})
+
     @app.get("/health")
     def health():
         return {"status": "ok"}
@@ -42,6 +108,8 @@ def create_app() -> FastAPI:
     app.include_router(assignments.router, prefix="/api")
     app.include_router(calendar.router, prefix="/api")
     app.include_router(availability.router, prefix="/api")
+    app.include_router(sync.router, prefix="/api")
+    app.include_router(webhooks.router, prefix="/api")
 
     return app
 
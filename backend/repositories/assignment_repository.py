@@ -1,15 +1,32 @@
 from abc import ABC, abstractmethod
 
+from repositories.pagination import Page
+from repositories.projection import Columns
+
 
 class AssignmentRepository(ABC):
     """강사 배정 인터페이스"""
 
     @abstractmethod
-    async def list_assignments(self, filters: dict | None = None) -> list[dict]:
+    async def list_assignments(self, filters: dict | None = None, columns: Columns = None) -> list[dict]:
+        """columns: 가져올 컬럼 (None이면 전체)"""
+        ...
+
+    @abstractmethod
+    async def list_assignments_page(
+        self,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        """(date, id) 순 keyset 페이지. filters: {컬럼: 값} 일치, 날짜 범위는 양 끝 포함"""
         ...
 
     @abstractmethod
-    async def list_assignments_by_date_range(self, start_date: str, end_date: str) -> list[dict]:
+    async def list_assignments_by_date_range(
+        self, start_date: str, end_date: str, columns: Columns = None,
+    ) -> list[dict]:
         """날짜 범위로 배정 조회 (DB 레벨 필터링)."""
         ...
 
@@ -18,6 +35,21 @@ class AssignmentRepository(ABC):
         """배정 생성. UNIQUE 위반 시 예외 발생."""
         ...
 
+    @abstractmethod
+    async def insert_assignments_bulk(self, rows: list[dict]) -> list[dict]:
+        """배정 일괄 생성. UNIQUE(instructor_id, date) 충돌 행은 무시하고 실제 생성된 행만 반환."""
+        ...
+
+    @abstractmethod
+    async def update_assignments_bulk(self, assignment_ids: list[str], data: dict) -> int:
+        """여러 배정을 같은 값으로 일괄 수정. 수정된 건수 반환"""
+        ...
+
     @abstractmethod
     async def delete_assignment(self, assignment_id: str) -> bool:
         ...
+
+    @abstractmethod
+    async def delete_assignments_bulk(self, assignment_ids: list[str]) -> int:
+        """id 목록 일괄 삭제. 삭제된 행 수 반환."""
+        ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class CalendarRepository(ABC):
+    """캘린더 이벤트 조회 인터페이스 (배정 + 교육 날짜 + 과정 + 강사를 조인한 행)"""
+
+    @abstractmethod
+    async def list_events(self, start_date: str, end_date: str) -> list[dict]:
+        """날짜 범위의 배정을 CalendarEvent 필드 형태로 반환"""
+        ...
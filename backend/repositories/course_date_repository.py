@@ -1,22 +1,34 @@
 from abc import ABC, abstractmethod
 
+from repositories.projection import Columns
+
 
 class CourseDateRepository(ABC):
     """교육 날짜 관리 인터페이스"""
 
     @abstractmethod
-    async def list_dates_by_course(self, course_id: str) -> list[dict]:
+    async def list_dates_by_course(self, course_id: str, columns: Columns = None) -> list[dict]:
         ...
 
     @abstractmethod
-    async def list_all_dates(self) -> list[dict]:
-        """모든 교육 날짜를 한 번에 조회 (N+1 방지용)."""
+    async def list_all_dates(self, columns: Columns = None) -> list[dict]:
+        """모든 교육 날짜를 한 번에 조회 (N+1 방지용). columns: 가져올 컬럼 (None이면 전체)."""
         ...
 
     @abstractmethod
     async def create_dates(self, course_id: str, dates: list[dict]) -> list[dict]:
         ...
 
+    @abstractmethod
+    async def upsert_dates_bulk(self, rows: list[dict]) -> list[dict]:
+        """(course_id, date) 기준 일괄 upsert. 기존 날짜는 place/시간 등을 갱신."""
+        ...
+
     @abstractmethod
     async def delete_date(self, date_id: str) -> bool:
         ...
+
+    @abstractmethod
+    async def delete_dates_bulk(self, date_ids: list[str]) -> int:
+        """id 목록 일괄 삭제 (배정은 CASCADE). 삭제된 행 수 반환."""
+        ...
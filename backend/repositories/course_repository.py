@@ -1,12 +1,22 @@
 from abc import ABC, abstractmethod
 
+from repositories.pagination import Page
+from repositories.projection import Columns
+
 
 class CourseRepository(ABC):
     """교육 과정 조회 인터페이스"""
 
     @abstractmethod
-    async def list_courses(self, filters: dict | None = None) -> list[dict]:
-        """교육 목록 조회"""
+    async def list_courses(self, filters: dict | None = None, columns: Columns = None) -> list[dict]:
+        """교육 목록 조회. columns: 가져올 컬럼 (None이면 전체)"""
+        ...
+
+    @abstractmethod
+    async def list_courses_page(
+        self, filters: dict | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        """id 순 keyset 페이지. filters: {컬럼: 값} 일치 (status, assignment_status 등)"""
         ...
 
     @abstractmethod
@@ -24,6 +34,11 @@ class CourseRepository(ABC):
         """교육 수정"""
         ...
 
+    @abstractmethod
+    async def update_courses_bulk(self, course_ids: list[str], data: dict) -> int:
+        """여러 교육을 같은 값으로 일괄 수정. 수정된 건수 반환"""
+        ...
+
     @abstractmethod
     async def delete_course(self, course_id: str) -> bool:
         """교육 삭제"""
@@ -33,3 +48,8 @@ class CourseRepository(ABC):
     async def upsert_course(self, data: dict) -> dict:
         """교육 upsert (notion_page_id 기준)"""
         ...
+
+    @abstractmethod
+    async def upsert_courses_bulk(self, rows: list[dict]) -> dict[str, str]:
+        """교육 일괄 upsert (notion_page_id 기준). notion_page_id → id 매핑 반환"""
+        ...
@@ -1,5 +1,13 @@
 from clients.notion_client import NotionClient
+from clients.notion_schema import CompiledParser, compile_parser
 from repositories.course_repository import CourseRepository
+from repositories.pagination import Page, paginate
+from repositories.projection import Columns, project
+
+_COURSE_FIELDS = (
+    "notion_page_id", "title", "status", "target", "students",
+    "lecture_start", "lecture_end", "workbook_full_url",
+)
 
 
 class NotionCourseRepository(CourseRepository):
@@ -8,14 +16,24 @@ class NotionCourseRepository(CourseRepository):
     def __init__(self, client: NotionClient, database_id: str):
         self._client = client
         self._database_id = database_id
+        self._compiled: CompiledParser | None = None
 
-    async def list_courses(self, filters: dict | None = None) -> list[dict]:
+    async def list_courses(self, filters: dict | None = None, columns: Columns = None) -> list[dict]:
         pages = await self._client.query_database(self._database_id, filters)
-        return [self._parse_page(p) for p in pages]
+        return project(await self._parse_pages(pages), columns)
+
+    async def list_courses_page(
+        self, filters: dict | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        # Notion 행에는 DB id가 없으므로 페이지 id로 정렬·cursor를 만든다
+        return paginate(await self.list_courses(filters), ("notion_page_id",), limit, cursor, count)
 
     async def get_course(self, course_id: str) -> dict | None:
         page = await self._client.get_page(course_id)
-        return self._parse_page(page) if page else None
+        if not page:
+            return None
+        [course] = await self._parse_pages([page])
+        return course
 
     async def create_course(self, data: dict) -> dict:
         raise NotImplementedError("Notion은 읽기 전용 소스입니다")
@@ -23,84 +41,25 @@ class NotionCourseRepository(CourseRepository):
     async def update_course(self, course_id: str, data: dict) -> dict:
         raise NotImplementedError("Notion은 읽기 전용 소스입니다")
 
+    async def update_courses_bulk(self, course_ids: list[str], data: dict) -> int:
+        raise NotImplementedError("Notion은 읽기 전용 소스입니다")
+
     async def delete_course(self, course_id: str) -> bool:
         raise NotImplementedError("Notion은 읽기 전용 소스입니다")
 
     async def upsert_course(self, data: dict) -> dict:
         raise NotImplementedError("Notion은 읽기 전용 소스입니다")
 
-    @staticmethod
-    def _parse_page(page: dict) -> dict:
-        props = page.get("properties", {})
-
-        # title (lecture_dashboard가 title 타입)
-        title = ""
-        for key in ("lecture_dashboard", "이름", "Name", "title"):
-            prop = props.get(key)
-            if prop and prop.get("type") == "title" and prop.get("title"):
-                title = "".join(t.get("plain_text", "") for t in prop["title"])
-                break
-
-        # status (lecture_state: select 또는 status 타입)
-        status = ""
-        status_prop = props.get("lecture_state") or props.get("상태") or props.get("Status")
-        if status_prop:
-            if status_prop.get("type") == "select" and status_prop.get("select"):
-                status = status_prop["select"].get("name", "")
-            elif status_prop.get("type") == "status" and status_prop.get("status"):
-                status = status_prop["status"].get("name", "")
-
-        # target (target_name: rollup 타입)
-        target = None
-        target_prop = props.get("target_name")
-        if target_prop and target_prop.get("type") == "rollup":
-            texts = []
-            for item in target_prop.get("rollup", {}).get("array", []):
-                if item.get("type") == "title":
-                    texts.append("".join(t.get("plain_text", "") for t in item.get("title", [])))
-                elif item.get("type") == "rich_text":
-                    texts.append("".join(t.get("plain_text", "") for t in item.get("rich_text", [])))
-            target = ", ".join(t for t in texts if t) or None
-
-        # students (number 타입)
-        students = None
-        students_prop = props.get("students")
-        if students_prop and students_prop.get("type") == "number":
-            students = students_prop.get("number")
-
-        # lecture_start / lecture_end (rollup → date)
-        def _rollup_date(key: str) -> str | None:
-            prop = props.get(key)
-            if not prop or prop.get("type") != "rollup":
-                return None
-            rollup = prop.get("rollup", {})
-            if rollup.get("type") == "date" and rollup.get("date"):
-                return rollup["date"].get("start") or None
-            if rollup.get("type") == "array":
-                for item in rollup.get("array", []):
-                    if item.get("type") == "date" and item.get("date"):
-                        return item["date"].get("start") or None
-            return None
-
-        lecture_start = _rollup_date("lecture_start")
-        lecture_end = _rollup_date("lecture_end")
+    async def upsert_courses_bulk(self, rows: list[dict]) -> dict[str, str]:
+        raise NotImplementedError("Notion은 읽기 전용 소스입니다")
 
-        # workbook_full_url (rollup → url)
-        workbook_full_url = None
-        wb_prop = props.get("workbook_full_URL")
-        if wb_prop and wb_prop.get("type") == "rollup":
-            for item in wb_prop.get("rollup", {}).get("array", []):
-                if item.get("type") == "url" and item.get("url"):
-                    workbook_full_url = item["url"]
-                    break
+    async def _parser(self) -> CompiledParser:
+        """강의 DB 스키마로 파서를 한 번만 컴파일해 재사용."""
+        if self._compiled is None:
+            schema = await self._client.retrieve_database(self._database_id)
+            self._compiled = compile_parser("lecture", schema)
+        return self._compiled
 
-        return {
-            "notion_page_id": page["id"],
-            "title": title,
-            "status": status,
-            "target": target,
-            "students": students,
-            "lecture_start": lecture_start,
-            "lecture_end": lecture_end,
-            "workbook_full_url": workbook_full_url,
-        }
+    async def _parse_pages(self, pages: list[dict]) -> list[dict]:
+        parser = await self._parser()
+        return [{k: v for k, v in parser(p).as_row().items() if k in _COURSE_FIELDS} for p in pages]
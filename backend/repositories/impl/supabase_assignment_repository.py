@@ -1,7 +1,15 @@
 from repositories.assignment_repository import AssignmentRepository
 from clients.supabase_client import SupabaseClient
+from repositories.impl.supabase_paging import (
+    BULK_CHUNK_SIZE, IN_FILTER_CHUNK_SIZE, execute_chunked, fetch_all, fetch_page, where_eq,
+)
+from repositories.pagination import Page
+from repositories.projection import Columns
 from exceptions import DuplicateAssignmentError
 
+# 목록 정렬 (keyset) 키
+_LIST_KEYS = ("date", "id")
+
 
 class SupabaseAssignmentRepository(AssignmentRepository):
     """Supabase 기반 강사 배정 관리"""
@@ -9,27 +17,31 @@ class SupabaseAssignmentRepository(AssignmentRepository):
     def __init__(self, client: SupabaseClient):
         self._client = client
 
-    async def list_assignments(self, filters: dict | None = None) -> list[dict]:
-        query = self._client.table("assignments").select("*")
-        if filters:
-            for key, value in filters.items():
-                query = query.eq(key, value)
-        result = query.execute()
-        return result.data
+    async def list_assignments(self, filters: dict | None = None, columns: Columns = None) -> list[dict]:
+        return await fetch_all(self._client, "assignments", _LIST_KEYS, columns=columns, where=where_eq(filters))
 
-    async def list_assignments_by_date_range(self, start_date: str, end_date: str) -> list[dict]:
-        result = (
-            self._client.table("assignments")
-            .select("*")
-            .gte("date", start_date)
-            .lte("date", end_date)
-            .execute()
+    async def list_assignments_by_date_range(
+        self, start_date: str, end_date: str, columns: Columns = None,
+    ) -> list[dict]:
+        return await fetch_all(
+            self._client, "assignments", _LIST_KEYS, columns=columns, where=_date_range(None, start_date, end_date),
+        )
+
+    async def list_assignments_page(
+        self,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        return await fetch_page(
+            self._client, "assignments", _LIST_KEYS,
+            where=_date_range(filters, start_date, end_date), limit=limit, cursor=cursor, count=count,
         )
-        return result.data
 
     async def create_assignment(self, data: dict) -> dict:
         try:
-            result = self._client.table("assignments").insert(data).execute()
+            result = await self._client.execute(self._client.table("assignments").insert(data))
             return result.data[0]
         except Exception as e:
             if "duplicate" in str(e).lower() or "unique" in str(e).lower():
@@ -38,11 +50,45 @@ class SupabaseAssignmentRepository(AssignmentRepository):
                 ) from e
             raise
 
+    async def insert_assignments_bulk(self, rows: list[dict]) -> list[dict]:
+        # ON CONFLICT DO NOTHING → 응답에는 실제로 삽입된 행만 담긴다
+        return await execute_chunked(
+            self._client, rows, BULK_CHUNK_SIZE,
+            lambda chunk: self._client.table("assignments").upsert(
+                chunk, on_conflict="instructor_id,date", ignore_duplicates=True,
+            ),
+        )
+
+    async def update_assignments_bulk(self, assignment_ids: list[str], data: dict) -> int:
+        updated = await execute_chunked(
+            self._client, assignment_ids, IN_FILTER_CHUNK_SIZE,
+            lambda chunk: self._client.table("assignments").update(data).in_("id", chunk),
+        )
+        return len(updated)
+
     async def delete_assignment(self, assignment_id: str) -> bool:
-        result = (
+        result = await self._client.execute(
             self._client.table("assignments")
             .delete()
             .eq("id", assignment_id)
-            .execute()
         )
         return len(result.data) > 0
+
+    async def delete_assignments_bulk(self, assignment_ids: list[str]) -> int:
+        deleted = await execute_chunked(
+            self._client, assignment_ids, IN_FILTER_CHUNK_SIZE,
+            lambda chunk: self._client.table("assignments").delete().in_("id", chunk),
+        )
+        return len(deleted)
+
+
+def _date_range(filters: dict | None, start_date: str | None, end_date: str | None):
+    def where(query):
+        if filters:
+            query = query.match(filters)
+        if start_date:
+            query = query.gte("date", start_date)
+        if end_date:
+            query = query.lte("date", end_date)
+        return query
+    return where
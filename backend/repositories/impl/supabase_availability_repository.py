@@ -9,63 +9,57 @@ class SupabaseAvailabilityRepository(AvailabilityRepository):
         self._client = client
 
     async def list_by_instructor(self, instructor_id: str) -> list[dict]:
-        result = (
+        result = await self._client.execute(
             self._client.table("availability")
             .select("*")
             .eq("instructor_id", instructor_id)
-            .execute()
         )
         return result.data
 
     async def list_by_date_range(self, start_date: str, end_date: str) -> list[dict]:
-        result = (
+        result = await self._client.execute(
             self._client.table("availability")
             .select("*")
             .gte("date", start_date)
             .lte("date", end_date)
-            .execute()
         )
         return result.data
 
     async def list_by_instructor_and_date_range(
         self, instructor_id: str, start_date: str, end_date: str,
     ) -> list[dict]:
-        result = (
+        result = await self._client.execute(
             self._client.table("availability")
             .select("*")
             .eq("instructor_id", instructor_id)
             .gte("date", start_date)
             .lte("date", end_date)
-            .execute()
         )
         return result.data
 
     async def create(self, data: dict) -> dict:
-        result = self._client.table("availability").insert(data).execute()
+        result = await self._client.execute(self._client.table("availability").insert(data))
         return result.data[0]
 
     async def upsert(self, data: dict) -> dict:
-        result = (
+        result = await self._client.execute(
             self._client.table("availability")
             .upsert(data, on_conflict="instructor_id,date")
-            .execute()
         )
         return result.data[0]
 
     async def update(self, availability_id: str, data: dict) -> dict | None:
-        result = (
+        result = await self._client.execute(
             self._client.table("availability")
             .update(data)
             .eq("id", availability_id)
-            .execute()
         )
         return result.data[0] if result.data else None
 
     async def delete(self, availability_id: str) -> bool:
-        result = (
+        result = await self._client.execute(
             self._client.table("availability")
             .delete()
             .eq("id", availability_id)
-            .execute()
         )
         return len(result.data) > 0
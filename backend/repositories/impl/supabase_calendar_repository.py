@@ -0,0 +1,25 @@
+from clients.supabase_client import SupabaseClient
+from repositories.calendar_repository import CalendarRepository
+from repositories.impl.supabase_paging import fetch_all
+
+# CalendarEvent에 필요한 컬럼만 (calendar_events 뷰, 010 마이그레이션)
+_EVENT_COLUMNS = (
+    "date", "instructor_id", "instructor_name", "course_id", "course_title",
+    "course_status", "assignment_status", "class_name", "assignment_id", "notion_page_id",
+    "workbook_full_url", "manager", "manager_email", "sales_rep", "sales_rep_email",
+)
+# 서버 행 상한(max-rows)을 넘는 기간도 빠짐없이 읽도록 keyset으로 나눠 조회
+_EVENT_KEYS = ("date", "assignment_id")
+
+
+class SupabaseCalendarRepository(CalendarRepository):
+    """Supabase calendar_events 뷰 기반 캘린더 조회 (조인은 DB에서 한 번에)"""
+
+    def __init__(self, client: SupabaseClient):
+        self._client = client
+
+    async def list_events(self, start_date: str, end_date: str) -> list[dict]:
+        return await fetch_all(
+            self._client, "calendar_events", _EVENT_KEYS,
+            columns=_EVENT_COLUMNS, where=lambda q: q.gte("date", start_date).lte("date", end_date),
+        )
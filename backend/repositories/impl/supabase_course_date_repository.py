@@ -1,5 +1,7 @@
 from repositories.course_date_repository import CourseDateRepository
 from clients.supabase_client import SupabaseClient
+from repositories.impl.supabase_paging import BULK_CHUNK_SIZE, IN_FILTER_CHUNK_SIZE, execute_chunked, fetch_all
+from repositories.projection import Columns, select_clause
 
 
 class SupabaseCourseDateRepository(CourseDateRepository):
@@ -8,35 +10,43 @@ class SupabaseCourseDateRepository(CourseDateRepository):
     def __init__(self, client: SupabaseClient):
         self._client = client
 
-    async def list_dates_by_course(self, course_id: str) -> list[dict]:
-        result = (
+    async def list_dates_by_course(self, course_id: str, columns: Columns = None) -> list[dict]:
+        result = await self._client.execute(
             self._client.table("course_dates")
-            .select("*")
+            .select(select_clause(columns))
             .eq("course_id", course_id)
             .order("date")
-            .execute()
         )
         return result.data
 
-    async def list_all_dates(self) -> list[dict]:
-        result = (
-            self._client.table("course_dates")
-            .select("*")
-            .order("date")
-            .execute()
-        )
-        return result.data
+    async def list_all_dates(self, columns: Columns = None) -> list[dict]:
+        # 서버 max-rows에 잘리지 않게 (date, id) 순으로 나눠 읽음
+        return await fetch_all(self._client, "course_dates", ("date", "id"), columns=columns)
 
     async def create_dates(self, course_id: str, dates: list[dict]) -> list[dict]:
         rows = [{"course_id": course_id, **d} for d in dates]
-        result = self._client.table("course_dates").insert(rows).execute()
+        result = await self._client.execute(self._client.table("course_dates").insert(rows))
         return result.data
 
+    async def upsert_dates_bulk(self, rows: list[dict]) -> list[dict]:
+        # 같은 요청 안에 (course_id, date)가 중복되면 ON CONFLICT 오류 → 마지막 값만 유지
+        unique_rows = list({(r["course_id"], r["date"]): r for r in rows}.values())
+        return await execute_chunked(
+            self._client, unique_rows, BULK_CHUNK_SIZE,
+            lambda chunk: self._client.table("course_dates").upsert(chunk, on_conflict="course_id,date"),
+        )
+
     async def delete_date(self, date_id: str) -> bool:
-        result = (
+        result = await self._client.execute(
             self._client.table("course_dates")
             .delete()
             .eq("id", date_id)
-            .execute()
         )
         return len(result.data) > 0
+
+    async def delete_dates_bulk(self, date_ids: list[str]) -> int:
+        deleted = await execute_chunked(
+            self._client, date_ids, IN_FILTER_CHUNK_SIZE,
+            lambda chunk: self._client.table("course_dates").delete().in_("id", chunk),
+        )
+        return len(deleted)
@@ -1,5 +1,13 @@
 from repositories.course_repository import CourseRepository
 from clients.supabase_client import SupabaseClient
+from repositories.impl.supabase_paging import (
+    BULK_CHUNK_SIZE, IN_FILTER_CHUNK_SIZE, execute_chunked, fetch_all, fetch_page, where_eq,
+)
+from repositories.pagination import Page
+from repositories.projection import Columns
+
+# 목록 정렬 (keyset) 키
+_LIST_KEYS = ("id",)
 
 
 class SupabaseCourseRepository(CourseRepository):
@@ -8,49 +16,64 @@ class SupabaseCourseRepository(CourseRepository):
     def __init__(self, client: SupabaseClient):
         self._client = client
 
-    async def list_courses(self, filters: dict | None = None) -> list[dict]:
-        query = self._client.table("courses").select("*")
-        if filters:
-            for key, value in filters.items():
-                query = query.eq(key, value)
-        result = query.execute()
-        return result.data
+    async def list_courses(self, filters: dict | None = None, columns: Columns = None) -> list[dict]:
+        return await fetch_all(self._client, "courses", _LIST_KEYS, columns=columns, where=where_eq(filters))
+
+    async def list_courses_page(
+        self, filters: dict | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        return await fetch_page(
+            self._client, "courses", _LIST_KEYS,
+            where=where_eq(filters), limit=limit, cursor=cursor, count=count,
+        )
 
     async def get_course(self, course_id: str) -> dict | None:
-        result = (
+        result = await self._client.execute(
             self._client.table("courses")
             .select("*")
             .eq("id", course_id)
-            .execute()
         )
         return result.data[0] if result.data else None
 
     async def create_course(self, data: dict) -> dict:
-        result = self._client.table("courses").insert(data).execute()
+        result = await self._client.execute(self._client.table("courses").insert(data))
         return result.data[0]
 
     async def update_course(self, course_id: str, data: dict) -> dict:
-        result = (
+        result = await self._client.execute(
             self._client.table("courses")
             .update(data)
             .eq("id", course_id)
-            .execute()
         )
         return result.data[0]
 
+    async def update_courses_bulk(self, course_ids: list[str], data: dict) -> int:
+        updated = await execute_chunked(
+            self._client, course_ids, IN_FILTER_CHUNK_SIZE,
+            lambda chunk: self._client.table("courses").update(data).in_("id", chunk),
+        )
+        return len(updated)
+
     async def delete_course(self, course_id: str) -> bool:
-        result = (
+        result = await self._client.execute(
             self._client.table("courses")
             .delete()
             .eq("id", course_id)
-            .execute()
         )
         return len(result.data) > 0
 
     async def upsert_course(self, data: dict) -> dict:
-        result = (
+        result = await self._client.execute(
             self._client.table("courses")
             .upsert(data, on_conflict="notion_page_id")
-            .execute()
         )
         return result.data[0]
+
+    async def upsert_courses_bulk(self, rows: list[dict]) -> dict[str, str]:
+        # 같은 요청 안에 notion_page_id가 중복되면 ON CONFLICT 오류 → 마지막 값만 유지
+        unique_rows = list({r["notion_page_id"]: r for r in rows}.values())
+        upserted = await execute_chunked(
+            self._client, unique_rows, BULK_CHUNK_SIZE,
+            lambda chunk: self._client.table("courses").upsert(chunk, on_conflict="notion_page_id"),
+        )
+        return {r["notion_page_id"]: r["id"] for r in upserted}
@@ -1,5 +1,11 @@
 from repositories.instructor_repository import InstructorRepository
 from clients.supabase_client import SupabaseClient
+from repositories.impl.supabase_paging import BULK_CHUNK_SIZE, execute_chunked, fetch_all, fetch_page
+from repositories.pagination import Page
+from repositories.projection import Columns
+
+# 목록 정렬 (keyset) 키
+_LIST_KEYS = ("id",)
 
 
 class SupabaseInstructorRepository(InstructorRepository):
@@ -8,48 +14,63 @@ class SupabaseInstructorRepository(InstructorRepository):
     def __init__(self, client: SupabaseClient):
         self._client = client
 
-    async def list_instructors(self, is_active: bool | None = None) -> list[dict]:
-        query = self._client.table("instructors").select("*")
-        if is_active is not None:
-            query = query.eq("is_active", is_active)
-        result = query.execute()
-        return result.data
+    async def list_instructors(self, is_active: bool | None = None, columns: Columns = None) -> list[dict]:
+        return await fetch_all(self._client, "instructors", _LIST_KEYS, columns=columns, where=_active(is_active))
+
+    async def list_instructors_page(
+        self, is_active: bool | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        return await fetch_page(
+            self._client, "instructors", _LIST_KEYS,
+            where=_active(is_active), limit=limit, cursor=cursor, count=count,
+        )
 
     async def get_instructor(self, instructor_id: str) -> dict | None:
-        result = (
+        result = await self._client.execute(
             self._client.table("instructors")
             .select("*")
             .eq("id", instructor_id)
-            .execute()
         )
         return result.data[0] if result.data else None
 
     async def create_instructor(self, data: dict) -> dict:
-        result = self._client.table("instructors").insert(data).execute()
+        result = await self._client.execute(self._client.table("instructors").insert(data))
         return result.data[0]
 
     async def update_instructor(self, instructor_id: str, data: dict) -> dict:
-        result = (
+        result = await self._client.execute(
             self._client.table("instructors")
             .update(data)
             .eq("id", instructor_id)
-            .execute()
         )
         return result.data[0]
 
     async def delete_instructor(self, instructor_id: str) -> bool:
-        result = (
+        result = await self._client.execute(
             self._client.table("instructors")
             .delete()
             .eq("id", instructor_id)
-            .execute()
         )
         return len(result.data) > 0
 
     async def upsert_instructor(self, data: dict) -> dict:
-        result = (
+        result = await self._client.execute(
             self._client.table("instructors")
             .upsert(data, on_conflict="notion_page_id")
-            .execute()
         )
         return result.data[0]
+
+    async def upsert_instructors_bulk(self, rows: list[dict]) -> dict[str, str]:
+        # 같은 요청 안에 notion_page_id가 중복되면 ON CONFLICT 오류 → 마지막 값만 유지
+        unique_rows = list({r["notion_page_id"]: r for r in rows}.values())
+        upserted = await execute_chunked(
+            self._client, unique_rows, BULK_CHUNK_SIZE,
+            lambda chunk: self._client.table("instructors").upsert(chunk, on_conflict="notion_page_id"),
+        )
+        return {r["notion_page_id"]: r["id"] for r in upserted}
+
+
+def _active(is_active: bool | None):
+    if is_active is None:
+        return None
+    return lambda query: query.eq("is_active", is_active)
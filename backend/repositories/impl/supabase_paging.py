@@ -0,0 +1,129 @@
+"""Supabase(PostgREST) keyset 조회 + 일괄 쓰기 청크.
+
+PostgREST는 서버 max-rows(Supabase 기본 1000)를 넘는 행을 조용히 잘라낸다.
+전체가 필요한 조회도 fetch_all()로 정렬 키 순서대로 나눠 읽어 누락이 없게 한다.
+일괄 upsert/update/delete는 execute_chunked()로 요청 크기 한도 안에서 나눠 보낸다.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from postgrest import CountMethod
+
+from clients.supabase_client import SupabaseClient
+from repositories.pagination import Page, cursor_values, decode_cursor, encode_cursor
+from repositories.projection import Columns, select_clause
+
+# 나눠 읽을 때 한 요청의 행 수 (서버 max-rows 이하여야 함)
+_FETCH_CHUNK_SIZE = 1000
+# 한 번의 PostgREST 요청에 담을 최대 행 수
+BULK_CHUNK_SIZE = 500
+# id=in.(...) 필터 한 번에 담을 최대 id 수 (URL 길이 제한)
+IN_FILTER_CHUNK_SIZE = 200
+
+# 쿼리에 필터를 거는 함수. 페이지 조회와 count 조회에 같은 조건을 건다
+Where = Callable[[Any], Any] | None
+
+
+def where_eq(filters: dict | None) -> Where:
+    """{컬럼: 값} 일치 필터"""
+    if not filters:
+        return None
+    return lambda query: query.match(filters)
+
+
+async def fetch_page(
+    client: SupabaseClient,
+    table: str,
+    keys: Sequence[str],
+    *,
+    columns: Columns = None,
+    where: Where = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    count: bool = False,
+) -> Page:
+    """keys 순서로 cursor 이후 limit행. limit=None이면 나머지 전부를 나눠 읽는다."""
+    after = decode_cursor(cursor, keys) if cursor else None
+    if columns:
+        columns = (*columns, *(k for k in keys if k not in columns))
+    total = await _count(client, table, where) if count else None
+
+    if limit is not None and limit < _FETCH_CHUNK_SIZE:
+        # 한 행 더 읽어 다음 페이지 여부 확인
+        rows = await _fetch_after(client, table, keys, columns, where, after, limit + 1)
+        if len(rows) <= limit:
+            return Page(rows, None, total)
+        return Page(rows[:limit], encode_cursor(rows[limit - 1], keys), total)
+
+    rows: list[dict] = []
+    while limit is None or len(rows) < limit:
+        size = _FETCH_CHUNK_SIZE if limit is None else min(_FETCH_CHUNK_SIZE, limit - len(rows))
+        chunk = await _fetch_after(client, table, keys, columns, where, after, size)
+        rows.extend(chunk)
+        if len(chunk) < size:
+            return Page(rows, None, total)
+        after = cursor_values(chunk[-1], keys)
+    # limit을 꽉 채움: 다음 페이지가 비어 있을 수도 있지만 추가 요청 없이 cursor를 준다
+    return Page(rows, encode_cursor(rows[-1], keys), total)
+
+
+async def fetch_all(
+    client: SupabaseClient, table: str, keys: Sequence[str], *, columns: Columns = None, where: Where = None,
+) -> list[dict]:
+    return (await fetch_page(client, table, keys, columns=columns, where=where)).items
+
+
+async def execute_chunked(
+    client: SupabaseClient, items: Sequence, size: int, build: Callable[[Sequence], Any],
+) -> list[dict]:
+    """items를 size개씩 나눠 build(chunk)로 만든 쿼리를 차례로 실행하고 응답 행을 모은다."""
+    rows: list[dict] = []
+    for i in range(0, len(items), size):
+        result = await client.execute(build(items[i:i + size]))
+        rows.extend(result.data)
+    return rows
+
+
+async def _fetch_after(
+    client: SupabaseClient,
+    table: str,
+    keys: Sequence[str],
+    columns: Columns,
+    where: Where,
+    after: list[str] | None,
+    size: int,
+) -> list[dict]:
+    query = client.table(table).select(select_clause(columns))
+    if where:
+        query = where(query)
+    if after:
+        query = query.or_(_keyset_filter(keys, after))
+    for key in keys:
+        query = query.order(key)
+    result = await client.execute(query.limit(size))
+    return result.data
+
+
+async def _count(client: SupabaseClient, table: str, where: Where) -> int:
+    query = client.table(table).select("id", count=CountMethod.exact, head=True)
+    if where:
+        query = where(query)
+    result = await client.execute(query)
+    return result.count or 0
+
+
+def _keyset_filter(keys: Sequence[str], values: Sequence[str]) -> str:
+    """(k1, k2, ...) > (v1, v2, ...) → PostgREST or 필터 본문"""
+    clauses = []
+    for i, key in enumerate(keys):
+        conditions = [f"{k}.eq.{_quote(v)}" for k, v in zip(keys[:i], values[:i])]
+        conditions.append(f"{key}.gt.{_quote(values[i])}")
+        clauses.append(conditions[0] if i == 0 else f"and({','.join(conditions)})")
+    return ",".join(clauses)
+
+
+def _quote(value: str) -> str:
+    # 쉼표·괄호가 들어 있어도 필터 문법이 깨지지 않게
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
@@ -0,0 +1,22 @@
+from clients.supabase_client import SupabaseClient
+from repositories.sync_run_repository import SyncRunRepository
+
+
+class SupabaseSyncRunRepository(SyncRunRepository):
+    """Supabase sync_runs 테이블 기반 동기화 이력 저장소"""
+
+    def __init__(self, client: SupabaseClient):
+        self._client = client
+
+    async def create_run(self, data: dict) -> dict:
+        result = await self._client.execute(self._client.table("sync_runs").insert(data))
+        return result.data[0]
+
+    async def list_runs(self, limit: int = 50) -> list[dict]:
+        result = await self._client.execute(
+            self._client.table("sync_runs")
+            .select("*")
+            .order("started_at", desc=True)
+            .limit(limit)
+        )
+        return result.data
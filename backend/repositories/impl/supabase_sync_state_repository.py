@@ -0,0 +1,27 @@
+from clients.supabase_client import SupabaseClient
+from repositories.sync_state_repository import SyncStateRepository
+
+
+class SupabaseSyncStateRepository(SyncStateRepository):
+    """Supabase sync_state 테이블 기반 동기화 상태 저장소"""
+
+    def __init__(self, client: SupabaseClient):
+        self._client = client
+
+    async def get_state(self, key: str) -> dict | None:
+        result = await self._client.execute(
+            self._client.table("sync_state")
+            .select("value")
+            .eq("key", key)
+        )
+        return result.data[0]["value"] if result.data else None
+
+    async def set_state(self, key: str, value: dict) -> None:
+        await self._client.execute(
+            self._client.table("sync_state").upsert(
+                {"key": key, "value": value}, on_conflict="key"
+            )
+        )
+
+    async def delete_state(self, key: str) -> None:
+        await self._client.execute(self._client.table("sync_state").delete().eq("key", key))
@@ -1,11 +1,22 @@
 from abc import ABC, abstractmethod
 
+from repositories.pagination import Page
+from repositories.projection import Columns
+
 
 class InstructorRepository(ABC):
     """강사 관리 인터페이스"""
 
     @abstractmethod
-    async def list_instructors(self, is_active: bool | None = None) -> list[dict]:
+    async def list_instructors(self, is_active: bool | None = None, columns: Columns = None) -> list[dict]:
+        """columns: 가져올 컬럼 (None이면 전체)"""
+        ...
+
+    @abstractmethod
+    async def list_instructors_page(
+        self, is_active: bool | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        """id 순 keyset 페이지 (limit=None이면 cursor 이후 전부, count=True면 전체 수 포함)"""
         ...
 
     @abstractmethod
@@ -27,3 +38,8 @@ class InstructorRepository(ABC):
     @abstractmethod
     async def upsert_instructor(self, data: dict) -> dict:
         ...
+
+    @abstractmethod
+    async def upsert_instructors_bulk(self, rows: list[dict]) -> dict[str, str]:
+        """notion_page_id 기준 일괄 upsert. notion_page_id → id 매핑 반환."""
+        ...
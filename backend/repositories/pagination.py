@@ -0,0 +1,64 @@
+"""목록 조회 keyset 페이지네이션.
+
+정렬 키(마지막은 항상 id) 값을 cursor로 인코딩하고, 다음 페이지는 그 값 '이후' 행부터 읽는다.
+offset과 달리 뒤 페이지로 갈수록 느려지지 않고, 사이에 행이 추가/삭제돼도 중복·누락이 없다.
+"""
+
+import base64
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from exceptions import InvalidCursorError
+
+
+@dataclass
+class Page:
+    items: list[dict]
+    # 다음 페이지가 있을 때만
+    next_cursor: str | None = None
+    # count=True로 요청했을 때만: 필터에 맞는 전체 행 수 (cursor 무관)
+    total: int | None = None
+
+    def headers(self) -> dict[str, str]:
+        """목록 API 응답 헤더 (본문은 items 배열 그대로)"""
+        headers = {}
+        if self.next_cursor:
+            headers["X-Next-Cursor"] = self.next_cursor
+        if self.total is not None:
+            headers["X-Total-Count"] = str(self.total)
+        return headers
+
+
+def cursor_values(row: dict, keys: Sequence[str]) -> list[str]:
+    return [str(row[k]) for k in keys]
+
+
+def encode_cursor(row: dict, keys: Sequence[str]) -> str:
+    raw = json.dumps(cursor_values(row, keys), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[str]) -> list[str]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise InvalidCursorError(cursor) from e
+    if not isinstance(values, list) or len(values) != len(keys) or not all(isinstance(v, str) for v in values):
+        raise InvalidCursorError(cursor)
+    return values
+
+
+def paginate(
+    rows: Iterable[dict], keys: Sequence[str], limit: int | None, cursor: str | None = None, count: bool = False,
+) -> Page:
+    """메모리 저장소용 (fake 등): 정렬 → cursor 이후 → limit. limit=None이면 나머지 전부."""
+    ordered = sorted(rows, key=lambda r: cursor_values(r, keys))
+    total = len(ordered) if count else None
+    if cursor:
+        after = decode_cursor(cursor, keys)
+        ordered = [r for r in ordered if cursor_values(r, keys) > after]
+    if limit is None or len(ordered) <= limit:
+        return Page(ordered, None, total)
+    items = ordered[:limit]
+    return Page(items, encode_cursor(items[-1], keys), total)
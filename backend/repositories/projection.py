@@ -0,0 +1,20 @@
+"""조회 컬럼 지정 (projection).
+
+목록 조회 메서드는 columns를 받아 필요한 컬럼만 가져온다. None이면 전체(select("*")).
+"""
+
+from collections.abc import Iterable, Sequence
+
+Columns = Sequence[str] | None
+
+
+def select_clause(columns: Columns) -> str:
+    """PostgREST select 인자"""
+    return ",".join(columns) if columns else "*"
+
+
+def project(rows: Iterable[dict], columns: Columns) -> list[dict]:
+    """메모리 저장소용: 행을 지정 컬럼으로 자른다 (없는 컬럼은 PostgREST처럼 None)."""
+    if not columns:
+        return list(rows)
+    return [{c: row.get(c) for c in columns} for row in rows]
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+
+class SyncRunRepository(ABC):
+    """동기화 실행 이력 저장소 인터페이스"""
+
+    @abstractmethod
+    async def create_run(self, data: dict) -> dict:
+        ...
+
+    @abstractmethod
+    async def list_runs(self, limit: int = 50) -> list[dict]:
+        """최근 실행부터"""
+        ...
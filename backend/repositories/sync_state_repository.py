@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class SyncStateRepository(ABC):
+    """동기화 상태(watermark 등) key-value 저장소 인터페이스"""
+
+    @abstractmethod
+    async def get_state(self, key: str) -> dict | None:
+        ...
+
+    @abstractmethod
+    async def set_state(self, key: str, value: dict) -> None:
+        ...
+
+    @abstractmethod
+    async def delete_state(self, key: str) -> None:
+        ...
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, Response
 from fastapi.responses import JSONResponse
 
 from dependencies import get_assignment_service, get_current_user, require_admin
@@ -12,10 +14,25 @@ router = APIRouter(prefix="/assignments", tags=["assignments"])
 
 @router.get("", response_model=list[AssignmentResponse])
 async def list_assignments(
+    response: Response,
+    instructor_id: str | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = None,
+    count: bool = False,
     _user: UserProfile = Depends(get_current_user),
     service: AssignmentService = Depends(get_assignment_service),
 ):
-    return await service.list_assignments()
+    """limit을 주면 (date, id) 순 keyset 페이지 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로)."""
+    page = await service.list_assignments(
+        {"instructor_id": instructor_id} if instructor_id else None,
+        start_date.isoformat() if start_date else None,
+        end_date.isoformat() if end_date else None,
+        limit=limit, cursor=cursor, count=count,
+    )
+    response.headers.update(page.headers())
+    return page.items
 
 
 @router.post("", response_model=AssignmentResponse, status_code=201)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
-from dependencies import get_course_service, get_notion_sync_service, get_current_user, require_admin
+from dependencies import get_course_service, get_notion_sync_service, get_sync_job_manager, get_current_user, require_admin
 from schemas.auth import UserProfile
+from schemas.sync import SyncJobResponse
 from schemas.course import (
     CourseCreate,
     CourseUpdate,
@@ -11,24 +12,40 @@ from schemas.course import (
 )
 from services.course_service import CourseService
 from services.notion_sync_service import NotionSyncService
+from services.sync_job_service import SyncJobManager
 
 router = APIRouter(prefix="/courses", tags=["courses"])
 
 
-@router.post("/sync", response_model=CourseSyncResultResponse)
+@router.post("/sync", response_model=SyncJobResponse, status_code=202)
 async def sync_courses(
+    full: bool = False,
     _admin: UserProfile = Depends(require_admin),
     service: NotionSyncService = Depends(get_notion_sync_service),
+    jobs: SyncJobManager = Depends(get_sync_job_manager),
 ):
-    return await service.sync_courses_and_schedules()
+    job, created = jobs.start(
+        "courses", full, lambda progress: service.sync_courses_and_schedules(full=full, progress=progress),
+    )
+    return SyncJobResponse.model_validate(job).model_copy(update={"attached": not created})
 
 
 @router.get("", response_model=list[CourseResponse])
 async def list_courses(
+    response: Response,
+    status: str | None = None,
+    assignment_status: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = None,
+    count: bool = False,
     _user: UserProfile = Depends(get_current_user),
     service: CourseService = Depends(get_course_service),
 ):
-    return await service.list_courses()
+    """limit을 주면 keyset 페이지 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로)."""
+    filters = {k: v for k, v in (("status", status), ("assignment_status", assignment_status)) if v is not None}
+    page = await service.list_courses(filters, limit=limit, cursor=cursor, count=count)
+    response.headers.update(page.headers())
+    return page.items
 
 
 @router.get("/{course_id}", response_model=CourseDetailResponse)
@@ -49,6 +66,25 @@ async def create_course(
     return await service.create_course(data)
 
 
+@router.post("/{course_id}/sync", response_model=CourseSyncResultResponse)
+async def sync_course(
+    course_id: str,
+    _admin: UserProfile = Depends(require_admin),
+    service: NotionSyncService = Depends(get_notion_sync_service),
+    jobs: SyncJobManager = Depends(get_sync_job_manager),
+):
+    """강의 1건 동기화. 다른 동기화와 겹치지 않도록 작업 관리자를 거친다 (실행 중이면 409)."""
+    job, _ = jobs.start(
+        f"course:{course_id}", False, lambda progress: service.sync_course(course_id, progress=progress),
+    )
+    job = await jobs.wait(job.id)
+    if job.exception is not None:
+        raise job.exception
+    if job.status != "succeeded":
+        raise HTTPException(status_code=503, detail=f"동기화가 중단되었습니다: {job.error}")
+    return job.result
+
+
 @router.put("/{course_id}", response_model=CourseResponse)
 async def update_course(
     course_id: str,
@@ -1,29 +1,37 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
 from dependencies import (
     get_instructor_service,
     get_assignment_service,
     get_instructor_course_service,
     get_notion_sync_service,
+    get_sync_job_manager,
     get_current_user,
     require_admin,
 )
 from schemas.auth import UserProfile
-from schemas.instructor import InstructorCreate, InstructorUpdate, InstructorResponse, InstructorSyncResultResponse
+from schemas.sync import SyncJobResponse
+from schemas.instructor import InstructorCreate, InstructorUpdate, InstructorResponse
 from services.instructor_service import InstructorService
 from services.assignment_service import AssignmentService
 from services.instructor_course_service import InstructorCourseService
 from services.notion_sync_service import NotionSyncService
+from services.sync_job_service import SyncJobManager
 
 router = APIRouter(prefix="/instructors", tags=["instructors"])
 
 
-@router.post("/sync", response_model=InstructorSyncResultResponse)
+@router.post("/sync", response_model=SyncJobResponse, status_code=202)
 async def sync_instructors(
+    full: bool = False,
     _admin: UserProfile = Depends(require_admin),
     service: NotionSyncService = Depends(get_notion_sync_service),
+    jobs: SyncJobManager = Depends(get_sync_job_manager),
 ):
-    return await service.sync_tutors()
+    job, created = jobs.start(
+        "tutors", full, lambda progress: service.sync_tutors(full=full, progress=progress),
+    )
+    return SyncJobResponse.model_validate(job).model_copy(update={"attached": not created})
 
 
 @router.get("/available", response_model=list[InstructorResponse])
@@ -37,11 +45,18 @@ async def get_available_instructors(
 
 @router.get("", response_model=list[InstructorResponse])
 async def list_instructors(
+    response: Response,
     is_active: bool | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = None,
+    count: bool = False,
     _user: UserProfile = Depends(get_current_user),
     service: InstructorService = Depends(get_instructor_service),
 ):
-    return await service.list_instructors(is_active=is_active)
+    """limit을 주면 keyset 페이지 (다음 페이지는 X-Next-Cursor 헤더 값을 cursor로)."""
+    page = await service.list_instructors(is_active, limit=limit, cursor=cursor, count=count)
+    response.headers.update(page.headers())
+    return page.items
 
 
 @router.get("/{instructor_id}", response_model=InstructorResponse)
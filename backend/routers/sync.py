@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from dependencies import (
+    get_notion_sync_service,
+    get_sync_job_manager,
+    get_sync_run_repository,
+    require_admin,
+)
+from schemas.auth import UserProfile
+from repositories.sync_run_repository import SyncRunRepository
+from schemas.sync import SyncJobResponse, SyncRunResponse
+from services.notion_sync_service import NotionSyncService
+from services.sync_job_service import SyncJobManager
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.post("/dry-run", response_model=SyncJobResponse, status_code=202)
+async def dry_run_sync(
+    _admin: UserProfile = Depends(require_admin),
+    service: NotionSyncService = Depends(get_notion_sync_service),
+    jobs: SyncJobManager = Depends(get_sync_job_manager),
+):
+    """전체 동기화 시 바뀔 내용을 쓰기 없이 계산. 결과는 테이블별 변경 건수."""
+    job, created = jobs.start(
+        "dry_run", True, lambda progress: service.sync_all(progress=progress, dry_run=True),
+    )
+    return SyncJobResponse.model_validate(job).model_copy(update={"attached": not created})
+
+
+@router.get("/jobs", response_model=list[SyncJobResponse])
+async def list_sync_jobs(
+    _admin: UserProfile = Depends(require_admin),
+    jobs: SyncJobManager = Depends(get_sync_job_manager),
+):
+    return jobs.list_jobs()
+
+
+@router.get("/jobs/{job_id}", response_model=SyncJobResponse)
+async def get_sync_job(
+    job_id: str,
+    _admin: UserProfile = Depends(require_admin),
+    jobs: SyncJobManager = Depends(get_sync_job_manager),
+):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="동기화 작업을 찾을 수 없습니다")
+    return job
+
+
+@router.get("/runs", response_model=list[SyncRunResponse])
+async def list_sync_runs(
+    limit: int = Query(50, ge=1, le=500),
+    _admin: UserProfile = Depends(require_admin),
+    repo: SyncRunRepository = Depends(get_sync_run_repository),
+):
+    """저장된 동기화 실행 이력 (최근 실행부터). 단계별 소요 시간, Notion 요청 수, 테이블별 행 수 포함."""
+    return await repo.list_runs(limit)
+
+
+@router.get("/supabase-pool")
+async def get_supabase_pool(
+    request: Request,
+    _admin: UserProfile = Depends(require_admin),
+):
+    """공유 Supabase 클라이언트의 누적 호출 수와 현재 커넥션 풀 상태."""
+    supabase = getattr(request.app.state, "supabase", None)
+    if supabase is None:
+        raise HTTPException(status_code=404, detail="Supabase 클라이언트를 사용하지 않는 서버입니다")
+    return supabase.pool_metrics()
@@ -0,0 +1,66 @@
+import hashlib
+import hmac
+import json
+import logging
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+
+from config import settings
+from dependencies import get_notion_change_queue
+from exceptions import AuthenticationError
+from services.notion_change_queue import NotionChangeQueue
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/notion", tags=["webhooks"])
+
+
+@router.post("/webhook", status_code=202)
+async def notion_webhook(
+    request: Request,
+    x_notion_signature: str | None = Header(default=None),
+    queue: NotionChangeQueue = Depends(get_notion_change_queue),
+):
+    """Notion 웹훅 수신 → 변경된 페이지 id를 동기화 큐에 넣는다.
+
+    삭제(휴지통 이동)된 페이지는 동기화에서 건너뛰므로, 지워진 일정의 날짜/배정은
+    다음 full 동기화(또는 강의 단건 동기화)에서 정리된다.
+    """
+    body = await request.body()
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="JSON 본문이 아닙니다")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="JSON 객체가 아닙니다")
+
+    # 구독 생성 시 1회: verification_token을 NOTION_WEBHOOK_SECRET에 설정해야 이후 서명 검증이 된다.
+    # 토큰이 곧 서명 키이고 이 요청은 인증 전이므로 값은 로그에 남기지 않는다
+    if "verification_token" in payload:
+        logger.warning("Notion webhook verification request received")
+        return {"queued": 0}
+
+    _verify_signature(body, x_notion_signature)
+
+    entity = payload.get("entity") or {}
+    event_type = payload.get("type")
+    if not isinstance(entity, dict) or not isinstance(event_type, str):
+        raise HTTPException(status_code=400, detail="웹훅 이벤트 형식이 올바르지 않습니다")
+    if not event_type.startswith("page.") or entity.get("type") != "page":
+        return {"queued": 0}
+    page_id = entity.get("id")
+    if not isinstance(page_id, str) or not page_id:
+        raise HTTPException(status_code=400, detail="페이지 id가 없습니다")
+    queue.push(page_id)
+    return {"queued": 1}
+
+
+def _verify_signature(body: bytes, signature: str | None) -> None:
+    # 시크릿 없이 받으면 누구나 Notion 조회(요청 한도 소모)를 일으킬 수 있으므로 거부
+    if not settings.NOTION_WEBHOOK_SECRET:
+        raise AuthenticationError("NOTION_WEBHOOK_SECRET이 설정되지 않아 웹훅 이벤트를 받을 수 없습니다")
+    expected = "sha256=" + hmac.new(
+        settings.NOTION_WEBHOOK_SECRET.encode(), body, hashlib.sha256,
+    ).hexdigest()
+    if not signature or not hmac.compare_digest(expected, signature):
+        raise AuthenticationError("웹훅 서명이 올바르지 않습니다")
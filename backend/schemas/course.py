@@ -59,14 +59,13 @@ class SyncResultResponse(BaseModel):
     errors: int
 
 
-class FullSyncResultResponse(BaseModel):
-    tutors: int
-    courses: int
-    schedules: int
-    assignments: int
-
-
 class CourseSyncResultResponse(BaseModel):
     courses: int
     schedules: int
     assignments: int
+    schedules_updated: int = 0
+    schedules_skipped: int = 0
+    assignments_skipped: int = 0
+    # full 동기화/강의 1건 동기화에서 Notion에서 빠져 삭제된 행 수
+    schedules_deleted: int = 0
+    assignments_deleted: int = 0
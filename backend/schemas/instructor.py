@@ -27,7 +27,3 @@ class InstructorResponse(InstructorBase):
     id: str
 
     model_config = {"from_attributes": True}
-
-
-class InstructorSyncResultResponse(BaseModel):
-    tutors: int
@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SyncJobResponse(BaseModel):
+    id: str
+    kind: str
+    full: bool
+    status: str
+    phase: str | None = None
+    progress: dict[str, int] = {}
+    phase_seconds: dict[str, float] = {}
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    # 이미 실행 중인 작업에 합류한 경우 True
+    attached: bool = False
+
+    model_config = {"from_attributes": True}
+
+
+class SyncRunResponse(BaseModel):
+    id: str
+    kind: str
+    full: bool
+    dry_run: bool
+    status: str
+    error: str | None = None
+    started_at: datetime
+    finished_at: datetime | None = None
+    duration_seconds: float | None = None
+    phase_seconds: dict[str, float] = {}
+    notion_requests: int = 0
+    notion_pages: int = 0
+    db_calls: int = 0
+    rows: dict[str, dict[str, int]] = {}
+    errors: list[str] = []
@@ -3,7 +3,8 @@ from fastapi import HTTPException
 from repositories.assignment_repository import AssignmentRepository
 from repositories.instructor_repository import InstructorRepository
 from repositories.availability_repository import AvailabilityRepository
-from exceptions import DuplicateAssignmentError
+from exceptions import DuplicateAssignmentError, InvalidCursorError
+from repositories.pagination import Page
 from schemas.assignment import AssignmentCreate
 
 
@@ -18,8 +19,19 @@ class AssignmentService:
         self._instructor_repo = instructor_repo
         self._availability_repo = availability_repo
 
-    async def list_assignments(self, filters: dict | None = None) -> list[dict]:
-        return await self._repo.list_assignments(filters=filters)
+    async def list_assignments(
+        self,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        try:
+            return await self._repo.list_assignments_page(
+                filters, start_date, end_date, limit=limit, cursor=cursor, count=count,
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="cursor 값이 올바르지 않습니다")
 
     async def create_assignment(self, data: AssignmentCreate) -> dict:
         existing = await self._repo.list_assignments(
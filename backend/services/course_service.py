@@ -2,8 +2,10 @@ from datetime import timedelta
 
 from fastapi import HTTPException
 
+from exceptions import InvalidCursorError
 from repositories.course_repository import CourseRepository
 from repositories.course_date_repository import CourseDateRepository
+from repositories.pagination import Page
 from schemas.course import CourseCreate, CourseUpdate
 
 
@@ -16,8 +18,13 @@ class CourseService:
         self._repo = repository
         self._date_repo = date_repository
 
-    async def list_courses(self) -> list[dict]:
-        return await self._repo.list_courses()
+    async def list_courses(
+        self, filters: dict | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        try:
+            return await self._repo.list_courses_page(filters, limit=limit, cursor=cursor, count=count)
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="cursor 값이 올바르지 않습니다")
 
     async def get_course(self, course_id: str) -> dict:
         course = await self._repo.get_course(course_id)
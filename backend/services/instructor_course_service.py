@@ -5,6 +5,13 @@ from repositories.course_repository import CourseRepository
 from repositories.course_date_repository import CourseDateRepository
 
 
+# 응답 조합에 쓰는 컬럼만 조회
+_ASSIGNMENT_COLUMNS = ("course_date_id", "date", "class_name")
+_COURSE_DATE_COLUMNS = ("id", "course_id", "date", "day_number", "place", "start_time", "end_time")
+_COURSE_COLUMNS = (
+    "id", "title", "notion_page_id", "workbook_full_url", "status", "students", "lecture_start", "lecture_end",
+)
+
 CLASS_NAME_TO_ROLE = {
     "A반": "주강사",
     "B반": "주강사",
@@ -29,7 +36,7 @@ class InstructorCourseService:
         """강사에게 배정된 교육 목록을 페이지네이션으로 반환."""
         # 1. 해당 강사의 전체 assignment 조회
         all_assignments = await self._assignment_repo.list_assignments(
-            filters={"instructor_id": instructor_id}
+            filters={"instructor_id": instructor_id}, columns=_ASSIGNMENT_COLUMNS,
         )
         if not all_assignments:
             return {"items": [], "total": 0, "page": page, "page_size": page_size, "total_pages": 0}
@@ -37,7 +44,7 @@ class InstructorCourseService:
         cd_ids = {a["course_date_id"] for a in all_assignments}
 
         # 2. 전체 course_dates를 한 번에 조회 (N+1 제거)
-        all_dates = await self._course_date_repo.list_all_dates()
+        all_dates = await self._course_date_repo.list_all_dates(columns=_COURSE_DATE_COLUMNS)
         cd_to_course: dict[str, str] = {}
         cd_info: dict[str, dict] = {}
         dates_by_course: dict[str, list[dict]] = {}
@@ -50,7 +57,7 @@ class InstructorCourseService:
         course_id_set = set(cd_to_course.values())
 
         # 3. 필요한 course만 조회
-        all_courses = await self._course_repo.list_courses()
+        all_courses = await self._course_repo.list_courses(columns=_COURSE_COLUMNS)
         course_map = {c["id"]: c for c in all_courses}
 
         # 4. 고유 course별 데이터 조합
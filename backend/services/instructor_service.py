@@ -1,6 +1,8 @@
 from fastapi import HTTPException
 
+from exceptions import InvalidCursorError
 from repositories.instructor_repository import InstructorRepository
+from repositories.pagination import Page
 from schemas.instructor import InstructorCreate, InstructorUpdate
 
 
@@ -8,8 +10,13 @@ class InstructorService:
     def __init__(self, repository: InstructorRepository):
         self._repo = repository
 
-    async def list_instructors(self, is_active: bool | None = None) -> list[dict]:
-        return await self._repo.list_instructors(is_active=is_active)
+    async def list_instructors(
+        self, is_active: bool | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        try:
+            return await self._repo.list_instructors_page(is_active, limit=limit, cursor=cursor, count=count)
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="cursor 값이 올바르지 않습니다")
 
     async def get_instructor(self, instructor_id: str) -> dict:
         instructor = await self._repo.get_instructor(instructor_id)
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+ChangeHandler = Callable[[list[str]], Awaitable[object]]
+
+
+class NotionChangeQueue:
+    """웹훅으로 들어온 변경 페이지 id를 모았다가 한 번에 동기화한다.
+
+    - 같은 페이지 이벤트는 하나로 합친다 (중복 제거).
+    - 마지막 이벤트 후 debounce초 동안 조용해진 페이지만 꺼낸다. 연속 수정 중인
+      페이지도 첫 이벤트 후 max_delay초가 지나면 꺼낸다.
+    - 준비된 페이지는 한 번의 handler 호출로 처리한다.
+    앱 lifespan에서 start()하고 종료 시 stop()할 것.
+    """
+
+    def __init__(
+        self,
+        handler: ChangeHandler,
+        debounce: float,
+        max_delay: float | None = None,
+        clock=time.monotonic,
+    ):
+        self._handler = handler
+        self._debounce = debounce
+        self._max_delay = max(debounce, max_delay or debounce)
+        self._clock = clock
+        # page_id → (첫 이벤트 시각, 마지막 이벤트 시각)
+        self._pending: dict[str, tuple[float, float]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings, handler: ChangeHandler) -> "NotionChangeQueue":
+        return cls(
+            handler,
+            debounce=settings.NOTION_WEBHOOK_DEBOUNCE_SECONDS,
+            max_delay=settings.NOTION_WEBHOOK_MAX_DELAY_SECONDS,
+        )
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def push(self, page_id: str) -> None:
+        now = self._clock()
+        first, _ = self._pending.get(page_id, (now, now))
+        self._pending[page_id] = (first, now)
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def process_ready(self, force: bool = False) -> int:
+        """준비된(force면 전부) 페이지를 handler로 넘긴다. 넘긴 페이지 수 반환."""
+        now = self._clock()
+        ready = [
+            page_id for page_id, (first, last) in self._pending.items()
+            if force or now - last >= self._debounce or now - first >= self._max_delay
+        ]
+        if not ready:
+            return 0
+        for page_id in ready:
+            del self._pending[page_id]
+        try:
+            await self._handler(ready)
+        except Exception as e:
+            # 놓친 변경은 주기 동기화/전체 동기화가 다시 맞춘다
+            logger.warning("webhook batch (%d pages) failed: %s", len(ready), e)
+        return len(ready)
+
+    def _next_due(self) -> float:
+        now = self._clock()
+        return max(0.0, min(
+            min(last + self._debounce, first + self._max_delay) - now
+            for first, last in self._pending.values()
+        ))
+
+    async def _loop(self) -> None:
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await asyncio.sleep(self._next_due())
+            await self.process_ready()
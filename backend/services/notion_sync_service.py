@@ -4,12 +4,95 @@ Notion이 유일한 외부 의존성. 나중에 Notion을 제거할 때는
 이 서비스와 NotionClient만 삭제하면 됨.
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+
 from clients.notion_client import NotionClient
+from clients.notion_schema import CompiledParser, LectureRecord, ScheduleRecord, TutorRecord, compile_parser
 from config import Settings
+from exceptions import NotionSchemaError
 from repositories.instructor_repository import InstructorRepository
 from repositories.course_repository import CourseRepository
 from repositories.course_date_repository import CourseDateRepository
 from repositories.assignment_repository import AssignmentRepository
+from repositories.sync_run_repository import SyncRunRepository
+from repositories.sync_state_repository import SyncStateRepository
+from services.sync_metrics import InstrumentedRepository, SyncRunMetrics
+from services.sync_diff import (
+    ASSIGNMENT_COLUMNS,
+    ASSIGNMENT_FIELDS,
+    COURSE_COLUMNS,
+    COURSE_DATE_COLUMNS,
+    COURSE_DATE_FIELDS,
+    COURSE_FIELDS,
+    INSTRUCTOR_COLUMNS,
+    INSTRUCTOR_FIELDS,
+    DiffIndex,
+    DiffReport,
+    IdMap,
+    TableDiff,
+    assignment_key,
+    course_date_key,
+    page_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# delta 동기화 watermark 여유분 (Notion last_edited_time은 분 단위 + 서버 시계 오차)
+_WATERMARK_MARGIN = timedelta(minutes=2)
+
+_END_OF_STREAM = object()
+
+# 프로세스 풀 파싱 시 워커 하나에 보낼 최소 페이지 수 (너무 잘게 나누면 pickle 비용이 더 큼)
+_MIN_PARSE_CHUNK = 25
+
+# 배정 반 이름 (모든 배정 행이 같은 문자열 객체를 공유)
+_MAIN_CLASS = sys.intern("A반")
+_TECH_CLASS = sys.intern("기술지원")
+# 일정의 강사 relation 필드 → 그 강사로 만드는 배정 반 (main_tutor는 A반, tech_tutor는 기술지원)
+_ASSIGNMENT_SOURCES = (("main_tutor_ids", _MAIN_CLASS), ("tech_tutor_ids", _TECH_CLASS))
+
+# 일정 동기화 결과 건수 키
+_SCHEDULE_COUNT_KEYS = (
+    "schedules", "schedules_updated", "schedules_skipped", "schedules_deleted",
+    "assignments", "assignments_skipped", "assignments_deleted",
+)
+
+# (phase, 누적 카운트) 진행 상황 콜백 — 백그라운드 동기화 작업이 상태 보고에 사용
+SyncProgressCallback = Callable[[str, dict[str, int]], None]
+
+
+def _instrumented(kind: str):
+    """공개 동기화 메서드를 계측하고, 끝나면(실패 포함) 실행 이력을 저장한다."""
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self: "NotionSyncService", *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            dry_run = bound.arguments.get("dry_run", False)
+            full = bound.arguments.get("full", False) or dry_run
+            return await self._run_instrumented(
+                SyncRunMetrics(kind=kind, full=full, dry_run=dry_run),
+                lambda: method(self, *args, **kwargs),
+            )
+
+        return wrapper
+
+    return decorator
 
 
 class NotionSyncService:
@@ -20,207 +103,778 @@ class NotionSyncService:
         course_repo: CourseRepository,
         course_date_repo: CourseDateRepository,
         assignment_repo: AssignmentRepository,
+        sync_state_repo: SyncStateRepository,
+        sync_run_repo: SyncRunRepository,
         settings: Settings,
+        parse_executor: Executor | None = None,
     ):
         self._client = client
-        self._instructor_repo = instructor_repo
-        self._course_repo = course_repo
-        self._course_date_repo = course_date_repo
-        self._assignment_repo = assignment_repo
+        # 저장소 호출 수/시간은 현재 실행의 metrics에 자동 집계
+        self._metrics: SyncRunMetrics | None = None
+        current_metrics = lambda: self._metrics  # noqa: E731
+        self._instructor_repo = InstrumentedRepository(instructor_repo, current_metrics)
+        self._course_repo = InstrumentedRepository(course_repo, current_metrics)
+        self._course_date_repo = InstrumentedRepository(course_date_repo, current_metrics)
+        self._assignment_repo = InstrumentedRepository(assignment_repo, current_metrics)
+        self._sync_state_repo = InstrumentedRepository(sync_state_repo, current_metrics)
+        self._sync_run_repo = sync_run_repo
         self._settings = settings
+        # 지정하면 페이지 파싱을 이벤트 루프 밖(프로세스 풀)에서 수행
+        self._parse_executor = parse_executor
+        self._parse_workers = max(1, settings.NOTION_SYNC_PARSE_WORKERS)
         # notion page_id → local id 매핑
-        self._tutor_map: dict[str, str] = {}
-        self._course_map: dict[str, str] = {}
-
-    async def sync_all(self) -> dict:
-        """전체 동기화: 튜터 → 강의 → 일정(+배정) 순서."""
-        tutor_result = await self.sync_tutors()
-        course_result = await self.sync_courses_and_schedules()
-
-        result = {
-            "tutors": tutor_result["tutors"],
-            "courses": course_result["courses"],
-            "schedules": course_result["schedules"],
-            "assignments": course_result["assignments"],
-        }
-        print(f"[sync] {result}")
+        self._tutor_map = IdMap()
+        self._course_map = IdMap()
+        self._progress: SyncProgressCallback | None = None
+        # DB 스키마로 컴파일한 파서 ("tutor" / "lecture" / "schedule")
+        self._parsers: dict[str, CompiledParser] = {}
+        # 동기화 시작 시 한 번 읽어두는 로컬 DB 스냅샷 (diff 기준 + 배정 상태 계산용)
+        self._instructors: DiffIndex | None = None
+        self._courses: DiffIndex | None = None
+        self._dates: DiffIndex | None = None
+        self._assignments: DiffIndex | None = None
+        # 이번 동기화에서 Notion 강의를 받은 course id (dry-run orphan 범위)
+        self._covered_course_ids: set[str] = set()
+        # dry-run이면 아무것도 쓰지 않고 diff 건수만 모은다
+        self._dry_run: DiffReport | None = None
+
+    async def _run_instrumented(self, metrics: SyncRunMetrics, run: Callable[[], Awaitable[dict]]) -> dict:
+        """run을 계측하며 실행하고, 성공/실패와 관계없이 sync_runs에 한 행을 남긴다."""
+        stats = getattr(self._client, "stats", None)
+        requests_before = stats.requests if stats else 0
+        self._metrics = metrics
+        error: BaseException | None = None
+        try:
+            return await run()
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if stats:
+                metrics.notion_requests = stats.requests - requests_before
+            metrics.finish(error)
+            self._metrics = None
+            await self._save_run(metrics)
+
+    async def _save_run(self, metrics: SyncRunMetrics) -> None:
+        """이력 저장 실패가 동기화 결과를 바꾸지 않도록 로그만 남긴다."""
+        try:
+            await self._sync_run_repo.create_run(metrics.as_row())
+        except Exception:
+            logger.exception("sync run (%s) 이력 저장 실패", metrics.kind)
+
+    @_instrumented("all")
+    async def sync_all(
+        self,
+        full: bool = False,
+        progress: SyncProgressCallback | None = None,
+        dry_run: bool = False,
+    ) -> dict:
+        """전체 동기화: 튜터 → 강의 → 일정(+배정) 순서.
+
+        기본은 delta 동기화 (DB별 watermark 이후 수정된 페이지만 조회).
+        full=True이거나 watermark가 없으면 전체를 다시 가져온다.
+
+        dry_run=True면 전체를 조회·비교만 하고 아무것도 쓰지 않는다 (watermark 포함).
+        반환값은 테이블별 inserts/updates/unchanged/orphans 건수.
+        """
+        self._progress = progress
+        self._dry_run = DiffReport() if dry_run else None
+        full = full or dry_run
+        await self._compile_parsers("tutor", "lecture", "schedule")
+        lecture_filter = self._active_lecture_filter()
+        # 튜터/강의 조회는 서로 독립이므로 동시에 시작하고, 쓰기만 의존 순서(튜터 → 강의 → 일정)대로
+        # 적용한다. 일정은 활성 강의 목록이 정해진 뒤 그 강의에 연결된 것만 조회한다.
+        # 강의 조회 시작이 실패해도 이미 돌고 있는 튜터 조회는 닫는다
+        tutors = await self._open_stream(self._settings.NOTION_DB_TUTOR, [None], full, "tutors")
+        try:
+            lectures = await self._open_stream(
+                self._settings.NOTION_DB_LECTURE, [lecture_filter], full, "courses",
+            )
+            try:
+                await self._load_snapshot(with_courses=True)
+                tutor_count = await self._sync_tutors(tutors)
+                course_result = await self._sync_courses_and_schedules(lectures, full)
+            finally:
+                lectures.close()
+        finally:
+            tutors.close()
+
+        if self._dry_run:
+            report = self._finish_dry_run()
+            logger.info("dry run: %s", report)
+            return report
+
+        result = {"tutors": tutor_count, **course_result}
+        logger.info("sync all: %s", result)
         return result
 
-    async def sync_tutors(self) -> dict:
+    @_instrumented("tutors")
+    async def sync_tutors(self, full: bool = False, progress: SyncProgressCallback | None = None) -> dict:
         """강사만 동기화."""
-        tutor_count = await self._sync_tutors()
+        self._progress = progress
+        await self._compile_parsers("tutor")
+        tutors = await self._open_stream(self._settings.NOTION_DB_TUTOR, [None], full, "tutors")
+        try:
+            await self._load_snapshot(with_courses=False)
+            tutor_count = await self._sync_tutors(tutors)
+        finally:
+            tutors.close()
         return {"tutors": tutor_count}
 
-    async def sync_courses_and_schedules(self) -> dict:
-        """강의 + 일정 + 배정 동기화. 기존 DB에서 tutor_map을 미리 로드."""
-        await self._preload_tutor_map()
-        course_count = await self._sync_courses()
-        schedule_count, assignment_count = await self._sync_schedules()
+    @_instrumented("courses")
+    async def sync_courses_and_schedules(
+        self, full: bool = False, progress: SyncProgressCallback | None = None,
+    ) -> dict:
+        """강의 + 일정 + 배정 동기화."""
+        self._progress = progress
+        await self._compile_parsers("lecture", "schedule")
+        lectures = await self._open_stream(
+            self._settings.NOTION_DB_LECTURE, [self._active_lecture_filter()], full, "courses",
+        )
+        try:
+            await self._load_snapshot(with_courses=True)
+            return await self._sync_courses_and_schedules(lectures, full)
+        finally:
+            lectures.close()
+
+    @_instrumented("course")
+    async def sync_course(self, course_id: str, progress: SyncProgressCallback | None = None) -> dict:
+        """강의 1건만 재동기화: 강의 페이지 + 연결된 일정 페이지만 조회해 반영."""
+        self._progress = progress
+        course = await self._course_repo.get_course(course_id)
+        if not course:
+            raise HTTPException(status_code=404, detail="교육을 찾을 수 없습니다")
+
+        await self._compile_parsers("lecture", "schedule")
+        # 일정 relation을 못 찾으면 연결된 일정이 없는 것처럼 보여 이 강의의 날짜/배정을 모두 지우게 된다
+        if self._parsers["lecture"].key_for("schedule_ids") is None:
+            raise NotionSchemaError(
+                "Notion lecture DB에 'schedule_ids' 속성(lecture_schedules, relation 타입)이 없어 "
+                "강의 단건 동기화를 할 수 없습니다. 속성 이름이 바뀌었는지 확인하세요."
+            )
+        page, instructors, dates = await asyncio.gather(
+            self._client.get_page(course["notion_page_id"]),
+            self._instructor_repo.list_instructors(columns=INSTRUCTOR_COLUMNS),
+            self._course_date_repo.list_dates_by_course(course_id, columns=COURSE_DATE_COLUMNS),
+        )
+        self._metrics.notion_pages += 1
+        lecture = self._parsers["lecture"](page)
+        schedule_ids = await self._relation_ids(page, "lecture", "schedule_ids", list(lecture.schedule_ids))
+        schedule_pages = [p for p in await self._fetch_pages(schedule_ids) if not p.get("archived")]
+        schedules = await self._parse("schedule", schedule_pages)
+
+        # 이 강의 범위의 스냅샷. 배정 충돌 키가 (강사, 날짜)라 해당 기간 배정은 모두 읽는다
+        all_dates = [str(d["date"]) for d in dates] + [s.date for s in schedules if s.date]
+        assignments = (
+            await self._assignment_repo.list_assignments_by_date_range(
+                min(all_dates), max(all_dates), columns=ASSIGNMENT_COLUMNS,
+            )
+            if all_dates else []
+        )
+        linked = [i for i in instructors if i.get("notion_page_id")]
+        self._instructors = DiffIndex(linked, page_key, INSTRUCTOR_FIELDS)
+        self._tutor_map = IdMap.from_rows(linked)
+        self._courses = DiffIndex([course], page_key, COURSE_FIELDS)
+        self._course_map = IdMap.from_rows([course])
+        self._dates = DiffIndex(dates, course_date_key, COURSE_DATE_FIELDS)
+        self._assignments = DiffIndex(assignments, assignment_key, ASSIGNMENT_FIELDS)
+        self._covered_course_ids = set()
+
+        await self._ingest_lectures([page])
+        counts = _schedule_counts()
+        await self._ingest_schedules(schedules, counts)
+        # 연결된 일정 페이지를 모두 받았으므로 Notion에서 빠진 날짜/배정은 지운다
+        await self._delete_orphans(counts)
         await self._compute_assignment_status()
-        return {
-            "courses": course_count,
-            "schedules": schedule_count,
-            "assignments": assignment_count,
+        logger.info("course %s: %d schedule pages, %s", course_id, len(schedule_pages), counts)
+        return {"courses": 1, **counts}
+
+    @_instrumented("pages")
+    async def sync_pages(self, page_ids: list[str], progress: SyncProgressCallback | None = None) -> dict:
+        """변경된 페이지만 반영 (웹훅). DB 쿼리 없이 페이지 단위로 조회한다.
+
+        부모 DB로 튜터/강의/일정을 구분하고, 보관(archived)/휴지통(in_trash) 페이지와
+        동기화 대상 DB가 아닌 페이지는 건너뛴다. watermark는 건드리지 않는다.
+
+        삭제된 일정 페이지는 어떤 (강의, 날짜) 행이 그 페이지에서만 나왔는지 알 수 없으므로
+        여기서 지우지 않는다. 해당 날짜/배정은 다음 full 동기화나 강의 단건 동기화에서 정리된다.
+        """
+        self._progress = progress
+        databases = {
+            _normalize_id(self._settings.NOTION_DB_TUTOR): "tutor",
+            _normalize_id(self._settings.NOTION_DB_LECTURE): "lecture",
+            _normalize_id(self._settings.NOTION_DB_SCHEDULE): "schedule",
+        }
+        groups: dict[str, list[dict]] = {"tutor": [], "lecture": [], "schedule": []}
+        removed = 0
+        for page in await self._fetch_pages(page_ids, skip_failed=True):
+            parent = _normalize_id((page.get("parent") or {}).get("database_id", ""))
+            database = databases.get(parent) if parent else None
+            if not database:
+                continue
+            if page.get("archived") or page.get("in_trash"):
+                removed += 1
+            else:
+                groups[database].append(page)
+        if removed:
+            logger.info("pages: %d deleted pages skipped until the next full sync", removed)
+
+        await self._compile_parsers(*(db for db, pages in groups.items() if pages))
+        await self._load_snapshot(with_courses=bool(groups["lecture"] or groups["schedule"]))
+        counts = _schedule_counts()
+        result = {"tutors": 0, "courses": 0}
+        if groups["tutor"]:
+            result["tutors"] = await self._ingest_tutors(groups["tutor"])
+        if groups["lecture"]:
+            result["courses"] = await self._ingest_lectures(groups["lecture"])
+        if groups["schedule"]:
+            await self._ingest_schedules(await self._parse("schedule", groups["schedule"]), counts)
+        if groups["lecture"] or groups["schedule"]:
+            await self._compute_assignment_status()
+
+        result.update(counts)
+        logger.info("pages %d: %s", len(page_ids), result)
+        return result
+
+    async def _relation_ids(self, page: dict, database: str, field: str, ids: list[str]) -> list[str]:
+        """페이지 응답의 relation이 잘렸으면(has_more) 속성 엔드포인트로 전체를 다시 받는다."""
+        key = self._parsers[database].key_for(field)
+        prop = page.get("properties", {}).get(key) if key else None
+        if prop and prop.get("has_more"):
+            return await self._client.get_relation_ids(page["id"], prop["id"])
+        return ids
+
+    async def _fetch_pages(self, page_ids: list[str], skip_failed: bool = False) -> list[dict]:
+        """페이지 여러 건을 동시에 조회 (NOTION_PAGE_FETCH_CONCURRENCY개까지).
+
+        skip_failed면 조회에 실패한 페이지(삭제/권한 없음 등)는 로그만 남기고 뺀다.
+        """
+        semaphore = asyncio.Semaphore(max(1, self._settings.NOTION_PAGE_FETCH_CONCURRENCY))
+
+        async def fetch(page_id: str) -> dict:
+            async with semaphore:
+                return await self._client.get_page(page_id)
+
+        unique_ids = list(dict.fromkeys(page_ids))
+        results = await asyncio.gather(*(fetch(pid) for pid in unique_ids), return_exceptions=skip_failed)
+        pages = []
+        for page_id, result in zip(unique_ids, results):
+            if isinstance(result, Exception):
+                logger.warning("page %s fetch failed: %s", page_id, result)
+                self._metrics.record_error(f"page {page_id}: {type(result).__name__}: {result}")
+                continue
+            pages.append(result)
+        self._metrics.notion_pages += len(pages)
+        return pages
+
+    async def _sync_courses_and_schedules(self, lectures: "_PageStream", full: bool) -> dict:
+        """강의 → 일정 순서로 반영한 뒤 배정 상태를 다시 계산.
+
+        일정은 강의 반영이 끝난 뒤 활성 강의에 연결된 것만 조회한다.
+
+        full이면 Notion에서 사라진 일정의 날짜/배정도 삭제한다.
+        delta 조회는 바뀐 페이지만 받으므로 빠진 것과 그대로인 것을 구분할 수 없다.
+        체크포인트에서 이어받은 일정 조회도 앞부분을 이번에 보지 않았으므로 삭제하지 않는다.
+        """
+        course_count = await self._sync_courses(lectures)
+        schedules = await self._open_stream(
+            self._settings.NOTION_DB_SCHEDULE, self._schedule_queries(), full, "schedules",
+        )
+        try:
+            schedule_counts = await self._sync_schedules(schedules)
+        finally:
+            schedules.close()
+        if not self._dry_run:
+            if full and not schedules.resumed:
+                await self._delete_orphans(schedule_counts)
+            await self._compute_assignment_status()
+        return {"courses": course_count, **schedule_counts}
+
+    async def _load_snapshot(self, with_courses: bool) -> None:
+        """비교 기준이 되는 로컬 행을 테이블당 한 번씩 읽는다."""
+        self._covered_course_ids = set()
+        if not with_courses:
+            instructors = await self._instructor_repo.list_instructors(columns=INSTRUCTOR_COLUMNS)
+        else:
+            instructors, courses, dates, assignments = await asyncio.gather(
+                self._instructor_repo.list_instructors(columns=INSTRUCTOR_COLUMNS),
+                self._course_repo.list_courses(columns=COURSE_COLUMNS),
+                self._course_date_repo.list_all_dates(columns=COURSE_DATE_COLUMNS),
+                self._assignment_repo.list_assignments(columns=ASSIGNMENT_COLUMNS),
+            )
+            self._courses = DiffIndex(courses, page_key, COURSE_FIELDS)
+            self._dates = DiffIndex(dates, course_date_key, COURSE_DATE_FIELDS)
+            self._assignments = DiffIndex(assignments, assignment_key, ASSIGNMENT_FIELDS)
+            self._course_map = IdMap.from_rows(courses)
+
+        # notion_page_id가 없는 강사(수동 등록)는 동기화 대상이 아님
+        linked = [i for i in instructors if i.get("notion_page_id")]
+        self._instructors = DiffIndex(linked, page_key, INSTRUCTOR_FIELDS)
+        self._tutor_map = IdMap.from_rows(linked)
+
+    def _finish_dry_run(self) -> dict:
+        report = self._dry_run
+        report.set_orphans("instructors", self._instructors.orphans())
+        # 강의는 활성 강의만 조회하고 동기화가 지우지도 않으므로 orphan을 세지 않는다
+        # (끝난 강의가 모두 orphan으로 잡힘)
+        orphan_dates, orphan_assignments = self._schedule_orphans()
+        report.set_orphans("course_dates", orphan_dates)
+        report.set_orphans("assignments", orphan_assignments)
+        for table in ("instructors", "courses", "course_dates", "assignments"):
+            report.tables.setdefault(table, dict.fromkeys(("inserts", "updates", "unchanged", "orphans"), 0))
+        return report.tables
+
+    def _report(self, phase: str, counts: dict[str, int]) -> None:
+        if self._progress:
+            self._progress(phase, dict(counts))
+
+    async def _parse(self, database: str, pages: list[dict]) -> list:
+        """페이지 배치 파싱. executor가 있으면 워커 수만큼 나눠 병렬로 파싱한다."""
+        parser = self._parsers[database]
+        with self._metrics.phase("parse"):
+            if self._parse_executor is None or not pages:
+                return parser.parse_many(pages)
+
+            size = max(_MIN_PARSE_CHUNK, -(-len(pages) // self._parse_workers))
+            loop = asyncio.get_running_loop()
+            chunks = await asyncio.gather(*(
+                loop.run_in_executor(self._parse_executor, parser.parse_many, pages[i:i + size])
+                for i in range(0, len(pages), size)
+            ))
+            return [row for chunk in chunks for row in chunk]
+
+    # ── Notion 조회 (delta watermark + 스트리밍) ──
+
+    async def _compile_parsers(self, *databases: str) -> None:
+        """DB 스키마를 한 번 읽어 파서를 만든다. 필수 속성이 없으면 조회 전에 실패."""
+        database_ids = {
+            "tutor": self._settings.NOTION_DB_TUTOR,
+            "lecture": self._settings.NOTION_DB_LECTURE,
+            "schedule": self._settings.NOTION_DB_SCHEDULE,
         }
+        schemas = await asyncio.gather(
+            *(self._client.retrieve_database(database_ids[db]) for db in databases)
+        )
+        for db, schema in zip(databases, schemas):
+            self._parsers[db] = compile_parser(db, schema)
+
+    def _active_lecture_filter(self) -> dict:
+        """완료되지 않은 교육만 Notion에서 가져오는 필터. 상태 속성 이름/타입은 컴파일된 스키마를 따른다."""
+        parser = self._parsers["lecture"]
+        key = parser.key_for("lecture_state")
+        if key is None:
+            raise NotionSchemaError(
+                "Notion lecture DB에 'lecture_state' 속성(lecture_state / 상태 / Status, select 타입)이 없어 "
+                "진행 중인 강의만 조회할 수 없습니다. 속성 이름이 바뀌었는지 확인하세요."
+            )
+        prop_type = parser.extractor_for("lecture_state")  # "status" 또는 "select"
+        return {"and": [
+            {"property": key, prop_type: {"does_not_equal": state}} for state in sorted(self._FINISHED_STATES)
+        ]}
+
+    def _schedule_queries(self) -> list[dict | None]:
+        """활성 강의에 연결된 일정만 받는 쿼리 필터 목록.
+
+        relation contains 조건을 청크 크기만큼 OR로 묶어 청크당 쿼리 1개.
+        완료된 강의의 일정과 DB에 없는 강의의 일정은 받아도 버려지므로 조회하지 않는다.
+        """
+        size = self._settings.NOTION_SCHEDULE_FILTER_CHUNK_SIZE
+        if size <= 0:
+            return [None]
+        prop = self._parsers["schedule"].key_for("lecture_dashboard_ids")
+        active = sorted(
+            c["notion_page_id"] for c in self._courses.rows()
+            if c.get("status") not in self._FINISHED_STATES
+        )
+        return [
+            {"or": [{"property": prop, "relation": {"contains": lid}} for lid in active[i:i + size]]}
+            for i in range(0, len(active), size)
+        ]
+
+    async def _open_stream(
+        self, database_id: str, queries: list[dict | None], full: bool, phase: str,
+    ) -> "_PageStream":
+        """watermark 이후 수정된 페이지 조회를 백그라운드로 시작한다.
+
+        queries의 필터마다 쿼리를 하나씩 순서대로 실행한다 (빈 목록이면 조회하지 않음).
+        full이거나 watermark가 없으면 전체를 조회한다. 다음 watermark
+        (조회 시작 시각 - 여유분)는 stream.next_watermark에 담아두고,
+        처리가 모두 끝난 뒤 _save_watermark로 저장할 것.
+
+        같은 조건으로 중단된 조회의 체크포인트가 있으면 마지막으로 반영한 배치 다음부터
+        이어서 조회하고, 중단된 실행의 next_watermark를 그대로 물려받는다.
+        """
+        next_watermark = (datetime.now(timezone.utc) - _WATERMARK_MARGIN).isoformat(timespec="seconds")
+        watermark = None if full else await self._load_watermark(database_id)
+        queries = [_with_edited_since(f, watermark) for f in queries]
+        query_key = _query_key(queries)
+        checkpoint = None if self._dry_run else await self._load_checkpoint(database_id, phase, query_key)
+        mode = f"delta since {watermark}" if watermark else "full"
+        if len(queries) != 1:
+            mode += f", {len(queries)} queries"
+        if checkpoint:
+            next_watermark = checkpoint["next_watermark"]
+            mode += f", resuming after batch {checkpoint['batches']}"
+        logger.info("%s: %s", database_id, mode)
+        return _PageStream(
+            self._client,
+            database_id,
+            queries,
+            next_watermark=next_watermark,
+            max_batches=self._settings.NOTION_SYNC_PREFETCH_BATCHES,
+            metrics=self._metrics,
+            phase=phase,
+            query_key=query_key,
+            checkpoint=checkpoint,
+        )
 
-    async def _preload_tutor_map(self):
-        """DB에 저장된 강사의 notion_page_id → local id 매핑을 미리 로드."""
-        instructors = await self._instructor_repo.list_instructors()
-        for inst in instructors:
-            if inst.get("notion_page_id"):
-                self._tutor_map[inst["notion_page_id"]] = inst["id"]
+    async def _load_watermark(self, database_id: str) -> str | None:
+        state = await self._sync_state_repo.get_state(_watermark_key(database_id))
+        return state.get("last_edited_time") if state else None
+
+    async def _save_watermark(self, stream: "_PageStream") -> None:
+        """조회를 끝까지 반영한 뒤 호출. watermark를 올리고 체크포인트는 지운다."""
+        if self._dry_run:
+            return
+        await self._sync_state_repo.set_state(
+            _watermark_key(stream.database_id), {"last_edited_time": stream.next_watermark},
+        )
+        if stream.resumed or stream.checkpointed:
+            await self._sync_state_repo.delete_state(_checkpoint_key(stream.database_id))
+
+    async def _load_checkpoint(self, database_id: str, phase: str, query_key: str) -> dict | None:
+        """같은 단계·같은 조회 조건(필터 + watermark)으로 중단된 조회의 체크포인트. 오래된 것은 무시."""
+        checkpoint = await self._sync_state_repo.get_state(_checkpoint_key(database_id))
+        if not checkpoint or checkpoint.get("phase") != phase or checkpoint.get("query_key") != query_key:
+            return None
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(checkpoint["saved_at"])
+        if age > timedelta(seconds=self._settings.NOTION_SYNC_CHECKPOINT_TTL_SECONDS):
+            return None
+        return checkpoint
+
+    async def _save_checkpoint(self, stream: "_PageStream") -> None:
+        """배치를 DB에 반영한 뒤 호출. 여기서 중단되면 다음 실행은 이 배치 다음부터 조회한다."""
+        if self._dry_run or stream.exhausted:
+            return
+        await self._sync_state_repo.set_state(_checkpoint_key(stream.database_id), {
+            "phase": stream.phase,
+            "query_key": stream.query_key,
+            "query": stream.query,
+            "cursor": stream.cursor,
+            "batches": stream.batches,
+            "next_watermark": stream.next_watermark,
+            "saved_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        })
+        stream.checkpointed = True
 
     # ── 튜터 동기화 ──
 
-    async def _sync_tutors(self) -> int:
-        pages = await self._client.query_database(self._settings.NOTION_DB_TUTOR)
-        count = 0
-        for page in pages:
-            parsed = _parse_tutor(page)
-            if not parsed["name"]:
-                continue
-            instructor = await self._instructor_repo.upsert_instructor(parsed)
-            self._tutor_map[parsed["notion_page_id"]] = instructor["id"]
-            count += 1
-        print(f"[sync] tutors: {count}")
+    async def _sync_tutors(self, stream: "_PageStream") -> int:
+        counts = {"pages": 0, "tutors": 0}
+        self._report("tutors", counts)
+        async for pages in stream:
+            counts["pages"] += len(pages)
+            counts["tutors"] += await self._ingest_tutors(pages)
+            await self._save_checkpoint(stream)
+            self._report("tutors", counts)
+        count = counts["tutors"]
+        await self._save_watermark(stream)
+        logger.info("tutors: %d", count)
         return count
 
+    async def _ingest_tutors(self, pages: list[dict]) -> int:
+        """튜터 페이지 배치 → 바뀐 강사만 upsert. 반영한(변경 + 동일) 강사 수 반환."""
+        tutors: list[TutorRecord] = await self._parse("tutor", pages)
+        rows = [t.as_row() for t in tutors if t.name]
+        diff = self._instructors.diff(rows)
+        await self._write_pages(
+            "instructors", self._instructors, diff,
+            self._instructor_repo.upsert_instructors_bulk, self._tutor_map,
+        )
+        return len(diff.changed) + len(diff.unchanged)
+
+    async def _write_pages(
+        self,
+        table: str,
+        index: DiffIndex,
+        diff: TableDiff,
+        upsert: Callable[[list[dict]], Awaitable[dict[str, str]]],
+        id_map: IdMap,
+    ) -> dict[str, str]:
+        """notion_page_id 기준 테이블(강사/강의)에 바뀐 행만 upsert하고 id_map을 갱신.
+
+        이번 배치의 notion_page_id → local id를 반환 (dry-run이면 새 행은 임시 id).
+        """
+        batch_ids = {row["notion_page_id"]: row["id"] for row in diff.unchanged}
+        changed = [_without_id(row) for row in diff.changed]
+        if self._dry_run:
+            self._dry_run.add(table, diff)
+            written = {
+                row["notion_page_id"]: row.get("id") or f"new:{row['notion_page_id']}"
+                for row in diff.changed
+            }
+        else:
+            written = await upsert(changed) if changed else {}
+            self._metrics.count_rows(
+                table, inserted=len(diff.inserts), updated=len(diff.updates), skipped=len(diff.unchanged),
+            )
+        index.apply(
+            {**row, "id": written[row["notion_page_id"]]}
+            for row in changed if row["notion_page_id"] in written
+        )
+        batch_ids.update(written)
+        id_map.update(batch_ids)
+        return batch_ids
+
     # ── 강의 동기화 ──
 
     # 동기화 완료로 간주하는 상태 (더 이상 변하지 않는 교육)
     _FINISHED_STATES = {"tax_invoice", "lecture_stop"}
 
-    async def _sync_courses(self) -> int:
-        # 기존 DB 과목을 course_map에 미리 로드 (일정 매핑용)
-        existing = await self._course_repo.list_courses()
-        for c in existing:
-            if c.get("notion_page_id"):
-                self._course_map[c["notion_page_id"]] = c["id"]
-
-        # 완료되지 않은 교육만 Notion에서 가져오기
-        notion_filter = {
-            "and": [
-                {"property": "lecture_state", "status": {"does_not_equal": "tax_invoice"}},
-                {"property": "lecture_state", "status": {"does_not_equal": "lecture_stop"}},
-            ]
-        }
-        pages = await self._client.query_database(
-            self._settings.NOTION_DB_LECTURE, filters=notion_filter,
-        )
-        count = 0
-        for page in pages:
-            parsed = _parse_lecture(page)
-            if not parsed["title"]:
-                continue
-            parsed.pop("schedule_ids", None)
-            course = await self._course_repo.upsert_course(parsed)
-            self._course_map[parsed["notion_page_id"]] = course["id"]
-            count += 1
-        print(f"[sync] courses: {count} (active only, {len(existing)} total in DB)")
+    async def _sync_courses(self, stream: "_PageStream") -> int:
+        counts = {"pages": 0, "courses": 0}
+        self._report("courses", counts)
+        async for pages in stream:
+            counts["pages"] += len(pages)
+            counts["courses"] += await self._ingest_lectures(pages)
+            await self._save_checkpoint(stream)
+            self._report("courses", counts)
+        count = counts["courses"]
+        await self._save_watermark(stream)
+        logger.info("courses: %d (active only, %d total in DB)", count, len(self._course_map))
         return count
 
-    # ── 일정 동기화 (+배정 자동 생성) ──
+    async def _ingest_lectures(self, pages: list[dict]) -> int:
+        """강의 페이지 배치 → 바뀐 과목만 upsert. 반영한 과목 수 반환."""
+        lectures: list[LectureRecord] = await self._parse("lecture", pages)
+        rows = [lecture.as_row() for lecture in lectures if lecture.title]
+        diff = self._courses.diff(rows)
+        batch_ids = await self._write_pages(
+            "courses", self._courses, diff, self._course_repo.upsert_courses_bulk, self._course_map,
+        )
+        self._covered_course_ids.update(batch_ids.values())
+        return len(batch_ids)
 
-    async def _sync_schedules(self) -> tuple[int, int]:
-        pages = await self._client.query_database(self._settings.NOTION_DB_SCHEDULE)
-        schedule_count = 0
-        assignment_count = 0
+    # ── 일정 동기화 (+배정 자동 생성) ──
 
-        for page in pages:
-            parsed = _parse_schedule(page)
-            if not parsed["date"]:
+    async def _sync_schedules(self, stream: "_PageStream") -> dict:
+        counts = _schedule_counts()
+        pages_seen = 0
+        self._report("schedules", {"pages": 0, **counts})
+
+        async for pages in stream:
+            pages_seen += len(pages)
+            await self._ingest_schedules(await self._parse("schedule", pages), counts)
+            await self._save_checkpoint(stream)
+            self._report("schedules", {"pages": pages_seen, **counts})
+
+        await self._save_watermark(stream)
+        logger.info("schedules/assignments: %s", counts)
+        return counts
+
+    async def _ingest_schedules(self, schedules: list[ScheduleRecord], counts: dict) -> None:
+        """일정 배치 → course_dates 일괄 upsert → 배정 일괄 생성.
+
+        새 날짜는 생성, place/시간이 바뀐 날짜는 갱신하고, 그대로인 날짜와
+        이미 있는 배정은 쓰지 않는다.
+        """
+        mapped: list[tuple[tuple[str, str], ScheduleRecord]] = []
+        date_rows = []
+        for parsed in schedules:
+            if not parsed.date:
                 continue
-
             # 역참조로 lecture_dashboard → course_id 매핑
-            lecture_notion_ids = parsed.get("lecture_dashboard_ids", [])
-            course_id = None
-            for lid in lecture_notion_ids:
-                course_id = self._course_map.get(lid)
-                if course_id:
-                    break
+            course_id = self._course_map.first(parsed.lecture_dashboard_ids)
             if not course_id:
                 continue
+            mapped.append(((course_id, parsed.date), parsed))
+            date_rows.append({
+                "course_id": course_id,
+                "date": parsed.date,
+                "day_number": parsed.day_number,
+                "place": parsed.place or None,
+                "start_time": parsed.start_time,
+                "end_time": parsed.end_time,
+                "source": "notion",
+            })
 
-            # course_date 생성 (중복 시 무시)
-            date_entry: dict = {"date": parsed["date"], "day_number": parsed.get("day_number", 1)}
-            if parsed.get("place"):
-                date_entry["place"] = parsed["place"]
-            if parsed.get("start_time") is not None:
-                date_entry["start_time"] = parsed["start_time"]
-            if parsed.get("end_time") is not None:
-                date_entry["end_time"] = parsed["end_time"]
-            try:
-                dates = await self._course_date_repo.create_dates(
-                    course_id,
-                    [date_entry],
-                )
-            except Exception:
-                continue  # unique 제약 등 → 스킵
-            if not dates:
+        diff = self._dates.diff(date_rows)
+        counts["schedules"] += len(diff.inserts)
+        counts["schedules_updated"] += len(diff.updates)
+        counts["schedules_skipped"] += len(diff.unchanged)
+        if self._dry_run:
+            self._dry_run.add("course_dates", diff)
+            self._dates.apply(
+                {**row, "id": row.get("id") or "new:{}:{}".format(*course_date_key(row))}
+                for row in diff.changed
+            )
+        else:
+            if diff.changed:
+                self._dates.apply(await self._course_date_repo.upsert_dates_bulk(
+                    [_without_id(row) for row in diff.changed],
+                ))
+            # 날짜가 없거나 강의를 찾지 못한 일정도 건너뜀으로 센다
+            self._metrics.count_rows(
+                "course_dates",
+                inserted=len(diff.inserts),
+                updated=len(diff.updates),
+                skipped=len(diff.unchanged) + len(schedules) - len(date_rows),
+            )
+
+        assignment_rows = []
+        for key, parsed in mapped:
+            course_date = self._dates.get(key)
+            if not course_date:
                 continue
-
-            course_date = dates[0]
-            schedule_count += 1
-
-            # main_tutor가 있으면 배정
-            for tutor_notion_id in parsed.get("main_tutor_ids", []):
-                instructor_id = self._tutor_map.get(tutor_notion_id)
-                if not instructor_id:
-                    continue
-                try:
-                    await self._assignment_repo.create_assignment({
-                        "course_date_id": course_date["id"],
-                        "instructor_id": instructor_id,
-                        "date": parsed["date"],
-                        "class_name": "A반",
-                    })
-                    assignment_count += 1
-                except Exception:
-                    pass  # 중복 등 무시
-
-            # tech_tutor도 배정
-            for tutor_notion_id in parsed.get("tech_tutor_ids", []):
-                instructor_id = self._tutor_map.get(tutor_notion_id)
-                if not instructor_id:
-                    continue
-                try:
-                    await self._assignment_repo.create_assignment({
+            for field, class_name in _ASSIGNMENT_SOURCES:
+                for tutor_notion_id in getattr(parsed, field):
+                    instructor_id = self._tutor_map.get(tutor_notion_id)
+                    if not instructor_id:
+                        continue
+                    assignment_rows.append({
                         "course_date_id": course_date["id"],
                         "instructor_id": instructor_id,
-                        "date": parsed["date"],
-                        "class_name": "기술지원",
+                        "date": parsed.date,
+                        "class_name": class_name,
+                        "source": "notion",
                     })
-                    assignment_count += 1
-                except Exception:
-                    pass
 
-        print(f"[sync] schedules: {schedule_count}, assignments: {assignment_count}")
-        return schedule_count, assignment_count
+        diff = self._assignments.diff(assignment_rows)
+        # 같은 날짜에 Notion이 기대하는 배정이 수동('manual') 행으로 있으면 동기화 소유로 넘긴다.
+        # 009 이전에 동기화로 생긴 배정이 'manual'로 채워졌으므로, 이렇게 해야 이후 Notion에서 빠질 때 정리된다
+        expected = {assignment_key(row): row["course_date_id"] for row in assignment_rows}
+        adopted = [
+            row for row in diff.unchanged
+            if row.get("source") != "notion" and expected[assignment_key(row)] == row["course_date_id"]
+        ]
+        if adopted:
+            adopted_ids = {row["id"] for row in adopted}
+            diff.unchanged = [row for row in diff.unchanged if row["id"] not in adopted_ids]
+            diff.updates.extend({**row, "source": "notion"} for row in adopted)
+        counts["assignments_skipped"] += len(diff.unchanged)
+        if self._dry_run:
+            self._dry_run.add("assignments", diff)
+            counts["assignments"] += len(diff.inserts)
+            return
+
+        if adopted:
+            await self._assignment_repo.update_assignments_bulk([row["id"] for row in adopted], {"source": "notion"})
+            self._assignments.apply(diff.updates)
+
+        inserted = []
+        if diff.inserts:
+            # 스냅샷 이후 다른 곳에서 생긴 배정과의 충돌은 DB가 무시한다
+            inserted = await self._assignment_repo.insert_assignments_bulk(diff.inserts)
+            self._assignments.apply(inserted)
+            counts["assignments"] += len(inserted)
+            counts["assignments_skipped"] += len(diff.inserts) - len(inserted)
+        self._metrics.count_rows(
+            "assignments",
+            inserted=len(inserted),
+            updated=len(adopted),
+            skipped=len(diff.unchanged) + len(diff.inserts) - len(inserted),
+        )
+
+    # ── 삭제 반영 (tombstone) ──
+
+    def _schedule_orphans(self) -> tuple[list[dict], list[dict]]:
+        """이번에 강의를 받은 course 범위에서 Notion에 없는 (날짜, 배정).
+
+        - 날짜: 동기화로 생긴(source='notion') 날짜 중 이번에 들어오지 않은 것
+        - 배정: 삭제될 날짜에 달린 배정 전부 + 남는 날짜의 동기화 배정 중 이번에 들어오지 않은 것
+        수동으로 입력한 날짜/배정은 건드리지 않는다.
+
+        강사 relation 속성이 스키마에 없으면(이름 변경 등) 그 반의 배정은 모두 빠진 것처럼 보이므로,
+        속성을 찾은 반의 배정만 정리한다.
+        """
+        covered = self._covered_course_ids
+        schedule = self._parsers["schedule"]
+        pruned_classes = set()
+        for field, class_name in _ASSIGNMENT_SOURCES:
+            if schedule.key_for(field):
+                pruned_classes.add(class_name)
+            else:
+                logger.warning("schedule DB has no '%s' property; keeping '%s' assignments", field, class_name)
+        dates = self._dates.orphans(lambda d: d["course_id"] in covered and d.get("source") == "notion")
+        orphan_date_ids = {d["id"] for d in dates}
+        kept_date_ids = {
+            d["id"] for d in self._dates.rows()
+            if d["course_id"] in covered and d["id"] not in orphan_date_ids
+        }
+        assignments = [a for a in self._assignments.rows() if a["course_date_id"] in orphan_date_ids]
+        assignments += self._assignments.orphans(
+            lambda a: (
+                a["course_date_id"] in kept_date_ids
+                and a.get("source") == "notion"
+                and a.get("class_name") in pruned_classes
+            ),
+        )
+        return dates, assignments
+
+    async def _delete_orphans(self, counts: dict) -> None:
+        """Notion에서 사라진 일정의 날짜/배정을 테이블당 한 번(청크 단위)씩 일괄 삭제.
+
+        Notion 일정을 빠짐없이 받은 경우(전체 조회, 강의 1건 재동기화)에만 부를 것.
+        """
+        dates, assignments = self._schedule_orphans()
+        # 배정을 먼저 지운다 (CASCADE에 기대지 않고 스냅샷과 DB를 같게 유지)
+        if assignments:
+            deleted = await self._assignment_repo.delete_assignments_bulk([a["id"] for a in assignments])
+            self._assignments.discard(assignments)
+            counts["assignments_deleted"] += deleted
+            self._metrics.count_rows("assignments", deleted=deleted)
+        if dates:
+            deleted = await self._course_date_repo.delete_dates_bulk([d["id"] for d in dates])
+            self._dates.discard(dates)
+            counts["schedules_deleted"] += deleted
+            self._metrics.count_rows("course_dates", deleted=deleted)
+        if dates or assignments:
+            logger.info("deleted %d course dates, %d assignments missing from Notion", len(dates), len(assignments))
 
     # ── 배정 상태 계산 ──
 
     async def _compute_assignment_status(self):
-        """각 course의 전체 일정 수 vs 배정된 일정 수 계산 → course에 저장."""
-        courses = await self._course_repo.list_courses()
-        all_assignments = await self._assignment_repo.list_assignments()
+        """각 course의 전체 일정 수 vs 배정된 일정 수 계산 → 값이 바뀐 course만 저장.
+
+        스냅샷의 assignments/course_dates를 한 번씩만 훑어 course별로 집계하고,
+        같은 (상태, 전체, 배정) 값을 갖는 course끼리 묶어 일괄 수정한다.
+        """
+        self._report("assignment_status", {})
+        with self._metrics.phase("assignment_status"):
+            courses, changed = self._assignment_status_changes()
 
-        # 전체 course_dates를 한 번에 조회 (N+1 제거)
-        all_dates = await self._course_date_repo.list_all_dates()
-        dates_by_course: dict[str, list[dict]] = {}
+        for (status, total, assigned), course_ids in changed.items():
+            await self._course_repo.update_courses_bulk(course_ids, {
+                "assignment_status": status,
+                "total_dates": total,
+                "assigned_dates": assigned,
+            })
+        changed_count = sum(map(len, changed.values()))
+        self._metrics.count_rows("assignment_status", updated=changed_count, skipped=len(courses) - changed_count)
+        logger.info("assignment status: %d/%d courses changed", changed_count, len(courses))
+
+    def _assignment_status_changes(self) -> tuple[list[dict], dict[tuple[str | None, int, int], list[str]]]:
+        """(전체 course, (상태, 전체, 배정) → 값이 바뀐 course id 목록)."""
+        # 동기화 중 쓴 행까지 반영된 스냅샷으로 계산 (다시 읽지 않음)
+        courses = list(self._courses.rows())
+        all_dates = self._dates.rows()
+        all_assignments = self._assignments.rows()
+
+        assigned_cd_ids = {a["course_date_id"] for a in all_assignments}
+        total_by_course: dict[str, int] = {}
+        assigned_by_course: dict[str, int] = {}
         for d in all_dates:
-            dates_by_course.setdefault(d["course_id"], []).append(d)
+            cid = d["course_id"]
+            total_by_course[cid] = total_by_course.get(cid, 0) + 1
+            if d["id"] in assigned_cd_ids:
+                assigned_by_course[cid] = assigned_by_course.get(cid, 0) + 1
 
+        changed: dict[tuple[str | None, int, int], list[str]] = {}
         for course in courses:
             cid = course["id"]
-            dates = dates_by_course.get(cid, [])
-            total = len(dates)
-
-            cd_ids = {d["id"] for d in dates}
-            assigned_cd_ids = {
-                a["course_date_id"] for a in all_assignments
-                if a["course_date_id"] in cd_ids
-            }
-            assigned = len(assigned_cd_ids)
+            total = total_by_course.get(cid, 0)
+            assigned = assigned_by_course.get(cid, 0)
 
             if total == 0:
                 status = None
@@ -229,213 +883,140 @@ class NotionSyncService:
             else:
                 status = "배정 미완료"
 
-            await self._course_repo.update_course(cid, {
-                "assignment_status": status,
-                "total_dates": total,
-                "assigned_dates": assigned,
-            })
+            stored = (course.get("assignment_status"), course.get("total_dates"), course.get("assigned_dates"))
+            if stored != (status, total, assigned):
+                changed.setdefault((status, total, assigned), []).append(cid)
+        return courses, changed
 
 
-# ── Notion 페이지 파서 함수들 ──
+class _PageStream:
+    """Notion 조회(producer)와 파싱/DB 쓰기(consumer)를 bounded queue로 겹친다.
 
+    생성 즉시 백그라운드에서 조회를 시작하므로 여러 DB를 동시에 받아둘 수 있다.
+    조회는 최대 max_batches 배치까지만 앞서가므로 DB 크기와 관계없이
+    메모리에 올라가는 raw 페이지 수가 일정하다. 사용 후 close()로 정리할 것.
 
-def _extract_title(props: dict, *keys: str) -> str:
-    for key in keys:
-        prop = props.get(key)
-        if prop and prop.get("type") == "title" and prop.get("title"):
-            return "".join(t.get("plain_text", "") for t in prop["title"])
-    return ""
+    queries의 필터마다 쿼리를 순서대로 실행해 하나의 배치 흐름으로 잇는다.
+    query/cursor/batches는 소비 쪽이 마지막으로 꺼낸 배치 다음 위치 (체크포인트 저장용).
+    """
 
+    def __init__(
+        self,
+        client: NotionClient,
+        database_id: str,
+        queries: list[dict | None],
+        next_watermark: str,
+        max_batches: int,
+        metrics: SyncRunMetrics | None = None,
+        phase: str = "",
+        query_key: str = "",
+        checkpoint: dict | None = None,
+    ):
+        self.database_id = database_id
+        self.next_watermark = next_watermark
+        self.phase = phase
+        self.query_key = query_key
+        self.resumed = checkpoint is not None
+        self.query: int = checkpoint["query"] if checkpoint else 0
+        self.cursor: str | None = checkpoint["cursor"] if checkpoint else None
+        self.batches: int = checkpoint["batches"] if checkpoint else 0
+        self.checkpointed = False
+        self._queries = queries
+        # 소비 쪽이 Notion 응답을 기다린 시간(notion_wait)과 받은 페이지 수를 더한다
+        self._metrics = metrics
+        self._produced = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_batches))
+        self._producer = asyncio.create_task(self._produce(client, self.query, self.cursor))
+
+    @property
+    def exhausted(self) -> bool:
+        return self.query >= len(self._queries)
+
+    async def _produce(self, client: NotionClient, query: int, start_cursor: str | None) -> None:
+        try:
+            try:
+                await self._fetch(client, query, start_cursor)
+            except Exception as e:
+                # 일시적 오류는 클라이언트가 이미 재시도했으므로, 이어받은 커서의 첫 요청이
+                # 실패하면 커서가 만료/무효인 것으로 보고 해당 쿼리를 처음부터 다시 조회한다
+                if start_cursor is None or self._produced:
+                    raise
+                logger.warning(
+                    "%s: checkpoint cursor rejected (%s), restarting query %d", self.database_id, e, query,
+                )
+                self.resumed = query > 0
+                await self._fetch(client, query, None)
+        except Exception as e:
+            await self._queue.put(e)
+            return
+        await self._queue.put(_END_OF_STREAM)
+
+    async def _fetch(self, client: NotionClient, query: int, start_cursor: str | None) -> None:
+        for index in range(query, len(self._queries)):
+            async for batch in client.iter_database(
+                self.database_id, self._queries[index], start_cursor=start_cursor,
+            ):
+                self._produced += 1
+                await self._queue.put((index, batch))
+            start_cursor = None
+
+    async def __aiter__(self) -> AsyncIterator[list[dict]]:
+        while True:
+            started = time.perf_counter()
+            item = await self._queue.get()
+            if self._metrics:
+                self._metrics.add_time("notion_wait", time.perf_counter() - started)
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise item
+            index, batch = item
+            if self._metrics:
+                self._metrics.notion_pages += len(batch.results)
+            if batch.next_cursor:
+                self.query, self.cursor = index, batch.next_cursor
+            else:
+                self.query, self.cursor = index + 1, None
+            self.batches += 1
+            yield batch.results
 
-def _extract_rich_text(props: dict, *keys: str) -> str:
-    for key in keys:
-        prop = props.get(key)
-        if prop and prop.get("type") == "rich_text" and prop.get("rich_text"):
-            return "".join(t.get("plain_text", "") for t in prop["rich_text"])
-    return ""
+    def close(self) -> None:
+        self._producer.cancel()
 
 
-def _extract_text(props: dict, *keys: str) -> str:
-    result = _extract_title(props, *keys)
-    if result:
-        return result
-    return _extract_rich_text(props, *keys)
-
-
-def _extract_email(props: dict, key: str) -> str:
-    prop = props.get(key)
-    if prop and prop.get("type") == "email":
-        return prop.get("email") or ""
-    return ""
-
-
-def _extract_phone(props: dict, key: str) -> str:
-    prop = props.get(key)
-    if prop and prop.get("type") == "phone_number":
-        return prop.get("phone_number") or ""
-    return ""
-
-
-def _extract_select(props: dict, key: str) -> str:
-    prop = props.get(key)
-    if prop and prop.get("type") == "select" and prop.get("select"):
-        return prop["select"].get("name", "")
-    if prop and prop.get("type") == "status" and prop.get("status"):
-        return prop["status"].get("name", "")
-    return ""
-
-
-def _extract_number(props: dict, key: str) -> int | float | None:
-    prop = props.get(key)
-    if prop and prop.get("type") == "number":
-        return prop.get("number")
-    return None
-
-
-def _extract_date_start(props: dict, key: str) -> str:
-    prop = props.get(key)
-    if prop and prop.get("type") == "date" and prop.get("date"):
-        return prop["date"].get("start") or ""
-    return ""
-
-
-def _extract_relation_ids(props: dict, key: str) -> list[str]:
-    prop = props.get(key)
-    if prop and prop.get("type") == "relation":
-        return [r.get("id", "") for r in prop.get("relation", []) if r.get("id")]
-    return []
-
-
-def _extract_people(props: dict, key: str) -> list[dict]:
-    """Notion people 타입에서 name, email을 추출한다."""
-    prop = props.get(key)
-    if not prop or prop.get("type") != "people":
-        return []
-    results = []
-    for person in prop.get("people", []):
-        name = person.get("name", "")
-        email = ""
-        if person.get("person"):
-            email = person["person"].get("email", "")
-        if name:
-            results.append({"name": name, "email": email})
-    return results
-
-
-def _extract_rollup_texts(props: dict, key: str) -> list[str]:
-    prop = props.get(key)
-    if not prop or prop.get("type") != "rollup":
-        return []
-    rollup = prop.get("rollup", {})
-    arr = rollup.get("array", [])
-    results = []
-    for item in arr:
-        if item.get("type") == "title":
-            text = "".join(t.get("plain_text", "") for t in item.get("title", []))
-            if text:
-                results.append(text)
-        elif item.get("type") == "rich_text":
-            text = "".join(t.get("plain_text", "") for t in item.get("rich_text", []))
-            if text:
-                results.append(text)
-    return results
-
-
-def _parse_tutor(page: dict) -> dict:
-    props = page.get("properties", {})
-    name = _extract_rich_text(props, "real_name") or _extract_title(props, "unique_name")
-    return {
-        "notion_page_id": page["id"],
-        "name": name,
-        "email": _extract_email(props, "email") or None,
-        "phone": _extract_phone(props, "phone_number") or None,
-        "specialty": _extract_select(props, "tutor_level") or None,
-        "is_active": True,
-    }
-
-
-def _extract_rollup_date(props: dict, key: str) -> str:
-    prop = props.get(key)
-    if not prop or prop.get("type") != "rollup":
-        return ""
-    rollup = prop.get("rollup", {})
-    rollup_type = rollup.get("type", "")
-
-    if rollup_type == "date" and rollup.get("date"):
-        return rollup["date"].get("start") or ""
-
-    if rollup_type == "array":
-        for item in rollup.get("array", []):
-            if item.get("type") == "date" and item.get("date"):
-                return item["date"].get("start") or ""
-
-    return ""
-
-
-def _extract_rollup_url(props: dict, key: str) -> str:
-    prop = props.get(key)
-    if not prop or prop.get("type") != "rollup":
-        return ""
-    rollup = prop.get("rollup", {})
-    for item in rollup.get("array", []):
-        if item.get("type") == "url" and item.get("url"):
-            return item["url"]
-    return ""
-
-
-def _parse_lecture(page: dict) -> dict:
-    props = page.get("properties", {})
-
-    title = _extract_title(props, "lecture_dashboard", "이름", "Name", "title")
-    lecture_state = _extract_select(props, "lecture_state")
-    lecture_start = _extract_rollup_date(props, "lecture_start")
-    lecture_end = _extract_rollup_date(props, "lecture_end")
-    students = _extract_number(props, "students")
-    schedule_ids = _extract_relation_ids(props, "lecture_schedules")
-    target_names = _extract_rollup_texts(props, "target_name")
-    workbook_full_url = _extract_rollup_url(props, "workbook_full_URL")
-    manager_people = _extract_people(props, "lecture_PIC")
-    sales_rep_people = _extract_people(props, "sales_PIC")
-
-    return {
-        "notion_page_id": page["id"],
-        "title": title,
-        "status": lecture_state,
-        "target": ", ".join(target_names) if target_names else None,
-        "lecture_start": lecture_start or None,
-        "lecture_end": lecture_end or None,
-        "students": students,
-        "workbook_full_url": workbook_full_url or None,
-        "manager": ", ".join(p["name"] for p in manager_people) if manager_people else None,
-        "manager_email": manager_people[0]["email"] if manager_people and manager_people[0]["email"] else None,
-        "sales_rep": ", ".join(p["name"] for p in sales_rep_people) if sales_rep_people else None,
-        "sales_rep_email": sales_rep_people[0]["email"] if sales_rep_people and sales_rep_people[0]["email"] else None,
-        "schedule_ids": schedule_ids,
-    }
-
-
-def _parse_schedule(page: dict) -> dict:
-    props = page.get("properties", {})
-
-    date = _extract_date_start(props, "date")
-    place = _extract_rich_text(props, "place") or _extract_text(props, "place")
-    main_tutor_ids = _extract_relation_ids(props, "main_tutor")
-    tech_tutor_ids = _extract_relation_ids(props, "tech_tutor")
-    lecture_dashboard_ids = _extract_relation_ids(props, "lecture_dashboard")
-    name = _extract_title(props, "lecture_schedule_name")
-
-    start_time = _extract_number(props, "start_time")
-    end_time = _extract_number(props, "end_time")
-
-    return {
-        "notion_page_id": page["id"],
-        "name": name,
-        "date": date,
-        "place": place,
-        "start_time": start_time,
-        "end_time": end_time,
-        "main_tutor_ids": main_tutor_ids,
-        "tech_tutor_ids": tech_tutor_ids,
-        "lecture_dashboard_ids": lecture_dashboard_ids,
-        "day_number": 1,
-    }
+def _schedule_counts() -> dict[str, int]:
+    return dict.fromkeys(_SCHEDULE_COUNT_KEYS, 0)
+
+
+def _without_id(row: dict) -> dict:
+    return {k: v for k, v in row.items() if k != "id"}
+
+
+def _normalize_id(notion_id: str) -> str:
+    """Notion id는 하이픈 유무가 섞여 들어오므로 비교 전에 통일."""
+    return notion_id.replace("-", "").lower()
+
+
+def _watermark_key(database_id: str) -> str:
+    return f"notion_watermark:{database_id}"
+
+
+def _checkpoint_key(database_id: str) -> str:
+    return f"notion_checkpoint:{database_id}"
+
+
+def _query_key(queries: list[dict | None]) -> str:
+    """체크포인트가 같은 조회 조건에서 나온 것인지 확인하는 키."""
+    return hashlib.sha1(json.dumps(queries, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _with_edited_since(filters: dict | None, watermark: str | None) -> dict | None:
+    """기존 필터에 last_edited_time >= watermark 조건을 AND로 추가."""
+    if not watermark:
+        return filters
+    edited = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": watermark}}
+    if not filters:
+        return edited
+    if "and" in filters:
+        return {"and": [edited, *filters["and"]]}
+    return {"and": [edited, filters]}
@@ -0,0 +1,183 @@
+"""Notion 파싱 결과 ↔ 로컬 DB 행 비교.
+
+dry-run 리포트와 실제 동기화가 같은 비교 로직을 쓴다.
+실제 동기화는 inserts + updates만 쓰고 unchanged는 건너뛴다.
+"""
+
+import sys
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass, field
+
+INSTRUCTOR_FIELDS = ("name", "email", "phone", "specialty", "is_active")
+COURSE_FIELDS = (
+    "title", "status", "target", "students", "lecture_start", "lecture_end",
+    "workbook_full_url", "manager", "manager_email", "sales_rep", "sales_rep_email",
+)
+# source: Notion 일정과 겹치는 수동 날짜는 동기화 소유('notion')로 바꾼다
+COURSE_DATE_FIELDS = ("day_number", "place", "start_time", "end_time", "source")
+# 배정은 (강사, 날짜) 충돌 시 기존 행을 유지하므로 키만 비교
+ASSIGNMENT_FIELDS: tuple[str, ...] = ()
+
+# 스냅샷으로 읽는 컬럼: id/키 + 비교 필드 (+ 동기화가 참조하는 값)
+INSTRUCTOR_COLUMNS = ("id", "notion_page_id", *INSTRUCTOR_FIELDS)
+COURSE_COLUMNS = (
+    "id", "notion_page_id", *COURSE_FIELDS, "assignment_status", "total_dates", "assigned_dates",
+)
+COURSE_DATE_COLUMNS = ("id", "course_id", "date", *COURSE_DATE_FIELDS)
+ASSIGNMENT_COLUMNS = (
+    "id", "course_date_id", "instructor_id", "date", "class_name", "source", *ASSIGNMENT_FIELDS,
+)
+
+
+def page_key(row: dict) -> str:
+    return row["notion_page_id"]
+
+
+def course_date_key(row: dict) -> tuple[str, str]:
+    return row["course_id"], str(row["date"])
+
+
+def assignment_key(row: dict) -> tuple[str, str]:
+    return row["instructor_id"], str(row["date"])
+
+
+class IdMap:
+    """Notion page id → 로컬 id 매핑 (강사/강의).
+
+    키·값을 intern해 두므로 파서가 intern한 relation id로 찾을 때
+    같은 문자열 객체를 공유하고, 매핑 자체도 id 문자열 사본을 따로 들지 않는다.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, pairs: Mapping[str, str] | Iterable[tuple[str, str]] = ()):
+        self._ids: dict[str, str] = {}
+        self.update(pairs)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "IdMap":
+        return cls((row["notion_page_id"], row["id"]) for row in rows)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, notion_id: str) -> bool:
+        return notion_id in self._ids
+
+    def get(self, notion_id: str) -> str | None:
+        return self._ids.get(notion_id)
+
+    def first(self, notion_ids: Iterable[str]) -> str | None:
+        """notion_ids 중 처음으로 매핑된 로컬 id."""
+        for notion_id in notion_ids:
+            local_id = self._ids.get(notion_id)
+            if local_id:
+                return local_id
+        return None
+
+    def update(self, pairs: Mapping[str, str] | Iterable[tuple[str, str]]) -> None:
+        items = pairs.items() if isinstance(pairs, Mapping) else pairs
+        for notion_id, local_id in items:
+            self._ids[sys.intern(notion_id)] = sys.intern(local_id)
+
+
+@dataclass
+class TableDiff:
+    inserts: list[dict] = field(default_factory=list)
+    # 들어온 행 (기존 id는 "id"에 채워 둠)
+    updates: list[dict] = field(default_factory=list)
+    # 기존 행
+    unchanged: list[dict] = field(default_factory=list)
+
+    @property
+    def changed(self) -> list[dict]:
+        return self.inserts + self.updates
+
+
+class DiffIndex:
+    """테이블 1개의 기존 행 인덱스 (key → 행).
+
+    배치마다 diff()로 분류하고, 실제로 쓴 결과는 apply()로 반영한다.
+    한 번이라도 들어온 키는 기억해 두었다가 orphans()에서 제외한다.
+    """
+
+    def __init__(self, rows: Iterable[dict], key: Callable[[dict], Hashable], fields: tuple[str, ...]):
+        self._key = key
+        self._fields = fields
+        # 저장소가 돌려준 dict를 apply()로 건드리지 않도록 복사해 둔다
+        self._rows: dict[Hashable, dict] = {key(r): dict(r) for r in rows}
+        self._seen: set[Hashable] = set()
+
+    def get(self, key: Hashable) -> dict | None:
+        return self._rows.get(key)
+
+    def rows(self) -> Iterable[dict]:
+        return self._rows.values()
+
+    def diff(self, incoming: Iterable[dict]) -> TableDiff:
+        """같은 키가 여러 번 들어오면 마지막 값을 쓴다."""
+        deduped = {self._key(row): row for row in incoming}
+        result = TableDiff()
+        for key, row in deduped.items():
+            self._seen.add(key)
+            existing = self._rows.get(key)
+            if existing is None:
+                result.inserts.append(row)
+            elif _changed(existing, row, self._fields):
+                result.updates.append({**row, "id": existing["id"]})
+            else:
+                result.unchanged.append(existing)
+        return result
+
+    def apply(self, rows: Iterable[dict]) -> None:
+        """저장된 행(id 포함)을 인덱스에 반영. 기존 행의 나머지 컬럼은 유지."""
+        for row in rows:
+            key = self._key(row)
+            existing = self._rows.get(key)
+            if existing is None:
+                self._rows[key] = dict(row)
+            else:
+                existing.update(row)
+
+    def discard(self, rows: Iterable[dict]) -> None:
+        """삭제한 행을 인덱스에서 뺀다."""
+        for row in rows:
+            self._rows.pop(self._key(row), None)
+
+    def orphans(self, scope: Callable[[dict], bool] | None = None) -> list[dict]:
+        """이번 동기화에서 한 번도 들어오지 않은 기존 행 (scope로 비교 범위 제한)."""
+        return [
+            row for key, row in self._rows.items()
+            if key not in self._seen and (scope is None or scope(row))
+        ]
+
+
+@dataclass
+class DiffReport:
+    """dry-run 결과: 테이블별 inserts/updates/unchanged/orphans 건수."""
+
+    tables: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def add(self, table: str, diff: TableDiff) -> None:
+        counts = self.tables.setdefault(table, dict.fromkeys(("inserts", "updates", "unchanged", "orphans"), 0))
+        counts["inserts"] += len(diff.inserts)
+        counts["updates"] += len(diff.updates)
+        counts["unchanged"] += len(diff.unchanged)
+
+    def set_orphans(self, table: str, orphans: list[dict]) -> None:
+        counts = self.tables.setdefault(table, dict.fromkeys(("inserts", "updates", "unchanged", "orphans"), 0))
+        counts["orphans"] = len(orphans)
+
+
+def _changed(existing: dict, row: dict, fields: tuple[str, ...]) -> bool:
+    """저장된 값과 Notion 값 비교 (빈 문자열은 None, 9 == 9.0)."""
+    for name in fields:
+        if name not in row:
+            continue
+        old, new = existing.get(name), row[name]
+        if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+            if float(old) != float(new):
+                return True
+        elif (old if old != "" else None) != (new if new != "" else None):
+            return True
+    return False
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from exceptions import SyncJobConflictError
+from services.notion_sync_service import SyncProgressCallback
+
+logger = logging.getLogger(__name__)
+
+# 상태 조회용으로 메모리에 남겨두는 최근 작업 수
+_MAX_FINISHED_JOBS = 20
+
+SyncRunner = Callable[[SyncProgressCallback], Awaitable[dict]]
+
+
+@dataclass
+class SyncJob:
+    """백그라운드 Notion 동기화 작업 1건의 상태."""
+
+    id: str
+    kind: str
+    full: bool
+    status: str = "pending"  # pending → running → succeeded | failed
+    phase: str | None = None
+    progress: dict[str, int] = field(default_factory=dict)
+    # 단계별 소요 시간(초). 진행 중인 단계는 현재까지의 경과 시간
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    # 실패 원인 (요청을 기다리는 쪽이 같은 예외로 응답할 수 있게)
+    exception: BaseException | None = field(default=None, repr=False)
+    _phase_started: float = field(default=0.0, repr=False)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("pending", "running")
+
+    def report(self, phase: str, counts: dict[str, int]) -> None:
+        now = time.monotonic()
+        if phase != self.phase:
+            self._close_phase(now)
+            self.phase = phase
+            self.progress = {}
+            self._phase_started = now
+        self.progress.update(counts)
+        self.phase_seconds[phase] = round(now - self._phase_started, 3)
+
+    def _close_phase(self, now: float) -> None:
+        if self.phase is not None:
+            self.phase_seconds[self.phase] = round(now - self._phase_started, 3)
+
+
+class SyncJobManager:
+    """Notion 동기화를 백그라운드 작업으로 실행한다.
+
+    한 번에 하나의 동기화만 돌고(single-flight), 실행 중에 들어온 같은 종류(kind, full)의
+    요청은 새 작업을 만들지 않고 실행 중인 작업을 그대로 돌려받는다.
+    다른 종류의 요청은 SyncJobConflictError (결과가 다른 작업에 합쳐지지 않도록).
+    앱 lifespan에서 생성하고 종료 시 shutdown()으로 정리할 것.
+    """
+
+    def __init__(self, max_finished_jobs: int = _MAX_FINISHED_JOBS):
+        self._jobs: OrderedDict[str, SyncJob] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._current: SyncJob | None = None
+        self._max_finished_jobs = max_finished_jobs
+
+    @property
+    def current(self) -> SyncJob | None:
+        return self._current if self._current and self._current.is_active else None
+
+    def start(self, kind: str, full: bool, runner: SyncRunner) -> tuple[SyncJob, bool]:
+        """작업을 시작한다. (job, 새로 만들었는지) 반환.
+
+        같은 종류의 작업이 실행 중이면 runner는 호출되지 않고 그 작업을 돌려준다.
+        다른 종류의 작업이 실행 중이면 SyncJobConflictError.
+        """
+        current = self.current
+        if current:
+            if current.kind == kind and current.full == full:
+                return current, False
+            raise SyncJobConflictError(
+                f"다른 동기화가 실행 중입니다 ({current.kind}, full={current.full}). 끝난 뒤 다시 시도하세요"
+            )
+
+        job = SyncJob(id=uuid.uuid4().hex, kind=kind, full=full)
+        self._jobs[job.id] = job
+        self._current = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job, runner))
+        self._prune()
+        return job, True
+
+    async def run(self, kind: str, full: bool, runner: SyncRunner) -> SyncJob:
+        """실행 중인 작업이 끝나기를 기다렸다가 새 작업을 실행하고, 끝날 때까지 기다린다."""
+        while True:
+            try:
+                job, created = self.start(kind, full, runner)
+            except SyncJobConflictError:
+                await self.wait(self._current.id)
+                continue
+            job = await self.wait(job.id)
+            if created:
+                return job
+
+    def get(self, job_id: str) -> SyncJob | None:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[SyncJob]:
+        """최근 작업부터."""
+        return list(reversed(self._jobs.values()))
+
+    async def wait(self, job_id: str) -> SyncJob:
+        task = self._tasks.get(job_id)
+        if task:
+            await asyncio.shield(task)
+        return self._jobs[job_id]
+
+    async def shutdown(self) -> None:
+        tasks = [t for t in self._tasks.values() if not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: SyncJob, runner: SyncRunner) -> None:
+        job.status = "running"
+        job.started_at = datetime.now(timezone.utc)
+        try:
+            job.result = await runner(job.report)
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "cancelled"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+            job.exception = e
+            logger.warning("job %s (%s) failed: %s", job.id, job.kind, job.error)
+        finally:
+            job._close_phase(time.monotonic())
+            job.finished_at = datetime.now(timezone.utc)
+            self._tasks.pop(job.id, None)
+
+    def _prune(self) -> None:
+        finished = [j for j in self._jobs.values() if not j.is_active]
+        for job in finished[: max(0, len(finished) - self._max_finished_jobs)]:
+            del self._jobs[job.id]
@@ -0,0 +1,115 @@
+import inspect
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+# 실행 1건에 보관할 최대 오류 메시지 수
+_MAX_ERRORS = 20
+
+# 이 접두사로 시작하는 저장소 메서드는 읽기로 집계
+_READ_PREFIXES = ("list_", "get_")
+
+
+@dataclass
+class SyncRunMetrics:
+    """동기화 실행 1건의 계측값. 끝나면 sync_runs 테이블에 한 행으로 저장한다.
+
+    phase_seconds 항목:
+    - notion_wait: Notion 응답을 기다린 시간 (조회가 처리보다 늦을 때만 쌓임)
+    - parse: 페이지 파싱
+    - db_read / db_write: 저장소 호출 (호출 수는 db_calls)
+    - assignment_status: 배정 상태 집계 (저장 제외)
+    - total: 전체
+    """
+
+    kind: str
+    full: bool = False
+    dry_run: bool = False
+    status: str = "running"
+    error: str | None = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    notion_requests: int = 0
+    notion_pages: int = 0
+    db_calls: int = 0
+    # 테이블 → {inserted, updated, deleted, skipped}
+    rows: dict[str, dict[str, int]] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def count_rows(self, table: str, inserted: int = 0, updated: int = 0, deleted: int = 0, skipped: int = 0) -> None:
+        counts = self.rows.setdefault(table, dict.fromkeys(("inserted", "updated", "deleted", "skipped"), 0))
+        counts["inserted"] += inserted
+        counts["updated"] += updated
+        counts["deleted"] += deleted
+        counts["skipped"] += skipped
+
+    def record_error(self, message: str) -> None:
+        if len(self.errors) < _MAX_ERRORS:
+            self.errors.append(message)
+
+    def finish(self, error: BaseException | None = None) -> None:
+        self.finished_at = datetime.now(timezone.utc)
+        self.add_time("total", (self.finished_at - self.started_at).total_seconds())
+        if error is None:
+            self.status = "succeeded"
+        else:
+            self.status = "failed"
+            self.error = f"{type(error).__name__}: {error}"
+
+    def as_row(self) -> dict:
+        return {
+            "kind": self.kind,
+            "full": self.full,
+            "dry_run": self.dry_run,
+            "status": self.status,
+            "error": self.error,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": round(self.phase_seconds.get("total", 0.0), 3),
+            "phase_seconds": {k: round(v, 3) for k, v in self.phase_seconds.items()},
+            "notion_requests": self.notion_requests,
+            "notion_pages": self.notion_pages,
+            "db_calls": self.db_calls,
+            "rows": self.rows,
+            "errors": self.errors,
+        }
+
+
+class InstrumentedRepository:
+    """저장소를 감싸 비동기 메서드 호출 수와 소요 시간을 현재 실행의 metrics에 더한다."""
+
+    def __init__(self, repo, metrics: Callable[[], SyncRunMetrics | None]):
+        self._repo = repo
+        self._metrics = metrics
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._repo, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        phase = "db_read" if name.startswith(_READ_PREFIXES) else "db_write"
+
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await attr(*args, **kwargs)
+            finally:
+                metrics = self._metrics()
+                if metrics:
+                    metrics.db_calls += 1
+                    metrics.add_time(phase, time.perf_counter() - started)
+
+        return timed
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import random
+from collections.abc import Callable
+
+from config import Settings
+from exceptions import SyncJobConflictError
+from services.notion_sync_service import NotionSyncService
+from services.sync_job_service import SyncJobManager
+
+logger = logging.getLogger(__name__)
+
+
+class SyncScheduler:
+    """일정 주기로 delta 동기화(sync_all)를 백그라운드 작업으로 실행한다.
+
+    - 매 주기마다 ±jitter초를 섞어 여러 인스턴스가 같은 시각에 몰리지 않게 한다.
+    - 이전 동기화(수동 포함)가 아직 실행 중이면 해당 주기는 건너뛴다.
+    - 실패가 이어지면 주기를 2배씩 늘리고(max_backoff까지), 성공하면 원래 주기로 돌아온다.
+    """
+
+    def __init__(
+        self,
+        jobs: SyncJobManager,
+        service_factory: Callable[[], NotionSyncService],
+        interval: float,
+        *,
+        jitter: float = 0.0,
+        max_backoff: float | None = None,
+        uniform=random.uniform,
+        sleep=asyncio.sleep,
+    ):
+        self._jobs = jobs
+        self._service_factory = service_factory
+        self._interval = interval
+        self._jitter = jitter
+        self._max_backoff = max(interval, max_backoff or interval)
+        self._uniform = uniform
+        self._sleep = sleep
+        self._failures = 0
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        jobs: SyncJobManager,
+        service_factory: Callable[[], NotionSyncService],
+    ) -> "SyncScheduler":
+        return cls(
+            jobs,
+            service_factory,
+            settings.SYNC_INTERVAL_SECONDS,
+            jitter=settings.SYNC_JITTER_SECONDS,
+            max_backoff=settings.SYNC_MAX_BACKOFF_SECONDS,
+        )
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def next_delay(self) -> float:
+        base = min(self._max_backoff, self._interval * (2 ** self._failures))
+        return max(0.0, base + self._uniform(-self._jitter, self._jitter))
+
+    async def tick(self) -> str:
+        """한 주기 실행. "skipped" / "succeeded" / "failed" 반환."""
+        if self._jobs.current:
+            logger.info("이전 동기화가 실행 중이라 이번 주기는 건너뜀")
+            return "skipped"
+
+        try:
+            job, created = self._jobs.start(
+                "scheduled", False, lambda progress: self._service_factory().sync_all(progress=progress),
+            )
+        except SyncJobConflictError:
+            return "skipped"
+        if not created:
+            return "skipped"
+
+        job = await self._jobs.wait(job.id)
+        if job.status == "succeeded":
+            self._failures = 0
+        else:
+            self._failures += 1
+        return job.status
+
+    async def _loop(self) -> None:
+        while True:
+            await self._sleep(self.next_delay())
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failures += 1
+                logger.warning("scheduler tick failed: %s", e)
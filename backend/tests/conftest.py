@@ -13,6 +13,9 @@ from dependencies import (
     get_course_date_repository,
     get_assignment_repository,
     get_availability_repository,
+    get_sync_state_repository,
+    get_sync_run_repository,
+    get_calendar_repository,
     get_current_user,
 )
 from schemas.auth import UserProfile
@@ -21,6 +24,9 @@ from tests.fakes.fake_course_repository import FakeCourseRepository
 from tests.fakes.fake_course_date_repository import FakeCourseDateRepository
 from tests.fakes.fake_assignment_repository import FakeAssignmentRepository
 from tests.fakes.fake_availability_repository import FakeAvailabilityRepository
+from tests.fakes.fake_sync_state_repository import FakeSyncStateRepository
+from tests.fakes.fake_sync_run_repository import FakeSyncRunRepository
+from tests.fakes.fake_calendar_repository import FakeCalendarRepository
 
 
 _fake_admin = UserProfile(
@@ -41,11 +47,19 @@ def app():
     fake_course_date_repo = FakeCourseDateRepository()
     fake_assignment_repo = FakeAssignmentRepository()
     fake_availability_repo = FakeAvailabilityRepository()
+    fake_sync_state_repo = FakeSyncStateRepository()
+    fake_sync_run_repo = FakeSyncRunRepository()
+    fake_calendar_repo = FakeCalendarRepository(
+        fake_assignment_repo, fake_course_date_repo, fake_course_repo, fake_instructor_repo,
+    )
     app.dependency_overrides[get_instructor_repository] = lambda: fake_instructor_repo
     app.dependency_overrides[get_course_repository] = lambda: fake_course_repo
     app.dependency_overrides[get_course_date_repository] = lambda: fake_course_date_repo
     app.dependency_overrides[get_assignment_repository] = lambda: fake_assignment_repo
     app.dependency_overrides[get_availability_repository] = lambda: fake_availability_repo
+    app.dependency_overrides[get_sync_state_repository] = lambda: fake_sync_state_repo
+    app.dependency_overrides[get_sync_run_repository] = lambda: fake_sync_run_repo
+    app.dependency_overrides[get_calendar_repository] = lambda: fake_calendar_repo
     app.dependency_overrides[get_current_user] = lambda: _fake_admin
     return app
 
@@ -1,6 +1,8 @@
 from uuid import uuid4
 
 from repositories.assignment_repository import AssignmentRepository
+from repositories.pagination import Page, paginate
+from repositories.projection import Columns, project
 from exceptions import DuplicateAssignmentError
 
 
@@ -9,18 +11,33 @@ class FakeAssignmentRepository(AssignmentRepository):
         self._store: dict[str, dict] = {}
         self._unique_index: set[tuple[str, str]] = set()  # (instructor_id, date)
 
-    async def list_assignments_by_date_range(self, start_date: str, end_date: str) -> list[dict]:
-        return [
-            a for a in self._store.values()
-            if start_date <= str(a.get("date", "")) <= end_date
-        ]
+    async def list_assignments_by_date_range(
+        self, start_date: str, end_date: str, columns: Columns = None,
+    ) -> list[dict]:
+        return project(
+            (a for a in self._store.values() if start_date <= str(a.get("date", "")) <= end_date),
+            columns,
+        )
 
-    async def list_assignments(self, filters: dict | None = None) -> list[dict]:
+    async def list_assignments(self, filters: dict | None = None, columns: Columns = None) -> list[dict]:
         items = list(self._store.values())
         if filters:
             for key, value in filters.items():
                 items = [i for i in items if str(i.get(key)) == str(value)]
-        return items
+        return project(items, columns)
+
+    async def list_assignments_page(
+        self,
+        filters: dict | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        items = [
+            a for a in await self.list_assignments(filters)
+            if (not start_date or str(a["date"]) >= start_date) and (not end_date or str(a["date"]) <= end_date)
+        ]
+        return paginate(items, ("date", "id"), limit, cursor, count)
 
     async def create_assignment(self, data: dict) -> dict:
         key = (data["instructor_id"], str(data["date"]))
@@ -33,6 +50,20 @@ class FakeAssignmentRepository(AssignmentRepository):
         self._store[assignment["id"]] = assignment
         return assignment
 
+    async def insert_assignments_bulk(self, rows: list[dict]) -> list[dict]:
+        inserted = []
+        for row in rows:
+            try:
+                inserted.append(await self.create_assignment(row))
+            except DuplicateAssignmentError:
+                pass
+        return inserted
+
+    async def update_assignments_bulk(self, assignment_ids: list[str], data: dict) -> int:
+        for assignment_id in assignment_ids:
+            self._store[assignment_id].update(data)
+        return len(assignment_ids)
+
     async def delete_assignment(self, assignment_id: str) -> bool:
         item = self._store.pop(assignment_id, None)
         if item:
@@ -40,3 +71,6 @@ class FakeAssignmentRepository(AssignmentRepository):
             self._unique_index.discard(key)
             return True
         return False
+
+    async def delete_assignments_bulk(self, assignment_ids: list[str]) -> int:
+        return sum([await self.delete_assignment(assignment_id) for assignment_id in assignment_ids])
@@ -0,0 +1,53 @@
+from repositories.assignment_repository import AssignmentRepository
+from repositories.calendar_repository import CalendarRepository
+from repositories.course_date_repository import CourseDateRepository
+from repositories.course_repository import CourseRepository
+from repositories.instructor_repository import InstructorRepository
+
+
+class FakeCalendarRepository(CalendarRepository):
+    """다른 fake 저장소를 조인해 calendar_events 뷰를 흉내 낸다."""
+
+    def __init__(
+        self,
+        assignment_repo: AssignmentRepository,
+        course_date_repo: CourseDateRepository,
+        course_repo: CourseRepository,
+        instructor_repo: InstructorRepository,
+    ):
+        self._assignment_repo = assignment_repo
+        self._course_date_repo = course_date_repo
+        self._course_repo = course_repo
+        self._instructor_repo = instructor_repo
+
+    async def list_events(self, start_date: str, end_date: str) -> list[dict]:
+        assignments = await self._assignment_repo.list_assignments_by_date_range(start_date, end_date)
+        if not assignments:
+            return []
+        instructor_map = {i["id"]: i for i in await self._instructor_repo.list_instructors()}
+        course_map = {c["id"]: c for c in await self._course_repo.list_courses()}
+        cd_to_course = {cd["id"]: cd["course_id"] for cd in await self._course_date_repo.list_all_dates()}
+
+        events = []
+        for a in assignments:
+            instructor = instructor_map.get(a["instructor_id"], {})
+            course_id = cd_to_course.get(a.get("course_date_id", ""), "")
+            course = course_map.get(course_id, {})
+            events.append({
+                "date": a["date"],
+                "instructor_id": a["instructor_id"],
+                "instructor_name": instructor.get("name", ""),
+                "course_id": course_id,
+                "course_title": course.get("title", ""),
+                "course_status": course.get("status"),
+                "assignment_status": course.get("assignment_status"),
+                "class_name": a.get("class_name"),
+                "assignment_id": a["id"],
+                "notion_page_id": course.get("notion_page_id", ""),
+                "workbook_full_url": course.get("workbook_full_url"),
+                "manager": course.get("manager"),
+                "manager_email": course.get("manager_email"),
+                "sales_rep": course.get("sales_rep"),
+                "sales_rep_email": course.get("sales_rep_email"),
+            })
+        return events
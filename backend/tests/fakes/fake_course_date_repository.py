@@ -1,17 +1,18 @@
 from uuid import uuid4
 
 from repositories.course_date_repository import CourseDateRepository
+from repositories.projection import Columns, project
 
 
 class FakeCourseDateRepository(CourseDateRepository):
     def __init__(self):
         self._store: dict[str, dict] = {}
 
-    async def list_dates_by_course(self, course_id: str) -> list[dict]:
-        return [d for d in self._store.values() if d["course_id"] == course_id]
+    async def list_dates_by_course(self, course_id: str, columns: Columns = None) -> list[dict]:
+        return project((d for d in self._store.values() if d["course_id"] == course_id), columns)
 
-    async def list_all_dates(self) -> list[dict]:
-        return list(self._store.values())
+    async def list_all_dates(self, columns: Columns = None) -> list[dict]:
+        return project(self._store.values(), columns)
 
     async def create_dates(self, course_id: str, dates: list[dict]) -> list[dict]:
         result = []
@@ -21,5 +22,27 @@ class FakeCourseDateRepository(CourseDateRepository):
             result.append(item)
         return result
 
+    async def upsert_dates_bulk(self, rows: list[dict]) -> list[dict]:
+        result = []
+        for row in rows:
+            existing = next(
+                (
+                    d for d in self._store.values()
+                    if d["course_id"] == row["course_id"] and str(d["date"]) == str(row["date"])
+                ),
+                None,
+            )
+            if existing:
+                existing.update(row)
+                result.append(existing)
+            else:
+                item = {"id": str(uuid4()), **row}
+                self._store[item["id"]] = item
+                result.append(item)
+        return result
+
     async def delete_date(self, date_id: str) -> bool:
         return self._store.pop(date_id, None) is not None
+
+    async def delete_dates_bulk(self, date_ids: list[str]) -> int:
+        return sum(self._store.pop(date_id, None) is not None for date_id in date_ids)
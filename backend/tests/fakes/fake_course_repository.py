@@ -1,14 +1,25 @@
 from uuid import uuid4
 
 from repositories.course_repository import CourseRepository
+from repositories.pagination import Page, paginate
+from repositories.projection import Columns, project
 
 
 class FakeCourseRepository(CourseRepository):
     def __init__(self):
         self._store: dict[str, dict] = {}
 
-    async def list_courses(self, filters: dict | None = None) -> list[dict]:
-        return list(self._store.values())
+    async def list_courses(self, filters: dict | None = None, columns: Columns = None) -> list[dict]:
+        return project(self._store.values(), columns)
+
+    async def list_courses_page(
+        self, filters: dict | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        items = [
+            c for c in self._store.values()
+            if all(c.get(k) == v for k, v in (filters or {}).items())
+        ]
+        return paginate(items, ("id",), limit, cursor, count)
 
     async def get_course(self, course_id: str) -> dict | None:
         return self._store.get(course_id)
@@ -22,6 +33,11 @@ class FakeCourseRepository(CourseRepository):
         self._store[course_id].update(data)
         return self._store[course_id]
 
+    async def update_courses_bulk(self, course_ids: list[str], data: dict) -> int:
+        for course_id in course_ids:
+            self._store[course_id].update(data)
+        return len(course_ids)
+
     async def delete_course(self, course_id: str) -> bool:
         return self._store.pop(course_id, None) is not None
 
@@ -31,3 +47,10 @@ class FakeCourseRepository(CourseRepository):
                 item.update(data)
                 return item
         return await self.create_course(data)
+
+    async def upsert_courses_bulk(self, rows: list[dict]) -> dict[str, str]:
+        id_map: dict[str, str] = {}
+        for row in rows:
+            course = await self.upsert_course(row)
+            id_map[row["notion_page_id"]] = course["id"]
+        return id_map
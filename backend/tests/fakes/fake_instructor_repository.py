@@ -1,17 +1,24 @@
 from uuid import uuid4
 
 from repositories.instructor_repository import InstructorRepository
+from repositories.pagination import Page, paginate
+from repositories.projection import Columns, project
 
 
 class FakeInstructorRepository(InstructorRepository):
     def __init__(self):
         self._store: dict[str, dict] = {}
 
-    async def list_instructors(self, is_active: bool | None = None) -> list[dict]:
+    async def list_instructors(self, is_active: bool | None = None, columns: Columns = None) -> list[dict]:
         items = list(self._store.values())
         if is_active is not None:
             items = [i for i in items if i["is_active"] == is_active]
-        return items
+        return project(items, columns)
+
+    async def list_instructors_page(
+        self, is_active: bool | None = None, limit: int | None = None, cursor: str | None = None, count: bool = False,
+    ) -> Page:
+        return paginate(await self.list_instructors(is_active), ("id",), limit, cursor, count)
 
     async def get_instructor(self, instructor_id: str) -> dict | None:
         return self._store.get(instructor_id)
@@ -35,3 +42,10 @@ class FakeInstructorRepository(InstructorRepository):
                 item.update(data)
                 return item
         return await self.create_instructor(data)
+
+    async def upsert_instructors_bulk(self, rows: list[dict]) -> dict[str, str]:
+        id_map: dict[str, str] = {}
+        for row in rows:
+            instructor = await self.upsert_instructor(row)
+            id_map[row["notion_page_id"]] = instructor["id"]
+        return id_map
@@ -0,0 +1,93 @@
+from clients.notion_client import NotionClient, NotionQueryBatch
+
+
+class FakeNotionClient(NotionClient):
+    """메모리 Notion 클라이언트. 동기화에서 쓰는 필터만 흉내낸다."""
+
+    def __init__(self, page_size: int = 100):
+        self._databases: dict[str, list[dict]] = {}
+        self._page_size = page_size
+        self._schemas: dict[str, dict] = {}
+        self._relations: dict[tuple[str, str], list[str]] = {}
+        self.fetched_pages: list[str] = []
+        self.queries: list[tuple[str, dict | None]] = []
+        # iter_database에 넘어온 start_cursor (이어서 조회 확인용)
+        self.start_cursors: list[str | None] = []
+
+    def add_page(self, database_id: str, page: dict) -> dict:
+        page.setdefault("last_edited_time", "2026-01-01T00:00:00.000Z")
+        page.setdefault("properties", {})
+        page.setdefault("parent", {"type": "database_id", "database_id": database_id})
+        self._databases.setdefault(database_id, []).append(page)
+        return page
+
+    def set_schema(self, database_id: str, properties: dict[str, str]) -> None:
+        """{속성 이름: 타입}으로 DB 스키마를 지정 (지정하지 않으면 페이지 속성에서 추론)."""
+        self._schemas[database_id] = {
+            name: {"type": prop_type} for name, prop_type in properties.items()
+        }
+
+    async def retrieve_database(self, database_id: str) -> dict:
+        properties = self._schemas.get(database_id)
+        if properties is None:
+            properties = {
+                name: {"type": prop["type"]}
+                for page in self._databases.get(database_id, [])
+                for name, prop in page["properties"].items()
+            }
+        return {"id": database_id, "properties": properties}
+
+    async def query_database(self, database_id: str, filters: dict | None = None) -> list[dict]:
+        results = []
+        async for batch in self.iter_database(database_id, filters):
+            results.extend(batch.results)
+        return results
+
+    async def iter_database(
+        self, database_id: str, filters: dict | None = None, start_cursor: str | None = None,
+    ):
+        self.queries.append((database_id, filters))
+        self.start_cursors.append(start_cursor)
+        pages = [p for p in self._databases.get(database_id, []) if _matches(p, filters)]
+        start = int(start_cursor) if start_cursor else 0
+        for offset in range(start, max(len(pages), start + 1), self._page_size):
+            end = offset + self._page_size
+            yield NotionQueryBatch(
+                results=pages[offset:end],
+                next_cursor=str(end) if end < len(pages) else None,
+            )
+
+    def set_relation(self, page_id: str, property_id: str, ids: list[str]) -> None:
+        """페이지 응답에 다 담기지 않는(has_more) relation의 전체 id 목록."""
+        self._relations[(page_id, property_id)] = ids
+
+    async def get_relation_ids(self, page_id: str, property_id: str) -> list[str]:
+        return self._relations[(page_id, property_id)]
+
+    async def get_page(self, page_id: str) -> dict:
+        self.fetched_pages.append(page_id)
+        for pages in self._databases.values():
+            for page in pages:
+                if page["id"] == page_id:
+                    return page
+        raise KeyError(page_id)
+
+
+def _matches(page: dict, f: dict | None) -> bool:
+    if not f:
+        return True
+    if "and" in f:
+        return all(_matches(page, sub) for sub in f["and"])
+    if "or" in f:
+        return any(_matches(page, sub) for sub in f["or"])
+    if f.get("timestamp") == "last_edited_time":
+        return page["last_edited_time"] >= f["last_edited_time"]["on_or_after"]
+
+    prop = page["properties"].get(f["property"], {})
+    for prop_type in ("status", "select"):
+        if prop_type in f:
+            name = (prop.get(prop_type) or {}).get("name")
+            return name != f[prop_type]["does_not_equal"]
+    if "relation" in f:
+        return f["relation"]["contains"] in {r["id"] for r in prop.get("relation", [])}
+    return True
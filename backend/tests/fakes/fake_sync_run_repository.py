@@ -0,0 +1,17 @@
+from uuid import uuid4
+
+from repositories.sync_run_repository import SyncRunRepository
+
+
+class FakeSyncRunRepository(SyncRunRepository):
+    def __init__(self):
+        self._store: list[dict] = []
+
+    async def create_run(self, data: dict) -> dict:
+        run = {"id": str(uuid4()), **data}
+        self._store.append(run)
+        return run
+
+    async def list_runs(self, limit: int = 50) -> list[dict]:
+        runs = sorted(self._store, key=lambda r: r["started_at"], reverse=True)
+        return runs[:limit]
@@ -0,0 +1,16 @@
+from repositories.sync_state_repository import SyncStateRepository
+
+
+class FakeSyncStateRepository(SyncStateRepository):
+    def __init__(self):
+        self._store: dict[str, dict] = {}
+
+    async def get_state(self, key: str) -> dict | None:
+        value = self._store.get(key)
+        return dict(value) if value is not None else None
+
+    async def set_state(self, key: str, value: dict) -> None:
+        self._store[key] = dict(value)
+
+    async def delete_state(self, key: str) -> None:
+        self._store.pop(key, None)
@@ -95,3 +95,27 @@ def test_available_instructors(client):
     available_ids = [i["id"] for i in resp.json()]
     assert id1 not in available_ids
     assert id2 in available_ids
+
+
+def test_list_assignments_keyset_pages_with_filters(client):
+    kim = _create_instructor(client, "김강사")
+    lee = _create_instructor(client, "이강사")
+    for instructor_id, day in ((kim, "2026-03-03"), (kim, "2026-03-01"), (kim, "2026-03-02"), (lee, "2026-03-01")):
+        client.post("/api/assignments", json={
+            "course_date_id": "cd-1", "instructor_id": instructor_id, "date": day,
+        })
+
+    first = client.get(f"/api/assignments?instructor_id={kim}&limit=2&count=true")
+    assert first.status_code == 200
+    assert [a["date"] for a in first.json()] == ["2026-03-01", "2026-03-02"]
+    assert first.headers["X-Total-Count"] == "3"
+
+    second = client.get(f"/api/assignments?instructor_id={kim}&limit=2&cursor={first.headers['X-Next-Cursor']}")
+    assert [a["date"] for a in second.json()] == ["2026-03-03"]
+    assert "X-Next-Cursor" not in second.headers
+
+    ranged = client.get("/api/assignments?start_date=2026-03-02&end_date=2026-03-03")
+    assert [a["date"] for a in ranged.json()] == ["2026-03-02", "2026-03-03"]
+
+    assert len(client.get("/api/assignments").json()) == 4
+    assert client.get("/api/assignments?limit=2&cursor=not-a-cursor").status_code == 400
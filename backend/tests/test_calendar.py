@@ -1,3 +1,11 @@
+import httpx
+import pytest
+
+from clients.impl.supabase_client_impl import SupabaseClientImpl
+from repositories.impl.supabase_calendar_repository import SupabaseCalendarRepository
+from schemas.calendar import CalendarEvent
+
+
 def test_calendar_empty(client):
     resp = client.get("/api/calendar?start_date=2026-03-01&end_date=2026-03-31")
     assert resp.status_code == 200
@@ -37,3 +45,54 @@ def test_calendar_date_filter(client):
     resp = client.get("/api/calendar?start_date=2026-04-01&end_date=2026-04-30")
     assert resp.status_code == 200
     assert resp.json()["events"] == []
+
+
+def test_calendar_joins_course_through_course_date(client):
+    instr = client.post("/api/instructors", json={"name": "박강사"}).json()
+    course = client.post("/api/courses", json={
+        "notion_page_id": "np-cal",
+        "title": "파이썬 기초",
+        "status": "진행중",
+        "manager": "담당자",
+        "start_date": "2026-03-16",
+        "end_date": "2026-03-16",
+    }).json()
+    course_date = client.get(f"/api/courses/{course['id']}").json()["dates"][0]
+    client.post("/api/assignments", json={
+        "course_date_id": course_date["id"],
+        "instructor_id": instr["id"],
+        "date": "2026-03-16",
+    })
+
+    events = client.get("/api/calendar?start_date=2026-03-01&end_date=2026-03-31").json()["events"]
+
+    assert len(events) == 1
+    assert events[0]["course_id"] == course["id"]
+    assert events[0]["course_title"] == "파이썬 기초"
+    assert events[0]["course_status"] == "진행중"
+    assert events[0]["manager"] == "담당자"
+    assert events[0]["notion_page_id"] == "np-cal"
+
+
+@pytest.mark.asyncio
+async def test_supabase_calendar_repository_reads_view_in_one_request():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[])
+
+    supabase = SupabaseClientImpl(
+        url="https://example.supabase.co", key="test-key", transport=httpx.MockTransport(handler),
+    )
+    try:
+        await SupabaseCalendarRepository(supabase).list_events("2026-03-01", "2026-03-31")
+    finally:
+        supabase.close()
+
+    assert len(seen) == 1
+    assert seen[0].url.path == "/rest/v1/calendar_events"
+    params = seen[0].url.params
+    assert set(params["select"].split(",")) == set(CalendarEvent.model_fields)
+    assert params.get_list("date") == ["gte.2026-03-01", "lte.2026-03-31"]
+    assert params["order"] == "date.asc,assignment_id.asc"
@@ -0,0 +1,112 @@
+import json
+
+import httpx
+import pytest
+
+from clients.impl.notion_client_impl import NotionClientImpl, _TokenBucket
+
+
+def _make_client(handler, **kwargs) -> NotionClientImpl:
+    kwargs.setdefault("rate_limit_per_sec", 1000.0)
+    kwargs.setdefault("backoff_base", 0.0)
+    return NotionClientImpl(token="test-token", transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_query_database_follows_cursor():
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b"{}")
+        bodies.append(body)
+        if body.get("start_cursor") == "c2":
+            return httpx.Response(200, json={"results": [{"id": "p3"}], "has_more": False})
+        return httpx.Response(
+            200, json={"results": [{"id": "p1"}, {"id": "p2"}], "has_more": True, "next_cursor": "c2"},
+        )
+
+    async with _make_client(handler) as client:
+        pages = await client.query_database("db-1", filters={"property": "x"})
+
+    assert [p["id"] for p in pages] == ["p1", "p2", "p3"]
+    assert bodies[0] == {"filter": {"property": "x"}}
+    assert bodies[1] == {"filter": {"property": "x"}, "start_cursor": "c2"}
+
+
+@pytest.mark.asyncio
+async def test_requests_share_headers_and_base_url():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "page-1"})
+
+    client = _make_client(handler)
+    await client.get_page("page-1")
+    await client.get_page("page-1")
+    await client.aclose()
+
+    assert [str(r.url) for r in seen] == ["https://api.notion.com/v1/pages/page-1"] * 2
+    assert seen[0].headers["Authorization"] == "Bearer test-token"
+    assert seen[0].headers["Notion-Version"]
+
+
+@pytest.mark.asyncio
+async def test_retries_after_429_and_5xx():
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(502),
+        httpx.Response(200, json={"id": "page-1"}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    async with _make_client(handler) as client:
+        page = await client.get_page("page-1")
+
+    assert page == {"id": "page-1"}
+    assert client.stats.requests == 3
+    assert client.stats.throttled == 1
+    assert client.stats.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    async with _make_client(handler, max_retries=2) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_page("page-1")
+
+    assert client.stats.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    async with _make_client(handler) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_page("missing")
+
+    assert client.stats.requests == 1
+    assert client.stats.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    now = [0.0]
+
+    async def fake_sleep(seconds: float):
+        now[0] += seconds
+
+    bucket = _TokenBucket(rate=2.0, capacity=1, clock=lambda: now[0], sleep=fake_sleep)
+    waits = [await bucket.acquire() for _ in range(3)]
+
+    assert waits == [0.0, 0.5, 0.5]
+
+    bucket.pause(3.0)
+    assert await bucket.acquire() == pytest.approx(3.0)
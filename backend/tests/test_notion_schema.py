@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from clients.notion_schema import compile_parser
+from exceptions import NotionSchemaError
+
+
+def _schema(**types: str) -> dict:
+    return {"properties": {name: {"type": t} for name, t in types.items()}}
+
+
+def test_compiled_parser_resolves_fallback_property_names():
+    parser = compile_parser("lecture", _schema(Name="title", 상태="select"))
+
+    parsed = parser({
+        "id": "l1",
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": "AI "}, {"plain_text": "교육"}]},
+            "상태": {"type": "select", "select": {"name": "lecture_ready"}},
+        },
+    })
+
+    assert parsed.title == "AI 교육"
+    assert parsed.status == "lecture_ready"
+    assert parsed.students is None
+    assert parsed.manager is None
+    assert parsed.schedule_ids == ()
+    assert "schedule_ids" not in parsed.as_row()
+
+
+def test_missing_required_property_fails_at_compile_time():
+    with pytest.raises(NotionSchemaError, match="lecture_dashboard"):
+        compile_parser("lecture", _schema(renamed_title="rich_text"))
+
+
+def test_schedule_parser_uses_schema_types_and_trims_datetime():
+    parser = compile_parser("schedule", _schema(
+        date="date", lecture_dashboard="relation", place="title", start_time="number",
+    ))
+
+    parsed = parser({
+        "id": "s1",
+        "properties": {
+            "date": {"type": "date", "date": {"start": "2026-03-02T10:00:00+09:00"}},
+            "lecture_dashboard": {"type": "relation", "relation": [{"id": "l1"}]},
+            "place": {"type": "title", "title": [{"plain_text": "강남"}]},
+            "start_time": {"type": "number", "number": 9},
+        },
+    })
+
+    assert parsed.date == "2026-03-02"
+    assert parsed.lecture_dashboard_ids == ("l1",)
+    assert parsed.place == "강남"
+    assert parsed.start_time == 9
+    assert parsed.main_tutor_ids == ()
+
+
+def test_compiled_parser_and_records_are_picklable():
+    parser = compile_parser("tutor", _schema(unique_name="title", real_name="rich_text"))
+    assert pickle.loads(pickle.dumps(parser)) == parser
+
+    record = parser({
+        "id": "t1",
+        "properties": {"unique_name": {"type": "title", "title": [{"plain_text": "김강사"}]}},
+    })
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert not hasattr(record, "__dict__")
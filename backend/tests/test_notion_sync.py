@@ -0,0 +1,570 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from clients.notion_client import NotionQueryBatch
+from config import Settings
+from exceptions import NotionSchemaError
+from repositories.impl.notion_course_repository import NotionCourseRepository
+from services.notion_sync_service import NotionSyncService
+from tests.fakes.fake_assignment_repository import FakeAssignmentRepository
+from tests.fakes.fake_course_date_repository import FakeCourseDateRepository
+from tests.fakes.fake_course_repository import FakeCourseRepository
+from tests.fakes.fake_instructor_repository import FakeInstructorRepository
+from tests.fakes.fake_notion_client import FakeNotionClient
+from tests.fakes.fake_sync_run_repository import FakeSyncRunRepository
+from tests.fakes.fake_sync_state_repository import FakeSyncStateRepository
+
+TUTOR_DB = "db-tutor"
+LECTURE_DB = "db-lecture"
+SCHEDULE_DB = "db-schedule"
+
+
+def _title(text: str) -> dict:
+    return {"type": "title", "title": [{"plain_text": text}]}
+
+
+def _relation(*ids: str) -> dict:
+    return {"type": "relation", "relation": [{"id": i} for i in ids]}
+
+
+def _tutor_page(page_id: str, name: str, **extra) -> dict:
+    return {"id": page_id, "properties": {"unique_name": _title(name)}, **extra}
+
+
+def _lecture_page(page_id: str, title: str, state: str = "lecture_ready", **extra) -> dict:
+    return {
+        "id": page_id,
+        "properties": {
+            "lecture_dashboard": _title(title),
+            "lecture_state": {"type": "status", "status": {"name": state}},
+        },
+        **extra,
+    }
+
+
+def _schedule_page(page_id: str, date: str, lecture_id: str, tutor_ids=(), **extra) -> dict:
+    return {
+        "id": page_id,
+        "properties": {
+            "date": {"type": "date", "date": {"start": date}},
+            "lecture_dashboard": _relation(lecture_id),
+            "main_tutor": _relation(*tutor_ids),
+        },
+        **extra,
+    }
+
+
+@pytest.fixture
+def notion():
+    client = FakeNotionClient()
+    client.add_page(TUTOR_DB, _tutor_page("t1", "김강사"))
+    client.add_page(LECTURE_DB, _lecture_page("l1", "AI 교육"))
+    client.add_page(SCHEDULE_DB, _schedule_page("s1", "2026-03-02", "l1", ["t1"]))
+    return client
+
+
+@pytest.fixture
+def repos():
+    return {
+        "instructor_repo": FakeInstructorRepository(),
+        "course_repo": FakeCourseRepository(),
+        "course_date_repo": FakeCourseDateRepository(),
+        "assignment_repo": FakeAssignmentRepository(),
+        "sync_state_repo": FakeSyncStateRepository(),
+        "sync_run_repo": FakeSyncRunRepository(),
+    }
+
+
+def _service(notion, repos, parse_executor=None, **overrides) -> NotionSyncService:
+    settings = Settings(
+        NOTION_DB_TUTOR=TUTOR_DB, NOTION_DB_LECTURE=LECTURE_DB, NOTION_DB_SCHEDULE=SCHEDULE_DB, **overrides,
+    )
+    return NotionSyncService(client=notion, settings=settings, parse_executor=parse_executor, **repos)
+
+
+def _has_edited_filter(filters: dict | None) -> bool:
+    if not filters:
+        return False
+    if filters.get("timestamp") == "last_edited_time":
+        return True
+    return any(_has_edited_filter(sub) for sub in filters.get("and", []))
+
+
+@pytest.mark.asyncio
+async def test_sync_all_creates_rows(notion, repos):
+    result = await _service(notion, repos).sync_all()
+
+    assert result == {
+        "tutors": 1,
+        "courses": 1,
+        "schedules": 1,
+        "schedules_updated": 0,
+        "schedules_skipped": 0,
+        "schedules_deleted": 0,
+        "assignments": 1,
+        "assignments_skipped": 0,
+        "assignments_deleted": 0,
+    }
+    [course] = await repos["course_repo"].list_courses()
+    assert course["assignment_status"] == "배정 완료"
+
+
+@pytest.mark.asyncio
+async def test_sync_all_closes_tutor_stream_when_lecture_stream_fails(notion, repos):
+    service = _service(notion, repos)
+    opened = []
+    open_stream = service._open_stream
+
+    async def failing_open(database_id, queries, full, phase):
+        if phase == "courses":
+            raise RuntimeError("watermark 조회 실패")
+        stream = await open_stream(database_id, queries, full, phase)
+        opened.append(stream)
+        return stream
+
+    service._open_stream = failing_open
+    with pytest.raises(RuntimeError):
+        await service.sync_all()
+    await asyncio.sleep(0)
+
+    [tutors] = opened
+    assert tutors._producer.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_sync_records_run_metrics(notion, repos):
+    await _service(notion, repos).sync_all(full=True)
+
+    [run] = await repos["sync_run_repo"].list_runs()
+    assert run["kind"] == "all" and run["full"] is True and run["status"] == "succeeded"
+    assert run["notion_pages"] == 3
+    assert run["db_calls"] > 0
+    assert {"parse", "notion_wait", "db_read", "db_write", "assignment_status", "total"} <= set(run["phase_seconds"])
+    assert run["rows"]["instructors"] == {"inserted": 1, "updated": 0, "deleted": 0, "skipped": 0}
+    assert run["rows"]["course_dates"]["inserted"] == 1
+    assert run["rows"]["assignments"]["inserted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_second_sync_only_queries_changed_pages(notion, repos):
+    await _service(notion, repos).sync_all()
+    assert not any(_has_edited_filter(f) for _, f in notion.queries)
+
+    notion.queries.clear()
+    now = datetime.now(timezone.utc).isoformat()
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l1", last_edited_time=now))
+
+    result = await _service(notion, repos).sync_all()
+
+    assert all(_has_edited_filter(f) for _, f in notion.queries)
+    assert result["tutors"] == 0
+    assert result["schedules"] == 1
+    dates = await repos["course_date_repo"].list_all_dates()
+    assert sorted(d["date"] for d in dates) == ["2026-03-02", "2026-03-03"]
+
+
+@pytest.mark.asyncio
+async def test_full_sync_ignores_watermark(notion, repos):
+    await _service(notion, repos).sync_all()
+    notion.queries.clear()
+
+    result = await _service(notion, repos).sync_all(full=True)
+
+    assert not any(_has_edited_filter(f) for _, f in notion.queries)
+    assert result["tutors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_resync_updates_changed_dates_and_skips_the_rest(notion, repos):
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l1", ["t1"]))
+    await _service(notion, repos).sync_all()
+
+    s2 = notion._databases[SCHEDULE_DB][1]
+    s2["properties"]["place"] = {"type": "rich_text", "rich_text": [{"plain_text": "강남"}]}
+
+    result = await _service(notion, repos).sync_all(full=True)
+
+    assert result["schedules"] == 0
+    assert result["schedules_updated"] == 1
+    assert result["schedules_skipped"] == 1
+    assert result["assignments"] == 0
+    assert result["assignments_skipped"] == 2
+    dates = await repos["course_date_repo"].list_all_dates()
+    assert {d["date"]: d["place"] for d in dates} == {"2026-03-02": None, "2026-03-03": "강남"}
+
+
+@pytest.mark.asyncio
+async def test_assignment_status_only_writes_changed_courses(notion, repos):
+    await _service(notion, repos).sync_all()
+
+    calls = []
+    course_repo = repos["course_repo"]
+    original = course_repo.update_courses_bulk
+
+    async def spy(course_ids, data):
+        calls.append((list(course_ids), data))
+        return await original(course_ids, data)
+
+    course_repo.update_courses_bulk = spy
+
+    await _service(notion, repos).sync_all(full=True)
+    assert calls == []
+
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l1"))
+    await _service(notion, repos).sync_all(full=True)
+
+    [(course_ids, data)] = calls
+    assert data == {"assignment_status": "배정 미완료", "total_dates": 2, "assigned_dates": 1}
+
+
+@pytest.mark.asyncio
+async def test_sync_streams_multi_batch_results(repos):
+    notion = FakeNotionClient(page_size=2)
+    for i in range(5):
+        notion.add_page(TUTOR_DB, _tutor_page(f"t{i}", f"강사{i}"))
+
+    result = await _service(notion, repos).sync_tutors()
+
+    assert result == {"tutors": 5}
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_aborts_sync_without_saving_watermark(notion, repos):
+    async def broken_iter(database_id, filters=None, start_cursor=None):
+        yield NotionQueryBatch(results=[_tutor_page("t9", "오류전")], next_cursor="c1")
+        raise RuntimeError("notion 502")
+
+    notion.iter_database = broken_iter
+
+    with pytest.raises(RuntimeError):
+        await _service(notion, repos).sync_tutors()
+
+    assert await repos["sync_state_repo"].get_state(f"notion_watermark:{TUTOR_DB}") is None
+    [run] = await repos["sync_run_repo"].list_runs()
+    assert run["kind"] == "tutors" and run["status"] == "failed"
+    assert run["error"] == "RuntimeError: notion 502"
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_resumes_from_last_committed_batch(repos):
+    notion = FakeNotionClient(page_size=1)
+    notion.add_page(TUTOR_DB, _tutor_page("t1", "김강사"))
+    notion.add_page(LECTURE_DB, _lecture_page("l1", "AI 교육"))
+    for i in range(3):
+        notion.add_page(SCHEDULE_DB, _schedule_page(f"s{i}", f"2026-03-0{i + 2}", "l1"))
+    original_iter = notion.iter_database
+
+    async def flaky_iter(database_id, filters=None, start_cursor=None):
+        async for batch in original_iter(database_id, filters, start_cursor):
+            yield batch
+            if database_id == SCHEDULE_DB and batch.next_cursor == "2":
+                raise RuntimeError("notion 502")
+
+    notion.iter_database = flaky_iter
+    with pytest.raises(RuntimeError):
+        await _service(notion, repos).sync_all()
+    checkpoint = await repos["sync_state_repo"].get_state(f"notion_checkpoint:{SCHEDULE_DB}")
+    assert (checkpoint["cursor"], checkpoint["batches"]) == ("2", 2)
+
+    notion.iter_database = original_iter
+    notion.start_cursors.clear()
+    result = await _service(notion, repos).sync_all()
+
+    # 일정은 세 번째 배치부터 이어서 조회 (튜터/강의는 완료된 상태라 delta로 다시 조회)
+    assert notion.start_cursors == [None, None, "2"]
+    assert result["schedules"] == 1
+    dates = await repos["course_date_repo"].list_all_dates()
+    assert sorted(d["date"] for d in dates) == ["2026-03-02", "2026-03-03", "2026-03-04"]
+    assert await repos["sync_state_repo"].get_state(f"notion_checkpoint:{SCHEDULE_DB}") is None
+    assert await repos["sync_state_repo"].get_state(f"notion_watermark:{SCHEDULE_DB}") is not None
+
+
+@pytest.mark.asyncio
+async def test_sync_all_fetches_tutors_and_lectures_concurrently(notion, repos):
+    both_started = asyncio.Event()
+    started = []
+    original_iter = notion.iter_database
+
+    async def gated_iter(database_id, filters=None, start_cursor=None):
+        started.append(database_id)
+        if len(started) == 2:
+            both_started.set()
+        # 튜터/강의 조회가 모두 시작되어야 첫 배치를 내보낸다 (순차 조회라면 타임아웃)
+        if database_id != SCHEDULE_DB:
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+        async for batch in original_iter(database_id, filters):
+            yield batch
+
+    notion.iter_database = gated_iter
+
+    result = await _service(notion, repos).sync_all()
+
+    # 일정은 강의 반영이 끝난 뒤 조회
+    assert sorted(started[:2]) == sorted([TUTOR_DB, LECTURE_DB])
+    assert started[2] == SCHEDULE_DB
+    assert (result["tutors"], result["courses"], result["schedules"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_schedule_query_only_covers_active_lectures(notion, repos):
+    notion.add_page(LECTURE_DB, _lecture_page("l2", "종료 교육", state="tax_invoice"))
+    await repos["course_repo"].upsert_courses_bulk([
+        {"notion_page_id": "l2", "title": "종료 교육", "status": "tax_invoice"},
+    ])
+    notion.add_page(LECTURE_DB, _lecture_page("l3", "데이터 교육"))
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l2"))
+    notion.add_page(SCHEDULE_DB, _schedule_page("s3", "2026-03-04", "unknown-lecture"))
+    notion.add_page(SCHEDULE_DB, _schedule_page("s4", "2026-03-05", "l3"))
+
+    result = await _service(notion, repos, NOTION_SCHEDULE_FILTER_CHUNK_SIZE=1).sync_all()
+
+    # 활성 강의(l1, l3)마다 relation 조건 쿼리 1개, 완료/미등록 강의의 일정은 받지 않는다
+    schedule_filters = [f for db, f in notion.queries if db == SCHEDULE_DB]
+    assert schedule_filters == [
+        {"or": [{"property": "lecture_dashboard", "relation": {"contains": lid}}]} for lid in ("l1", "l3")
+    ]
+    assert (result["schedules"], result["schedules_skipped"]) == (2, 0)
+    dates = await repos["course_date_repo"].list_all_dates()
+    assert sorted(d["date"] for d in dates) == ["2026-03-02", "2026-03-05"]
+
+
+@pytest.mark.asyncio
+async def test_active_lecture_filter_follows_schema_property(notion, repos):
+    lecture = notion._databases[LECTURE_DB][0]
+    lecture["properties"]["상태"] = {"type": "select", "select": {"name": "lecture_ready"}}
+    del lecture["properties"]["lecture_state"]
+    notion.add_page(LECTURE_DB, _lecture_page("l2", "끝난 교육"))
+    notion._databases[LECTURE_DB][1]["properties"] = {
+        "lecture_dashboard": _title("끝난 교육"),
+        "상태": {"type": "select", "select": {"name": "tax_invoice"}},
+    }
+
+    result = await _service(notion, repos).sync_all()
+
+    [lecture_filter] = [f for db, f in notion.queries if db == LECTURE_DB]
+    assert lecture_filter == {"and": [
+        {"property": "상태", "select": {"does_not_equal": "lecture_stop"}},
+        {"property": "상태", "select": {"does_not_equal": "tax_invoice"}},
+    ]}
+    assert result["courses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_without_lecture_state_property_fails_before_querying(notion, repos):
+    del notion._databases[LECTURE_DB][0]["properties"]["lecture_state"]
+
+    with pytest.raises(NotionSchemaError):
+        await _service(notion, repos).sync_all()
+
+    assert notion.queries == []
+
+
+@pytest.mark.asyncio
+async def test_process_pool_parsing_matches_inline_parsing(repos):
+    notion = FakeNotionClient(page_size=60)
+    for i in range(120):
+        notion.add_page(TUTOR_DB, _tutor_page(f"t{i}", f"강사{i}"))
+    notion.add_page(LECTURE_DB, _lecture_page("l1", "AI 교육"))
+    notion.add_page(SCHEDULE_DB, _schedule_page("s1", "2026-03-02", "l1", ["t7"]))
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        result = await _service(notion, repos, pool, NOTION_SYNC_PARSE_WORKERS=2).sync_all()
+
+    assert (result["tutors"], result["courses"], result["schedules"], result["assignments"]) == (120, 1, 1, 1)
+    names = {i["name"] for i in await repos["instructor_repo"].list_instructors()}
+    assert names == {f"강사{i}" for i in range(120)}
+
+
+@pytest.mark.asyncio
+async def test_dry_run_reports_changes_without_writing(notion, repos):
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l1", ["t1"]))
+    await _service(notion, repos).sync_all()
+    watermark = await repos["sync_state_repo"].get_state(f"notion_watermark:{SCHEDULE_DB}")
+
+    notion.add_page(TUTOR_DB, _tutor_page("t2", "박강사"))
+    notion.add_page(SCHEDULE_DB, _schedule_page("s3", "2026-03-04", "l1", ["t2"]))
+    s2 = notion._databases[SCHEDULE_DB][1]
+    s2["properties"]["place"] = {"type": "rich_text", "rich_text": [{"plain_text": "강남"}]}
+    notion._databases[SCHEDULE_DB].pop(0)  # s1(2026-03-02) 삭제
+    notion.add_page(LECTURE_DB, _lecture_page("l2", "끝난 교육", state="tax_invoice"))
+    await repos["course_repo"].create_course({"notion_page_id": "l2", "title": "끝난 교육", "status": "tax_invoice"})
+
+    report = await _service(notion, repos).sync_all(dry_run=True)
+
+    assert report["instructors"] == {"inserts": 1, "updates": 0, "unchanged": 1, "orphans": 0}
+    assert report["courses"] == {"inserts": 0, "updates": 0, "unchanged": 1, "orphans": 0}
+    assert report["course_dates"] == {"inserts": 1, "updates": 1, "unchanged": 0, "orphans": 1}
+    assert report["assignments"] == {"inserts": 1, "updates": 0, "unchanged": 1, "orphans": 1}
+    assert len(await repos["instructor_repo"].list_instructors()) == 1
+    dates = await repos["course_date_repo"].list_all_dates()
+    assert {d["date"]: d["place"] for d in dates} == {"2026-03-02": None, "2026-03-03": None}
+    assert await repos["sync_state_repo"].get_state(f"notion_watermark:{SCHEDULE_DB}") == watermark
+
+
+@pytest.mark.asyncio
+async def test_sync_course_fetches_only_that_lecture_and_its_schedules(notion, repos):
+    await _service(notion, repos).sync_all()
+    [course] = await repos["course_repo"].list_courses()
+
+    lecture = notion._databases[LECTURE_DB][0]
+    # 페이지 응답에는 relation 일부만 담기고 has_more=True
+    lecture["properties"]["lecture_schedules"] = {
+        "id": "prop-ls", "type": "relation", "relation": [{"id": "s1"}], "has_more": True,
+    }
+    notion.set_relation("l1", "prop-ls", ["s1", "s2"])
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l1"))
+    notion._databases[SCHEDULE_DB][0]["properties"]["place"] = {
+        "type": "rich_text", "rich_text": [{"plain_text": "강남"}],
+    }
+    notion.queries.clear()
+
+    result = await _service(notion, repos).sync_course(course["id"])
+
+    assert notion.queries == []
+    assert sorted(notion.fetched_pages) == ["l1", "s1", "s2"]
+    assert result == {
+        "courses": 1,
+        "schedules": 1,
+        "schedules_updated": 1,
+        "schedules_skipped": 0,
+        "schedules_deleted": 0,
+        "assignments": 0,
+        "assignments_skipped": 1,
+        "assignments_deleted": 0,
+    }
+    [course] = await repos["course_repo"].list_courses()
+    assert (course["assignment_status"], course["total_dates"], course["assigned_dates"]) == ("배정 미완료", 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_full_sync_deletes_schedules_removed_from_notion(notion, repos):
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l1", ["t1"]))
+    await _service(notion, repos).sync_all()
+    [date] = await repos["course_date_repo"].create_dates(
+        (await repos["course_repo"].list_courses())[0]["id"], [{"date": "2026-03-09", "source": "manual"}],
+    )
+
+    # s2 삭제 → 날짜와 배정이 사라지고, 수동으로 넣은 날짜는 남는다
+    notion._databases[SCHEDULE_DB] = [p for p in notion._databases[SCHEDULE_DB] if p["id"] != "s2"]
+    delta = await _service(notion, repos).sync_all()
+    assert delta["schedules_deleted"] == 0
+    result = await _service(notion, repos).sync_all(full=True)
+
+    assert (result["schedules_deleted"], result["assignments_deleted"]) == (1, 1)
+    dates = await repos["course_date_repo"].list_all_dates()
+    assert sorted(d["date"] for d in dates) == ["2026-03-02", "2026-03-09"]
+    assert [a["date"] for a in await repos["assignment_repo"].list_assignments()] == ["2026-03-02"]
+    [course] = await repos["course_repo"].list_courses()
+    assert (course["total_dates"], course["assigned_dates"]) == (2, 1)
+    [run] = [r for r in await repos["sync_run_repo"].list_runs() if r["full"]]
+    assert run["rows"]["course_dates"]["deleted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_adopts_backfilled_manual_assignments_so_they_can_be_pruned(notion, repos):
+    await _service(notion, repos).sync_all()
+    # 009 마이그레이션 이전에 동기화로 생긴 배정은 'manual'로 채워져 있다
+    [assignment] = await repos["assignment_repo"].list_assignments()
+    await repos["assignment_repo"].update_assignments_bulk([assignment["id"]], {"source": "manual"})
+
+    await _service(notion, repos).sync_all(full=True)
+    [assignment] = await repos["assignment_repo"].list_assignments()
+    assert assignment["source"] == "notion"
+
+    # Notion에서 강사를 빼면 다음 full 동기화에서 정리된다
+    notion._databases[SCHEDULE_DB][0]["properties"]["main_tutor"] = _relation()
+    result = await _service(notion, repos).sync_all(full=True)
+
+    assert result["assignments_deleted"] == 1
+    assert await repos["assignment_repo"].list_assignments() == []
+
+
+@pytest.mark.asyncio
+async def test_full_sync_keeps_assignments_when_tutor_property_is_missing(notion, repos):
+    await _service(notion, repos).sync_all()
+
+    # 강사 relation 속성 이름이 바뀌면 기대 배정이 비어 보이지만, 지우지 않는다
+    schedule = notion._databases[SCHEDULE_DB][0]
+    schedule["properties"]["main_teacher"] = schedule["properties"].pop("main_tutor")
+    result = await _service(notion, repos).sync_all(full=True)
+    report = await _service(notion, repos).sync_all(dry_run=True)
+
+    assert result["assignments_deleted"] == 0
+    assert report["assignments"]["orphans"] == 0
+    assert len(await repos["assignment_repo"].list_assignments()) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_course_refuses_to_prune_without_schedule_relation(notion, repos):
+    notion._databases[LECTURE_DB][0]["properties"]["lecture_schedules"] = _relation("s1")
+    await _service(notion, repos).sync_all()
+    [course] = await repos["course_repo"].list_courses()
+
+    # 일정 relation 속성 이름이 바뀌면 빈 목록으로 읽혀 모든 날짜/배정이 지워질 수 있다
+    lecture = notion._databases[LECTURE_DB][0]
+    lecture["properties"]["schedules"] = lecture["properties"].pop("lecture_schedules")
+    with pytest.raises(NotionSchemaError):
+        await _service(notion, repos).sync_course(course["id"])
+
+    assert len(await repos["course_date_repo"].list_all_dates()) == 1
+    assert len(await repos["assignment_repo"].list_assignments()) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_course_unknown_id_is_404(notion, repos):
+    with pytest.raises(HTTPException) as exc:
+        await _service(notion, repos).sync_course("missing")
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_applies_only_changed_pages(notion, repos):
+    await _service(notion, repos).sync_all()
+    notion.queries.clear()
+
+    notion._databases[TUTOR_DB][0]["properties"]["real_name"] = {
+        "type": "rich_text", "rich_text": [{"plain_text": "김실명"}],
+    }
+    notion.add_page(SCHEDULE_DB, _schedule_page("s2", "2026-03-03", "l1", ["t1"]))
+    notion.add_page("db-other", {"id": "x1"})
+
+    result = await _service(notion, repos).sync_pages(["t1", "s2", "s2", "x1", "gone"])
+
+    assert notion.queries == []
+    assert result["tutors"] == 1
+    assert result["schedules"] == 1 and result["assignments"] == 1
+    [instructor] = await repos["instructor_repo"].list_instructors()
+    assert instructor["name"] == "김실명"
+    [course] = await repos["course_repo"].list_courses()
+    assert (course["total_dates"], course["assigned_dates"]) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_leaves_deleted_schedules_for_full_sync(notion, repos):
+    await _service(notion, repos).sync_all()
+    notion._databases[SCHEDULE_DB][0]["in_trash"] = True
+
+    result = await _service(notion, repos).sync_pages(["s1"])
+
+    assert result["schedules_deleted"] == 0
+    assert len(await repos["course_date_repo"].list_all_dates()) == 1
+    notion._databases[SCHEDULE_DB] = [_schedule_page("s2", "2026-03-03", "l1")]
+    full = await _service(notion, repos).sync_all(full=True)
+    assert (full["schedules_deleted"], full["assignments_deleted"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_notion_course_repository_pages_by_page_id(notion):
+    notion.add_page(LECTURE_DB, _lecture_page("l0", "데이터 분석"))
+    repo = NotionCourseRepository(notion, LECTURE_DB)
+
+    first = await repo.list_courses_page(limit=1, count=True)
+    second = await repo.list_courses_page(limit=1, cursor=first.next_cursor)
+
+    assert [c["notion_page_id"] for c in first.items + second.items] == ["l0", "l1"]
+    assert first.total == 2
+    assert second.next_cursor is None
@@ -0,0 +1,102 @@
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from config import settings
+from services.notion_change_queue import NotionChangeQueue
+
+
+def _event(page_id: str, event_type: str = "page.properties_updated") -> dict:
+    return {"type": event_type, "entity": {"id": page_id, "type": "page"}}
+
+
+@pytest.mark.asyncio
+async def test_queue_coalesces_bursts_into_one_batch():
+    now = [0.0]
+    batches = []
+
+    async def handler(page_ids):
+        batches.append(sorted(page_ids))
+
+    queue = NotionChangeQueue(handler, debounce=5, max_delay=60, clock=lambda: now[0])
+    for t in (0, 1, 2, 3):
+        now[0] = t
+        queue.push("l1")
+    queue.push("s1")
+
+    now[0] = 7
+    assert await queue.process_ready() == 0
+    now[0] = 8
+    assert await queue.process_ready() == 2
+    assert batches == [["l1", "s1"]]
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_flushes_continuously_edited_page_after_max_delay():
+    now = [0.0]
+    batches = []
+
+    async def handler(page_ids):
+        batches.append(page_ids)
+
+    queue = NotionChangeQueue(handler, debounce=5, max_delay=10, clock=lambda: now[0])
+    for t in range(0, 11, 2):
+        now[0] = t
+        queue.push("l1")
+
+    assert await queue.process_ready() == 1
+    assert batches == [["l1"]]
+
+
+def _post_signed(client, payload, secret: bytes = b"secret"):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    signature = "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return client.post("/api/notion/webhook", content=body, headers={"X-Notion-Signature": signature})
+
+
+def test_webhook_enqueues_changed_pages_once(client, app, monkeypatch):
+    monkeypatch.setattr(settings, "NOTION_WEBHOOK_SECRET", "secret")
+    for _ in range(3):
+        resp = _post_signed(client, _event("page-1"))
+        assert resp.status_code == 202
+    _post_signed(client, {"type": "database.schema_updated", "entity": {"id": "db", "type": "database"}})
+
+    assert len(app.state.notion_changes) == 1
+
+
+def test_webhook_without_secret_accepts_only_verification(client, app, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "NOTION_WEBHOOK_SECRET", "")
+
+    handshake = client.post("/api/notion/webhook", json={"verification_token": "secret-token-value"})
+    event = client.post("/api/notion/webhook", json=_event("page-1"))
+
+    assert handshake.status_code == 202
+    # 토큰은 서명 키이므로 로그에 남기지 않는다
+    assert "secret-token-value" not in caplog.text
+    assert event.status_code == 401
+    assert len(app.state.notion_changes) == 0
+
+
+def test_webhook_rejects_malformed_body_with_400(client, monkeypatch):
+    monkeypatch.setattr(settings, "NOTION_WEBHOOK_SECRET", "secret")
+
+    assert _post_signed(client, b"not json").status_code == 400
+    assert _post_signed(client, [1, 2]).status_code == 400
+    assert _post_signed(client, {"type": "page.created", "entity": {"type": "page"}}).status_code == 400
+    assert _post_signed(client, {"type": "page.created", "entity": "page-1"}).status_code == 400
+
+
+def test_webhook_rejects_bad_signature(client, app, monkeypatch):
+    monkeypatch.setattr(settings, "NOTION_WEBHOOK_SECRET", "secret")
+    body = json.dumps(_event("page-1")).encode()
+    signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+    bad = client.post("/api/notion/webhook", content=body, headers={"X-Notion-Signature": "sha256=bad"})
+    ok = client.post("/api/notion/webhook", content=body, headers={"X-Notion-Signature": signature})
+
+    assert bad.status_code == 401
+    assert ok.status_code == 202
+    assert len(app.state.notion_changes) == 1
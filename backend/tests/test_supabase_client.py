@@ -0,0 +1,171 @@
+import asyncio
+import json
+import re
+import threading
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from clients.impl.supabase_client_impl import SupabaseClientImpl
+from dependencies import get_current_user
+from repositories.impl import supabase_paging
+from repositories.pagination import decode_cursor
+from repositories.impl.supabase_assignment_repository import SupabaseAssignmentRepository
+from repositories.impl.supabase_course_repository import SupabaseCourseRepository
+from schemas.auth import UserProfile
+
+_KEY = "test-service-key"
+
+
+def test_queries_share_one_http_client_and_count_requests():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[{"id": "i1"}])
+
+    client = SupabaseClientImpl(
+        url="https://example.supabase.co", key=_KEY, transport=httpx.MockTransport(handler),
+    )
+    try:
+        first = client.table("instructors").select("*").execute()
+        client.table("courses").select("id").execute()
+    finally:
+        client.close()
+
+    assert first.data == [{"id": "i1"}]
+    assert [r.url.path for r in seen] == ["/rest/v1/instructors", "/rest/v1/courses"]
+    assert all(r.headers["apikey"] == _KEY for r in seen)
+    stats = client.pool_metrics()
+    assert stats["requests"] == 2
+    assert stats["errors"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 1
+    # MockTransport에는 커넥션 풀이 없으므로 풀 상태는 알 수 없음으로 둔다
+    assert stats["connections"] is None and stats["idle"] is None
+
+
+@pytest.mark.asyncio
+async def test_execute_runs_queries_off_the_event_loop_concurrently():
+    # 두 요청이 동시에 transport에 들어와야 통과 (직렬이면 barrier 타임아웃)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        barrier.wait()
+        return httpx.Response(200, json=[{"table": request.url.path.rsplit("/", 1)[-1]}])
+
+    client = SupabaseClientImpl(
+        url="https://example.supabase.co", key=_KEY, transport=httpx.MockTransport(handler),
+    )
+    try:
+        courses, dates = await asyncio.gather(
+            client.execute(client.table("courses").select("*")),
+            client.execute(client.table("course_dates").select("*")),
+        )
+    finally:
+        client.close()
+
+    assert courses.data == [{"table": "courses"}]
+    assert dates.data == [{"table": "course_dates"}]
+    assert client.pool_metrics()["peak_in_flight"] == 2
+
+
+def test_pool_metrics_are_admin_only_and_health_stays_minimal(app):
+    with TestClient(app) as client:
+        supabase = app.state.supabase
+        health = client.get("/health").json()
+        pool = client.get("/api/sync/supabase-pool").json()
+        app.dependency_overrides[get_current_user] = lambda: UserProfile(
+            id="p", user_id="u", email="tutor@teamsparta.co", role="instructor", display_name="강사",
+        )
+        forbidden = client.get("/api/sync/supabase-pool")
+
+    assert isinstance(supabase, SupabaseClientImpl)
+    assert health == {"status": "ok"}
+    assert pool["requests"] == 0
+    assert pool["connections"] == 0
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_repository_list_selects_only_requested_columns():
+    selects = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        selects.append(request.url.params["select"])
+        return httpx.Response(200, json=[])
+
+    client = SupabaseClientImpl(
+        url="https://example.supabase.co", key=_KEY, transport=httpx.MockTransport(handler),
+    )
+    repo = SupabaseCourseRepository(client)
+    try:
+        await repo.list_courses(columns=("id", "title"))
+        await repo.list_courses()
+    finally:
+        client.close()
+
+    assert selects == ["id,title", "*"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_reads_past_server_row_cap_with_keyset(monkeypatch):
+    monkeypatch.setattr(supabase_paging, "_FETCH_CHUNK_SIZE", 2)
+    rows = [{"id": f"a{i}", "date": f"2026-03-0{i}"} for i in range(1, 6)]
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        seen.append(params)
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"Content-Range": "*/5"})
+        # 행의 (date, id)가 모두 증가하므로 cursor의 id 이후만 돌려주면 된다
+        after = re.search(r'id\.gt\."(\w+)"', params.get("or", ""))
+        remaining = [r for r in rows if not after or r["id"] > after[1]]
+        return httpx.Response(200, json=remaining[:int(params["limit"])])
+
+    client = SupabaseClientImpl(
+        url="https://example.supabase.co", key=_KEY, transport=httpx.MockTransport(handler),
+    )
+    try:
+        everything = await supabase_paging.fetch_all(client, "assignments", ("date", "id"))
+        page = await supabase_paging.fetch_page(client, "assignments", ("date", "id"), limit=1, count=True)
+    finally:
+        client.close()
+
+    assert [r["id"] for r in everything] == ["a1", "a2", "a3", "a4", "a5"]
+    assert seen[0]["order"] == "date.asc,id.asc"
+    assert "or" not in seen[0]
+    assert seen[1]["or"] == '(date.gt."2026-03-02",and(date.eq."2026-03-02",id.gt."a2"))'
+    assert len(seen) == 5  # fetch_all 3회 (2+2+1행) + count(HEAD) + 페이지 1회
+    assert page.total == 5
+    assert [r["id"] for r in page.items] == ["a1"]
+    assert decode_cursor(page.next_cursor, ("date", "id")) == ["2026-03-01", "a1"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_writes_are_split_into_request_sized_chunks():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            ids = request.url.params["id"].removeprefix("in.(").removesuffix(")").split(",")
+            requests.append(("DELETE", len(ids)))
+            return httpx.Response(200, json=[{"id": i} for i in ids])
+        rows = json.loads(request.content)
+        requests.append((request.method, len(rows)))
+        return httpx.Response(201, json=rows)
+
+    client = SupabaseClientImpl(
+        url="https://example.supabase.co", key=_KEY, transport=httpx.MockTransport(handler),
+    )
+    repo = SupabaseAssignmentRepository(client)
+    try:
+        deleted = await repo.delete_assignments_bulk([f"a{i}" for i in range(450)])
+        inserted = await repo.insert_assignments_bulk([{"instructor_id": "i", "date": str(i)} for i in range(600)])
+    finally:
+        client.close()
+
+    assert deleted == 450 and len(inserted) == 600
+    assert requests == [("DELETE", 200), ("DELETE", 200), ("DELETE", 50), ("POST", 500), ("POST", 100)]
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from config import settings
+from dependencies import get_notion_client, get_sync_job_manager
+from exceptions import SyncJobConflictError
+from services.sync_job_service import SyncJob, SyncJobManager
+from services.sync_scheduler import SyncScheduler
+from tests.fakes.fake_notion_client import FakeNotionClient
+
+
+@pytest.mark.asyncio
+async def test_concurrent_start_attaches_to_running_job():
+    release = asyncio.Event()
+    runs = []
+
+    async def runner(progress):
+        runs.append(1)
+        progress("tutors", {"tutors": 3})
+        await release.wait()
+        return {"tutors": 3}
+
+    manager = SyncJobManager()
+    first, created = manager.start("tutors", False, runner)
+    await asyncio.sleep(0)
+    second, attached_created = manager.start("tutors", False, runner)
+
+    assert created and not attached_created
+    assert second is first
+    # 다른 종류(kind/full)는 실행 중인 작업에 합쳐지지 않는다
+    with pytest.raises(SyncJobConflictError):
+        manager.start("courses", False, runner)
+    with pytest.raises(SyncJobConflictError):
+        manager.start("tutors", True, runner)
+    assert first.status == "running"
+    assert first.phase == "tutors" and first.progress == {"tutors": 3}
+
+    release.set()
+    job = await manager.wait(first.id)
+
+    assert runs == [1]
+    assert job.status == "succeeded"
+    assert job.result == {"tutors": 3}
+    assert "tutors" in job.phase_seconds
+    assert manager.current is None
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_error_and_releases_lock():
+    async def broken(progress):
+        raise RuntimeError("notion 502")
+
+    async def ok(progress):
+        return {}
+
+    manager = SyncJobManager()
+    failed, _ = manager.start("courses", False, broken)
+    await manager.wait(failed.id)
+
+    assert failed.status == "failed"
+    assert "notion 502" in failed.error
+
+    job, created = manager.start("courses", False, ok)
+    assert created and job is not failed
+    await manager.wait(job.id)
+    assert [j.id for j in manager.list_jobs()] == [job.id, failed.id]
+
+
+def test_sync_endpoint_returns_202_and_job_can_be_polled(app):
+    notion = FakeNotionClient()
+    notion.set_schema(settings.NOTION_DB_TUTOR, {"unique_name": "title"})
+    app.dependency_overrides[get_notion_client] = lambda: notion
+
+    with TestClient(app) as client:
+        resp = client.post("/api/instructors/sync")
+        assert resp.status_code == 202
+        job_id = resp.json()["id"]
+
+        deadline = time.monotonic() + 5
+        while True:
+            job = client.get(f"/api/sync/jobs/{job_id}").json()
+            if job["status"] not in ("pending", "running") or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+
+        assert job["status"] == "succeeded"
+        assert job["kind"] == "tutors"
+        assert job["result"] == {"tutors": 0}
+        assert client.get("/api/sync/jobs/unknown").status_code == 404
+
+        [run] = client.get("/api/sync/runs").json()
+        assert run["kind"] == "tutors" and run["status"] == "succeeded"
+        assert "total" in run["phase_seconds"]
+
+
+def test_sync_summaries_are_logged_at_info_by_default():
+    # main 모듈을 불러오면(conftest) 앱 로거에 핸들러가 붙는다
+    logger = logging.getLogger("services.notion_sync_service")
+    assert logger.isEnabledFor(logging.INFO)
+    assert logging.getLogger("services").handlers
+
+
+def test_sync_endpoint_returns_409_while_other_kind_is_running(client, app):
+    class _BusyManager(SyncJobManager):
+        def start(self, kind, full, runner):
+            raise SyncJobConflictError("다른 동기화가 실행 중입니다")
+
+    app.dependency_overrides[get_sync_job_manager] = lambda: _BusyManager()
+    app.dependency_overrides[get_notion_client] = lambda: FakeNotionClient()
+
+    resp = client.post("/api/courses/sync?full=true")
+
+    assert resp.status_code == 409
+    assert "실행 중" in resp.json()["detail"]
+
+
+class _StubSyncService:
+    def __init__(self, outcomes: list):
+        self._outcomes = outcomes
+
+    async def sync_all(self, full=False, progress=None):
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _scheduler(manager, outcomes, **kwargs) -> SyncScheduler:
+    service = _StubSyncService(outcomes)
+    kwargs.setdefault("uniform", lambda a, b: 0.0)
+    return SyncScheduler(manager, lambda: service, 60, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_backs_off_after_failures_and_resets_on_success():
+    manager = SyncJobManager()
+    scheduler = _scheduler(manager, [RuntimeError("x"), RuntimeError("y"), {}], max_backoff=200)
+
+    assert scheduler.next_delay() == 60
+    assert await scheduler.tick() == "failed"
+    assert scheduler.next_delay() == 120
+    assert await scheduler.tick() == "failed"
+    assert scheduler.next_delay() == 200
+    assert await scheduler.tick() == "succeeded"
+    assert scheduler.next_delay() == 60
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_tick_while_sync_is_running():
+    manager = SyncJobManager()
+    release = asyncio.Event()
+
+    async def manual(progress):
+        await release.wait()
+        return {}
+
+    manager.start("courses", False, manual)
+    scheduler = _scheduler(manager, [])
+
+    assert await scheduler.tick() == "skipped"
+    release.set()
+
+
+def test_scheduler_delay_applies_jitter():
+    scheduler = _scheduler(SyncJobManager(), [], jitter=10, uniform=lambda a, b: b)
+    assert scheduler.next_delay() == 70
+
+
+def test_course_sync_runs_as_job_and_conflicts_with_running_sync(client, app):
+    notion = FakeNotionClient()
+    app.dependency_overrides[get_notion_client] = lambda: notion
+    manager = SyncJobManager()
+    app.dependency_overrides[get_sync_job_manager] = lambda: manager
+
+    # 단건 동기화도 작업으로 기록되고, 서비스 예외(404)는 그대로 응답
+    missing = client.post("/api/courses/missing/sync")
+    assert missing.status_code == 404
+    [job] = manager.list_jobs()
+    assert job.kind == "course:missing" and job.status == "failed"
+
+    # 예약 동기화가 실행 중인 상태
+    manager._current = SyncJob(id="busy", kind="scheduled", full=False, status="running")
+    assert client.post("/api/courses/missing/sync").status_code == 409
+
+
+def _wait_job(client, job_id: str) -> dict:
+    deadline = time.monotonic() + 5
+    while True:
+        job = client.get(f"/api/sync/jobs/{job_id}").json()
+        if job["status"] not in ("pending", "running") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+def _schedule(page_id: str, date: str) -> dict:
+    return {
+        "id": page_id,
+        "properties": {
+            "date": {"type": "date", "date": {"start": date}},
+            "lecture_dashboard": {"type": "relation", "relation": [{"id": "l1"}]},
+            "main_tutor": {"type": "relation", "relation": [{"id": "t1"}]},
+        },
+    }
+
+
+def test_sync_responses_report_deleted_rows(app, monkeypatch):
+    for name, db in (("TUTOR", "db-tutor"), ("LECTURE", "db-lecture"), ("SCHEDULE", "db-schedule")):
+        monkeypatch.setattr(settings, f"NOTION_DB_{name}", db)
+    notion = FakeNotionClient()
+    notion.add_page("db-tutor", {"id": "t1", "properties": {
+        "unique_name": {"type": "title", "title": [{"plain_text": "김강사"}]},
+    }})
+    lecture = notion.add_page("db-lecture", {"id": "l1", "properties": {
+        "lecture_dashboard": {"type": "title", "title": [{"plain_text": "AI 교육"}]},
+        "lecture_state": {"type": "status", "status": {"name": "lecture_ready"}},
+        "lecture_schedules": {"type": "relation", "relation": [{"id": "s1"}, {"id": "s2"}, {"id": "s3"}]},
+    }})
+    for page_id, date in (("s1", "2026-03-02"), ("s2", "2026-03-03"), ("s3", "2026-03-04")):
+        notion.add_page("db-schedule", _schedule(page_id, date))
+    app.dependency_overrides[get_notion_client] = lambda: notion
+
+    with TestClient(app) as client:
+        assert _wait_job(client, client.post("/api/instructors/sync").json()["id"])["status"] == "succeeded"
+        assert _wait_job(client, client.post("/api/courses/sync?full=true").json()["id"])["status"] == "succeeded"
+
+        # full 동기화 작업 결과에 삭제 건수가 담긴다
+        notion._databases["db-schedule"].pop()
+        job = _wait_job(client, client.post("/api/courses/sync?full=true").json()["id"])
+        assert (job["result"]["schedules_deleted"], job["result"]["assignments_deleted"]) == (1, 1)
+
+        # 강의 단건 동기화 응답에도 담긴다
+        notion._databases["db-schedule"].pop()
+        lecture["properties"]["lecture_schedules"]["relation"] = [{"id": "s1"}]
+        [course] = client.get("/api/courses").json()
+        resp = client.post(f"/api/courses/{course['id']}/sync")
+
+    assert resp.status_code == 200
+    assert (resp.json()["schedules_deleted"], resp.json()["assignments_deleted"]) == (1, 1)
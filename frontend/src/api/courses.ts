@@ -1,5 +1,6 @@
 import type { Course, CourseDate } from '../types'
 import { fetchWithAuth, handleResponse } from './client'
+import { runSyncJob } from './sync'
 
 export interface CourseDetail extends Course {
   dates: CourseDate[]
@@ -9,6 +10,11 @@ export interface CourseSyncResult {
   courses: number
   schedules: number
   assignments: number
+  schedules_updated?: number
+  schedules_skipped?: number
+  assignments_skipped?: number
+  schedules_deleted?: number
+  assignments_deleted?: number
 }
 
 export async function listCourses(): Promise<Course[]> {
@@ -22,6 +28,5 @@ export async function getCourse(id: string): Promise<CourseDetail> {
 }
 
 export async function syncCourses(): Promise<CourseSyncResult> {
-  const res = await fetchWithAuth('/api/courses/sync', { method: 'POST' })
-  return handleResponse<CourseSyncResult>(res)
+  return runSyncJob<CourseSyncResult>('/api/courses/sync')
 }
@@ -1,13 +1,13 @@
 import type { Instructor } from '../types'
 import { fetchWithAuth, handleResponse } from './client'
+import { runSyncJob } from './sync'
 
 export interface InstructorSyncResult {
   tutors: number
 }
 
 export async function syncInstructors(): Promise<InstructorSyncResult> {
-  const res = await fetchWithAuth('/api/instructors/sync', { method: 'POST' })
-  return handleResponse<InstructorSyncResult>(res)
+  return runSyncJob<InstructorSyncResult>('/api/instructors/sync')
 }
 
 export async function listInstructors(isActive?: boolean): Promise<Instructor[]> {
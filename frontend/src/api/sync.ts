@@ -0,0 +1,40 @@
+import { fetchWithAuth, handleResponse } from './client'
+
+export interface SyncJob<T = Record<string, number>> {
+  id: string
+  kind: string
+  full: boolean
+  status: 'pending' | 'running' | 'succeeded' | 'failed'
+  phase: string | null
+  progress: Record<string, number>
+  phase_seconds: Record<string, number>
+  result: T | null
+  error: string | null
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+  attached: boolean
+}
+
+const POLL_INTERVAL_MS = 1500
+
+export async function getSyncJob<T>(id: string): Promise<SyncJob<T>> {
+  const res = await fetchWithAuth(`/api/sync/jobs/${id}`)
+  return handleResponse<SyncJob<T>>(res)
+}
+
+/** 동기화 작업을 시작하고 끝날 때까지 폴링해서 결과를 돌려준다. */
+export async function runSyncJob<T>(path: string): Promise<T> {
+  const res = await fetchWithAuth(path, { method: 'POST' })
+  let job = await handleResponse<SyncJob<T>>(res)
+
+  while (job.status === 'pending' || job.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS))
+    job = await getSyncJob<T>(job.id)
+  }
+
+  if (job.status === 'failed' || job.result === null) {
+    throw new Error(job.error ?? '동기화에 실패했습니다')
+  }
+  return job.result
+}
@@ -0,0 +1,11 @@
+-- sync_state: Notion 동기화 상태 (DB별 high-water mark 등) key-value 저장소
+CREATE TABLE IF NOT EXISTS sync_state (
+    key         text PRIMARY KEY,
+    value       jsonb NOT NULL DEFAULT '{}'::jsonb,
+    updated_at  timestamptz DEFAULT now()
+);
+
+ALTER TABLE sync_state ENABLE ROW LEVEL SECURITY;
+
+CREATE TRIGGER tr_sync_state_updated_at
+    BEFORE UPDATE ON sync_state FOR EACH ROW EXECUTE FUNCTION update_updated_at();
@@ -0,0 +1,23 @@
+-- sync_runs: Notion 동기화 실행 이력 (단계별 소요 시간, 호출 수, 행 변경 건수)
+CREATE TABLE IF NOT EXISTS sync_runs (
+    id                uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    kind              text NOT NULL,
+    "full"            boolean NOT NULL DEFAULT false,
+    dry_run           boolean NOT NULL DEFAULT false,
+    status            text NOT NULL,
+    error             text,
+    started_at        timestamptz NOT NULL,
+    finished_at       timestamptz,
+    duration_seconds  double precision,
+    phase_seconds     jsonb NOT NULL DEFAULT '{}'::jsonb,
+    notion_requests   integer NOT NULL DEFAULT 0,
+    notion_pages      integer NOT NULL DEFAULT 0,
+    db_calls          integer NOT NULL DEFAULT 0,
+    rows              jsonb NOT NULL DEFAULT '{}'::jsonb,
+    errors            jsonb NOT NULL DEFAULT '[]'::jsonb,
+    created_at        timestamptz DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_runs_started_at ON sync_runs(started_at DESC);
+
+ALTER TABLE sync_runs ENABLE ROW LEVEL SECURITY;
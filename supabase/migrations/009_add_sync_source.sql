@@ -0,0 +1,10 @@
+-- course_dates / assignments: 행을 만든 주체 ('notion' = 동기화, 'manual' = 관리자 직접 입력)
+-- 동기화는 source = 'notion'인 행만 Notion에서 사라졌을 때 삭제한다 (수동 입력은 보존)
+ALTER TABLE course_dates ADD COLUMN IF NOT EXISTS source text NOT NULL DEFAULT 'manual'
+    CHECK (source IN ('manual', 'notion'));
+ALTER TABLE assignments ADD COLUMN IF NOT EXISTS source text NOT NULL DEFAULT 'manual'
+    CHECK (source IN ('manual', 'notion'));
+
+-- courses는 Notion 캐시이므로 기존 날짜는 모두 동기화로 생긴 것으로 본다.
+-- 기존 배정은 수동 배정과 구분할 수 없어 'manual'로 둔다 (날짜가 삭제되면 CASCADE로 함께 정리됨).
+UPDATE course_dates SET source = 'notion' WHERE source = 'manual';
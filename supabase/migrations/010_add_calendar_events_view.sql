@@ -0,0 +1,28 @@
+-- calendar_events: 캘린더 화면용 배정 조회 뷰 (assignments → course_dates → courses, instructors)
+-- 백엔드가 날짜 범위로 한 번만 조회하도록 CalendarEvent에 필요한 컬럼만 노출한다.
+
+-- 동기화가 채우는 컬럼이지만 마이그레이션에 없던 것 (뷰가 참조하므로 보장)
+ALTER TABLE courses ADD COLUMN IF NOT EXISTS workbook_full_url text;
+
+-- security_invoker: 조회하는 사용자 권한으로 원본 테이블 RLS를 그대로 적용
+CREATE OR REPLACE VIEW calendar_events WITH (security_invoker = true) AS
+SELECT
+    a.id                        AS assignment_id,
+    a.date,
+    a.instructor_id,
+    COALESCE(i.name, '')        AS instructor_name,
+    a.class_name,
+    cd.course_id,
+    COALESCE(c.title, '')       AS course_title,
+    c.status                    AS course_status,
+    c.assignment_status,
+    COALESCE(c.notion_page_id, '') AS notion_page_id,
+    c.workbook_full_url,
+    c.manager,
+    c.manager_email,
+    c.sales_rep,
+    c.sales_rep_email
+FROM assignments a
+JOIN course_dates cd ON cd.id = a.course_date_id
+JOIN courses c ON c.id = cd.course_id
+JOIN instructors i ON i.id = a.instructor_id;
@@ -0,0 +1,16 @@
+-- 목록 API keyset 페이지네이션(정렬 키 + id)과 서버 필터용 인덱스
+
+-- assignments: (date, id) 순 정렬 + 날짜 범위. 강사 필터는 UNIQUE(instructor_id, date) 인덱스를 쓴다
+CREATE INDEX IF NOT EXISTS idx_assignments_date_id ON assignments(date, id);
+-- (date, id) 인덱스가 date 단독 조회도 처리하므로 중복 인덱스 제거
+DROP INDEX IF EXISTS idx_assignments_date;
+
+-- course_dates: 전체 조회를 (date, id) 순으로 나눠 읽음
+CREATE INDEX IF NOT EXISTS idx_course_dates_date_id ON course_dates(date, id);
+
+-- courses: 상태 필터 + id 순
+CREATE INDEX IF NOT EXISTS idx_courses_status_id ON courses(status, id);
+CREATE INDEX IF NOT EXISTS idx_courses_assignment_status_id ON courses(assignment_status, id);
+
+-- instructors: 활성 여부 필터 + id 순
+CREATE INDEX IF NOT EXISTS idx_instructors_is_active_id ON instructors(is_active, id);